@@ -1,14 +1,32 @@
+from typing import Any
+
 from ascender import core, common, contrib
+from ascender._lazy import lazy_exports
 
-try:
-    from importlib.metadata import version, PackageNotFoundError
-except ImportError:
-    from importlib_metadata import version, PackageNotFoundError  # type: ignore # For older Pythons
+__all__ = core.__all__ + common.__all__ + contrib.__all__
 
-try:
-    __version__ = version("ascender-framework")
-except PackageNotFoundError:
-    __version__ = "Unknown"
+# Subpackages resolve their names on first access, see `ascender._lazy`
+_getattr, __dir__ = lazy_exports(__name__, globals(), {
+    **{name: ".contrib" for name in contrib.__all__},
+    **{name: ".common" for name in common.__all__},
+    **{name: ".core" for name in core.__all__},
+})
 
-__all__ = core.__all__ + common.__all__ + contrib.__all__
 
+def __getattr__(name: str) -> Any:
+    if name != "__version__":
+        return _getattr(name)
+
+    # Reading package metadata scans installed distributions, done only when asked for
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        from importlib_metadata import version, PackageNotFoundError  # type: ignore # For older Pythons
+
+    global __version__
+    try:
+        __version__ = version("ascender-framework")
+    except PackageNotFoundError:
+        __version__ = "Unknown"
+
+    return __version__
@@ -0,0 +1,37 @@
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str,
+    namespace: dict[str, Any],
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Builds PEP 562 `__getattr__` and `__dir__` of a package which imports its public names on first access.
+
+    Args:
+        package (str): Name of the package (`__name__`).
+        namespace (dict[str, Any]): Globals of the package, resolved names are cached there
+            so `__getattr__` runs once per name.
+        exports (dict[str, str]): Public name to the module (relative to the package) defining it.
+            Submodules map to themselves, e.g. `{"cli_engine": ".cli_engine"}`.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: `__getattr__` and `__dir__` of the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        module = import_module(module_name, package)
+        value = module if module.__name__ == f"{package}.{name}" else getattr(module, name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
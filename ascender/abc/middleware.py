@@ -7,6 +7,17 @@ class AscenderMiddleware(ABC):
     
     def __init__(self):
         ...
+
+    def bind(self, app: ASGIApp) -> "AscenderMiddleware":
+        """
+        Binds middleware to the next application of the middleware stack, once when the stack is built.
+        Middlewares wrapping other middlewares construct them here instead of on every call.
+
+        Args:
+            app (ASGIApp): Next ASGI application of the stack
+        """
+        self.app = app
+        return self
     
     @abstractmethod
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> ASGIApp | None:
@@ -1,9 +1,22 @@
-from .base.dto import BaseDTO
-from .base.response import BaseResponse
+from typing import TYPE_CHECKING
 
-from .serializer import Serializer
-from .injectable import Injectable
-from .api_docs import DefineAPIDocs
+from ascender._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base.dto import BaseDTO
+    from .base.response import BaseResponse
+
+    from .serializer import Serializer
+    from .injectable import Injectable
+    from .api_docs import DefineAPIDocs
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    "BaseDTO": ".base.dto",
+    "BaseResponse": ".base.response",
+    "Serializer": ".serializer",
+    "Injectable": ".injectable",
+    "DefineAPIDocs": ".api_docs",
+})
 
 __all__ = [
     "BaseDTO", 
@@ -11,4 +24,4 @@ __all__ = [
     "Serializer",
     "Injectable",
     "DefineAPIDocs"
-]
\ No newline at end of file
+]
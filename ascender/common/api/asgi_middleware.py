@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Message, Receive, Scope, Send
+
+from ascender.abc.middleware import AscenderMiddleware
+
+
+@dataclass(slots=True)
+class ResponseHead:
+    """
+    Status and headers of a response, before they are sent. Changes made in `on_response` are sent to the client.
+    """
+    status_code: int
+    headers: MutableHeaders
+
+
+class AscenderASGIMiddleware(AscenderMiddleware):
+    """
+    Pure ASGI alternative of `AscenderHTTPMiddleware` with request and response hooks.
+
+    Bodies are never buffered, requests and streaming responses pass through chunk by chunk,
+    and no task group is created per request. Non HTTP scopes (websockets, lifespan) are passed as is.
+    """
+
+    async def on_request(self, request: Request) -> Response | None:
+        """
+        Called before the request is handled.
+
+        Args:
+            request (Request): Incoming request, reading its body here consumes it for the application
+
+        Returns:
+            Response | None: Response to send instead of handling the request, `None` to continue
+        """
+        return None
+
+    async def on_response(self, request: Request, response: ResponseHead) -> None:
+        """
+        Called right before the response starts, after the application produced its status and headers.
+
+        Args:
+            request (Request): Handled request
+            response (ResponseHead): Status and headers of the response, can be modified
+        """
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        response = await self.on_request(request)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                head = ResponseHead(message["status"], MutableHeaders(scope=message))
+                await self.on_response(request, head)
+                message["status"] = head.status_code
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,4 +1,5 @@
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint, Request, Response
+from starlette.types import ASGIApp
 
 from ascender.abc.middleware import AscenderMiddleware
 
@@ -8,5 +9,10 @@ class AscenderHTTPMiddleware(AscenderMiddleware):
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         return NotImplementedError() # pragma: no cover
     
+    def bind(self, app: ASGIApp) -> "AscenderHTTPMiddleware":
+        super().bind(app)
+        self.__middleware = BaseHTTPMiddleware(app, self.dispatch)
+        return self
+    
     async def __call__(self, scope, receive, send):
-        return await BaseHTTPMiddleware(self.app, self.dispatch)(scope, receive, send)
\ No newline at end of file
+        return await self.__middleware(scope, receive, send)
@@ -1,4 +1,5 @@
 from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
 from ascender.abc.middleware import AscenderMiddleware
 
 import typing
@@ -26,5 +27,10 @@ class AscenderCORSMiddleware(AscenderMiddleware):
             "max_age": max_age
         }
     
+    def bind(self, app: ASGIApp) -> AscenderMiddleware:
+        super().bind(app)
+        self.__middleware = self.middleware_instance(app, **self.middleware_params)
+        return self
+    
     async def __call__(self, scope, receive, send):
-        return await self.middleware_instance(self.app, **self.middleware_params)(scope, receive, send)
\ No newline at end of file
+        return await self.__middleware(scope, receive, send)
\ No newline at end of file
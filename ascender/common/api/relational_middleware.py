@@ -1,4 +1,6 @@
 from typing import Any
+from starlette.types import ASGIApp
+
 from ascender.abc.middleware import AscenderMiddleware
 
 
@@ -7,5 +9,10 @@ class FromFastAPIMiddleware(AscenderMiddleware):
         self.middleware_instance = middleware
         self.middleware_arguments = middleware_arguments
     
+    def bind(self, app: ASGIApp) -> AscenderMiddleware:
+        super().bind(app)
+        self.__middleware = self.middleware_instance(app, **self.middleware_arguments)
+        return self
+    
     async def __call__(self, scope, receive, send):
-        return await self.middleware_instance(self.app, **self.middleware_arguments)(scope, receive, send)
\ No newline at end of file
+        return await self.__middleware(scope, receive, send)
\ No newline at end of file
@@ -3,6 +3,11 @@ from .types.formdata import FormData
 from .client import HTTPClient
 from .provider import provideHTTPClient
 from .types.http_options import HTTPOptions, HeaderTypes
+from .types.cache import HTTPCacheOptions
+from .types.batch import BatchRequest
+from .types.resilience import CircuitBreakerOptions, HedgingOptions, RetryOptions
+from .resilience import CircuitOpenError
+from .streaming import ServerSentEvent, StreamFormat
 from .awaitables.awaitable import _await
 from .types.interceptors import Interceptor, InterceptorFn, InterceptorIn
 
@@ -11,6 +16,14 @@ __all__ = [
     "provideHTTPClient",
     "HTTPOptions",
     "HeaderTypes",
+    "HTTPCacheOptions",
+    "BatchRequest",
+    "RetryOptions",
+    "CircuitBreakerOptions",
+    "HedgingOptions",
+    "CircuitOpenError",
+    "ServerSentEvent",
+    "StreamFormat",
     "_await",
     "Interceptor",
     "InterceptorFn",
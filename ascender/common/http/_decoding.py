@@ -0,0 +1,53 @@
+from typing import Any, Callable
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from ascender.common.type_adapter import get_type_adapter
+
+
+# Response hints (types or their instances) describing only the shape of the body, they aren't validated
+PLAIN_TYPES = (dict, list, str, int, float, bool)
+
+
+def is_json_content_type(content_type: str | None) -> bool:
+    """
+    Whether `Content-Type` header describes JSON, including parameters (`; charset=utf-8`) and `+json` suffixes.
+    """
+    if not content_type:
+        return False
+
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+def loads_json(content: bytes | str) -> Any:
+    """
+    Parses JSON directly from the response body without decoding it to `str` first.
+
+    Raises:
+        ValueError: If content is not a valid JSON.
+    """
+    return from_json(content)
+
+
+def get_decoder(_resp: Any) -> Callable[[bytes | str], Any] | None:
+    """
+    Returns validator parsing JSON body straight into the `_resp` type.
+
+    Pydantic models use their own `model_validate_json`, any other type (`list[Model]`, `dict[str, Model]`, unions...)
+    uses a cached `TypeAdapter`, so the body is parsed only once and the validator schema is built only once per type.
+
+    Returns:
+        Callable[[bytes | str], Any] | None: Validator, `None` for plain types which aren't validated.
+    """
+    if isinstance(_resp, BaseModel):
+        return type(_resp).model_validate_json
+
+    if isinstance(_resp, type) and issubclass(_resp, BaseModel):
+        return _resp.model_validate_json
+
+    if _resp is Any or isinstance(_resp, PLAIN_TYPES) or (isinstance(_resp, type) and _resp in PLAIN_TYPES):
+        return None
+
+    return get_type_adapter(_resp).validate_json
@@ -1,3 +1,4 @@
+from collections import Counter
 from inspect import isclass
 import ssl
 from typing import Any, cast
@@ -7,7 +8,11 @@ from httpx._config import Limits, DEFAULT_LIMITS
 
 from ascender.core.applications.root_injector import RootInjector
 
-from .types.interceptors import Interceptor, InterceptorFn
+from .cache import CachingTransport, ResponseCache
+from .resilience import CircuitBreakerTransport, HedgingTransport, RetryTransport
+from .types.cache import HTTPCacheOptions
+from .types.resilience import CircuitBreakerOptions, HedgingOptions, RetryOptions
+from .types.interceptors import Interceptor, InterceptorFn, ResponseInterceptorFn
 
 
 class AscHTTPTransport(AsyncBaseTransport):
@@ -25,18 +30,57 @@ class AscHTTPTransport(AsyncBaseTransport):
         local_address: str | None = None,
         retries: int = 0,
         socket_options: Any | None = None,
+        cache: HTTPCacheOptions | bool | None = None,
+        retry: RetryOptions | bool | None = None,
+        circuit_breaker: CircuitBreakerOptions | bool | None = None,
+        hedging: HedgingOptions | bool | None = None,
     ) -> None:
         super().__init__()
         self.interceptors = interceptors
-        self.transport = AsyncHTTPTransport(verify=verify, cert=cert, trust_env=trust_env,
+        self.transport: AsyncBaseTransport = AsyncHTTPTransport(verify=verify, cert=cert, trust_env=trust_env,
                                             http1=http1, http2=http2, limits=limits,
                                             proxy=proxy, uds=uds, local_address=local_address,
                                             retries=retries, socket_options=socket_options)
 
+        # Policies wrap the network transport from the inside out, so every hedged copy is a single outcome
+        # for the circuit breaker, and requests rejected by an open circuit are not retried.
+        self.hedging: HedgingTransport | None = None
+        if hedging:
+            self.transport = self.hedging = HedgingTransport(self.transport, **({} if hedging is True else hedging))
+
+        self.circuit_breaker: CircuitBreakerTransport | None = None
+        if circuit_breaker:
+            self.transport = self.circuit_breaker = CircuitBreakerTransport(
+                self.transport, **({} if circuit_breaker is True else circuit_breaker))
+
+        self.retry: RetryTransport | None = None
+        if retry:
+            self.transport = self.retry = RetryTransport(self.transport, **({} if retry is True else retry))
+
+        # Cache sits behind interceptors, so requests are cached as modified by them
+        self.cache: ResponseCache | None = None
+        if cache:
+            self.cache = ResponseCache(**({} if cache is True else cache))
+            self.transport = CachingTransport(self.transport, self.cache)
+
         self._fn_interceptors: list[InterceptorFn] = []
+        self._chain: tuple[list[InterceptorFn], list[ResponseInterceptorFn]] | None = None
+        self._chain_key: tuple[Any, int] | None = None
 
         self.load_interceptors()
 
+    @property
+    def counters(self) -> Counter[str]:
+        """
+        Counters of enabled resilience policies, e.g. `retry.retries`, `circuit.rejected` or `hedge.won`.
+        """
+        counters: Counter[str] = Counter()
+        for policy in (self.retry, self.circuit_breaker, self.hedging):
+            if policy is not None:
+                counters.update(policy.counters)
+
+        return counters
+
     def load_interceptors(self):
         for interceptor in self.interceptors:
             if isclass(interceptor):
@@ -53,30 +97,44 @@ class AscHTTPTransport(AsyncBaseTransport):
 
             self._fn_interceptors.append(interceptor)
 
-    async def handle_async_request(self, request: Request) -> Response:
-        # Request modification
-        modified_request = request
-        # Handle class interceptors based on dependency injection
-        class_interceptors: list[Interceptor] | Interceptor = RootInjector().get(
-            "HTTP_INTERCEPTOR", not_found_value=[], options={"optional": True}) # type: ignore
+    def compile_interceptors(self) -> tuple[list[InterceptorFn], list[ResponseInterceptorFn]]:
+        """Resolve class interceptors and build the ordered interceptor chain.
 
-        modified_request = await self.request_class_interceptors(modified_request, class_interceptors)
+        Class interceptors registered by this transport run first in the order of `HTTP_INTERCEPTOR` providers,
+        followed by function interceptors. Response handlers that aren't overridden are left out.
 
-        # Handle function interceptors on they own
-        for interceptor_fn in self._fn_interceptors:
-            # type: ignore
-            modified_request = await interceptor_fn(modified_request)
+        The chain is cached and rebuilt only when the root injector or its `HTTP_INTERCEPTOR` providers change.
 
-        response = await self.transport.handle_async_request(modified_request)
-
-        # Intercept response and possibly modify it if needed
-        response = await self.response_class_interceptors(response, class_interceptors)
+        Returns:
+            tuple[list[InterceptorFn], list[ResponseInterceptorFn]]: Request and response handlers.
+        """
+        injector = RootInjector().existing_injector
+        instances = self._own_interceptors(injector.get(
+            "HTTP_INTERCEPTOR", not_found_value=[], options={"optional": True}))  # type: ignore
+
+        request_handlers: list[InterceptorFn] = [interceptor.handle_request for interceptor in instances]
+        request_handlers.extend(self._fn_interceptors)
+        response_handlers: list[ResponseInterceptorFn] = [
+            interceptor.handle_response for interceptor in instances
+            if type(interceptor).handle_response is not Interceptor.handle_response
+        ]
+
+        self._chain = (request_handlers, response_handlers)
+        self._chain_key = (injector, injector.generation)
+        return self._chain
+
+    def _own_interceptors(self, class_interceptors: list[Interceptor] | Interceptor) -> list[Interceptor]:
+        # Usually, injector returns instance itself if there's only one multi value provider.
+        if not isinstance(class_interceptors, list):
+            class_interceptors = [class_interceptors]
 
-        return response
+        return [interceptor for interceptor in class_interceptors if type(interceptor) in self.interceptors]
 
     async def request_class_interceptors(self, request: Request, class_interceptors: list[Interceptor] | Interceptor):
         """Handle class interceptors and invoke their `handle_request` methods.
 
+        Kept for compatibility, requests sent through the transport use the compiled chain (see `compile_interceptors`).
+
         Args:
             request (Request): The outgoing HTTP request to process.
             class_interceptors (list[Interceptor] | Interceptor): Interceptor instance(s) returned by the injector.
@@ -84,24 +142,16 @@ class AscHTTPTransport(AsyncBaseTransport):
         Returns:
             Request: The potentially modified request after applicable interceptors have run.
         """
+        for interceptor in self._own_interceptors(class_interceptors):
+            request = await interceptor.handle_request(request)
 
-        # Usually, injector returns instance itself if there's only one multi value provider.
-        if not isinstance(class_interceptors, list):
-            if type(class_interceptors) in self.interceptors:
-                request = await class_interceptors.handle_request(request)
-
-        else:
-            for interceptor in class_interceptors:
-                if type(interceptor) not in self.interceptors:
-                    continue
-
-                request = await interceptor.handle_request(request)
-        
         return request
-    
+
     async def response_class_interceptors(self, response: Response, class_interceptors: list[Interceptor] | Interceptor):
         """Handle class interceptors and invoke their `handle_response` methods.
 
+        Kept for compatibility, responses received through the transport use the compiled chain (see `compile_interceptors`).
+
         Args:
             response (Response): The HTTP response to process.
             class_interceptors (list[Interceptor] | Interceptor): Interceptor instance(s) returned by the injector.
@@ -109,19 +159,27 @@ class AscHTTPTransport(AsyncBaseTransport):
         Returns:
             Response: The potentially modified response after applicable interceptors have run.
         """
+        for interceptor in self._own_interceptors(class_interceptors):
+            response = await interceptor.handle_response(response)
 
-        # Usually, injector returns instance itself if there's only one multi value provider.
-        if not isinstance(class_interceptors, list):
-            if type(class_interceptors) in self.interceptors:
-                response = await class_interceptors.handle_response(response)
+        return response
 
+    async def handle_async_request(self, request: Request) -> Response:
+        injector = RootInjector().existing_injector
+        if self._chain is not None and self._chain_key == (injector, injector.generation):
+            request_handlers, response_handlers = self._chain
         else:
-            for interceptor in class_interceptors:
-                if type(interceptor) not in self.interceptors:
-                    continue
+            request_handlers, response_handlers = self.compile_interceptors()
+
+        for handle_request in request_handlers:
+            request = await handle_request(request)
+
+        response = await self.transport.handle_async_request(request)
+
+        # Intercept response and possibly modify it if needed
+        for handle_response in response_handlers:
+            response = await handle_response(response)
 
-                response = await interceptor.handle_response(response)
-        
         return response
 
     async def aclose(self) -> None:
@@ -0,0 +1,325 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, cast
+
+from httpx import AsyncBaseTransport, AsyncByteStream, ByteStream, Headers, Request, Response
+
+
+CacheKey = tuple[str, str, tuple[str | None, ...]]
+
+# Status codes cacheable by default (RFC 9110, section 15.1)
+CACHEABLE_STATUS_CODES = frozenset({200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501})
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+CONDITIONAL_HEADERS = frozenset({"if-none-match", "if-modified-since", "if-match", "if-unmodified-since", "if-range"})
+
+# Response directives allowing a shared cache to reuse responses to requests with `Authorization` (RFC 9111, section 3.5)
+AUTHORIZED_REUSE_DIRECTIVES = frozenset({"public", "s-maxage", "must-revalidate"})
+
+# Headers of the stored response which aren't replaced by headers of `304 Not Modified`
+_STORED_HEADERS = frozenset({b"content-length", b"content-encoding", b"transfer-encoding"})
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """Parses `Cache-Control` header into a mapping of lowercased directives to their arguments."""
+    directives: dict[str, str | None] = {}
+    if not value:
+        return directives
+
+    for directive in value.split(","):
+        name, _, argument = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+
+    return directives
+
+
+def parse_http_date(value: str | None) -> float | None:
+    try:
+        return parsedate_to_datetime(value).timestamp()  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    key: CacheKey
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    content: bytes
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    authorized_reuse: bool = False
+    """Whether the response can be served to requests with `Authorization`"""
+
+    @property
+    def size(self) -> int:
+        return len(self.content) + sum(len(name) + len(value) for name, value in self.headers)
+
+    @property
+    def revalidatable(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def to_response(self, request: Request) -> Response:
+        # Content is kept as received (possibly still compressed), so headers stay valid
+        return Response(self.status_code, headers=self.headers, stream=ByteStream(self.content), request=request)
+
+
+class ResponseCache:
+    """
+    In-memory store of HTTP responses keyed by method, URL and values of request headers listed in `Vary`.
+
+    It's a shared cache (one `HTTPClient` serves every caller), so `private` responses are never stored and
+    responses to requests with `Authorization` are stored and reused only if they are marked `public`, `s-maxage`
+    or `must-revalidate` (RFC 9111, sections 3.5 and 5.2.2.7).
+
+    Entries are evicted in least recently used order once their total size exceeds `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int | None = None,
+        default_ttl: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_bytes < 1:
+            raise ValueError("`max_bytes` must be a positive number")
+
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes or max_bytes // 8, max_bytes)
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.size = 0
+
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._vary: dict[tuple[str, str], tuple[str, ...]] = {}
+        self._keys_by_url: dict[str, set[CacheKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, request: Request) -> CacheKey:
+        url = str(request.url)
+        vary = self._vary.get((request.method, url), ())
+        return (request.method, url, tuple(request.headers.get(name) for name in vary))
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def lifetime(self, headers: Headers) -> float:
+        """
+        Freshness lifetime of the response in seconds, from `Cache-Control`, `Expires` and `Age` headers.
+        `s-maxage` takes precedence over `max-age` as it's a shared cache (RFC 9111, section 5.2.2.10).
+        """
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        if "no-cache" in directives:
+            return 0.0
+
+        max_age = directives.get("s-maxage", directives.get("max-age"))
+        if max_age is not None:
+            lifetime = float(max_age) if max_age.isdigit() else 0.0
+        elif "Expires" in headers:
+            expires_at = parse_http_date(headers["Expires"])
+            lifetime = 0.0 if expires_at is None else expires_at - (parse_http_date(headers.get("Date")) or self.clock())
+        else:
+            lifetime = self.default_ttl
+
+        age = headers.get("Age", "")
+        return max(0.0, lifetime - (int(age) if age.isdigit() else 0))
+
+    def storable(self, request: Request, response: Response) -> bool:
+        if response.status_code not in CACHEABLE_STATUS_CODES:
+            return False
+
+        headers = response.headers
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        if "no-store" in directives or "private" in directives or headers.get("Vary", "").strip() == "*":
+            return False
+
+        if "Authorization" in request.headers and AUTHORIZED_REUSE_DIRECTIVES.isdisjoint(directives):
+            return False
+
+        # Streamed responses of unknown size are passed through untouched
+        length = headers.get("Content-Length", "")
+        if not length.isdigit() or int(length) > self.max_entry_bytes:
+            return False
+
+        return "ETag" in headers or "Last-Modified" in headers or self.lifetime(headers) > 0
+
+    @staticmethod
+    def reusable(entry: CacheEntry, request: Request) -> bool:
+        """Whether `entry` can be served (or revalidated) for `request`."""
+        return entry.authorized_reuse or "Authorization" not in request.headers
+
+    def store(self, request: Request, response: Response, content: bytes) -> CacheEntry:
+        url = str(request.url)
+        vary = tuple(sorted(
+            name.strip().lower() for name in response.headers.get("Vary", "").split(",") if name.strip()
+        ))
+        if vary:
+            self._vary[(request.method, url)] = vary
+        else:
+            self._vary.pop((request.method, url), None)
+
+        entry = CacheEntry(
+            key=self.key(request),
+            status_code=response.status_code,
+            headers=list(response.headers.raw),
+            content=content,
+            expires_at=self.clock() + self.lifetime(response.headers),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            authorized_reuse=not AUTHORIZED_REUSE_DIRECTIVES.isdisjoint(parse_cache_control(response.headers.get("Cache-Control"))),
+        )
+        self.put(entry)
+        return entry
+
+    def refresh(self, entry: CacheEntry, not_modified: Response) -> CacheEntry:
+        """
+        Updates stale entry with headers of `304 Not Modified` response.
+        """
+        # Detach before changing headers, so the size it was accounted with doesn't change
+        self.remove(entry.key)
+
+        headers = Headers([(name, value) for name, value in entry.headers])
+        for name, value in not_modified.headers.raw:
+            if name.lower() not in _STORED_HEADERS:
+                headers[name.decode("latin-1")] = value.decode("latin-1")
+
+        entry.headers = list(headers.raw)
+        entry.expires_at = self.clock() + self.lifetime(headers)
+        entry.etag = headers.get("ETag")
+        entry.last_modified = headers.get("Last-Modified")
+        entry.authorized_reuse = not AUTHORIZED_REUSE_DIRECTIVES.isdisjoint(parse_cache_control(headers.get("Cache-Control")))
+        self.put(entry)
+        return entry
+
+    def put(self, entry: CacheEntry):
+        self.remove(entry.key)
+        size = entry.size
+        if size > self.max_entry_bytes:
+            return
+
+        self._entries[entry.key] = entry
+        self._keys_by_url.setdefault(entry.key[1], set()).add(entry.key)
+        self.size += size
+
+        while self.size > self.max_bytes:
+            self.remove(next(iter(self._entries)))
+
+    def remove(self, key: CacheKey):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        self.size -= entry.size
+        keys = self._keys_by_url.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_url[key[1]]
+
+    def invalidate_url(self, url: str):
+        """Drops every cached response of the URL, e.g. after it was modified."""
+        for key in list(self._keys_by_url.get(url, ())):
+            self.remove(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._vary.clear()
+        self._keys_by_url.clear()
+        self.size = 0
+
+
+class CachingTransport(AsyncBaseTransport):
+    """
+    Serves `GET` and `HEAD` requests from `ResponseCache` while entries are fresh.
+
+    Stale entries are revalidated with `If-None-Match` / `If-Modified-Since`, concurrent identical requests
+    share a single upstream request, successful requests with other methods invalidate cached responses of their URL.
+    Requests with `Cache-Control: no-store` or their own conditional headers bypass the cache, requests with
+    `Authorization` only get responses allowed for them (see `ResponseCache`).
+    """
+
+    def __init__(self, transport: AsyncBaseTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+        self._inflight: dict[CacheKey, asyncio.Future[CacheEntry | None]] = {}
+
+    async def handle_async_request(self, request: Request) -> Response:
+        if request.method not in CACHEABLE_METHODS:
+            response = await self.transport.handle_async_request(request)
+            if response.status_code < 400:
+                self.cache.invalidate_url(str(request.url))
+            return response
+
+        directives = parse_cache_control(request.headers.get("Cache-Control"))
+        if "no-store" in directives or not CONDITIONAL_HEADERS.isdisjoint(request.headers.keys()):
+            return await self.transport.handle_async_request(request)
+
+        key = self.cache.key(request)
+        entry = self.cache.get(key)
+        if entry is not None and not self.cache.reusable(entry, request):
+            entry = None
+
+        if entry is not None and "no-cache" not in directives and entry.expires_at > self.cache.clock():
+            return entry.to_response(request)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            shared = await asyncio.shield(inflight)
+            # Key is recomputed, `Vary` of the shared response may select other request headers
+            if shared is not None and self.cache.reusable(shared, request) and self.cache.key(request) == shared.key:
+                return shared.to_response(request)
+
+            return await self.transport.handle_async_request(request)
+
+        future: asyncio.Future[CacheEntry | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        shared = None
+        try:
+            response, shared = await self.fetch(request, entry)
+            return response
+        finally:
+            del self._inflight[key]
+            future.set_result(shared)
+
+    async def fetch(self, request: Request, entry: CacheEntry | None) -> tuple[Response, CacheEntry | None]:
+        """
+        Sends request upstream (conditionally if there's a stale entry) and stores the response if it's cacheable.
+        """
+        if entry is not None and entry.revalidatable:
+            if entry.etag is not None:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = await self.transport.handle_async_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            entry = self.cache.refresh(entry, response)
+            return entry.to_response(request), entry
+
+        if not self.cache.storable(request, response):
+            return response, None
+
+        try:
+            # Raw stream keeps content as received, already read responses (e.g. mocked ones) are re-iterable
+            content = b"".join([chunk async for chunk in cast(AsyncByteStream, response.stream)])
+        finally:
+            await response.aclose()
+
+        entry = self.cache.store(request, response, content)
+        return entry.to_response(request), entry
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
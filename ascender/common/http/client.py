@@ -1,14 +1,19 @@
 import asyncio
-import json
+from collections import defaultdict
 from contextlib import _AsyncGeneratorContextManager
-from typing import Any, Literal, TypeVar, cast, overload
+from dataclasses import replace
+from typing import Any, AsyncIterator, Callable, Coroutine, Literal, Sequence, TypeVar, cast, overload
 from httpx import AsyncClient, Response
 from pydantic import BaseModel
-from reactivex import create, Observer, abc, Observable
+from reactivex import create, Observer, Observable
+from reactivex.disposable import Disposable
 
 from ascender.common.http.types.formdata import FormData
 
+from ._decoding import PLAIN_TYPES, get_decoder, is_json_content_type, loads_json
 from ._transport import AscHTTPTransport
+from .streaming import ServerSentEvent, StreamFormat, get_stream_decoder
+from .types.batch import BatchRequest
 from .types.http_options import HTTPOptions
 
 T = TypeVar("T")
@@ -26,6 +31,7 @@ class HTTPClient:
             transport=transport,
             **client_configs
         )
+        self._stream_tasks: set[asyncio.Task[None]] = set()
 
     async def get(
         self,
@@ -176,6 +182,7 @@ class HTTPClient:
         content: Any | BaseModel | FormData | None = None,
         options: HTTPOptions | None = None,
         as_observable: Literal[True] = True,
+        format: StreamFormat = "ndjson",
     ) -> Observable[T]:
         ...
 
@@ -189,6 +196,7 @@ class HTTPClient:
         content: Any | BaseModel | FormData | None = None,
         options: HTTPOptions | None = None,
         as_observable: Literal[False],
+        format: StreamFormat = "ndjson",
     ) -> _AsyncGeneratorContextManager[Response]:
         ...
 
@@ -201,9 +209,13 @@ class HTTPClient:
         content: Any | BaseModel | FormData | None = None,
         options: HTTPOptions | None = None,
         as_observable: bool = True,
+        format: StreamFormat = "ndjson",
     ) -> Observable[T] | _AsyncGeneratorContextManager[Response]:
         """Send a streaming request to a desired endpoint.
 
+        The observable emits decoded messages of the response, see `iter_stream`. Request is sent on subscription
+        and disposing the subscription cancels it.
+
         Args:
             _resp (type[T] | T, optional): The expected response type. Defaults to dict.
             method (Literal["GET", "POST", "PUT", "DELETE", "PATCH"]): The HTTP method to use for the request.
@@ -211,6 +223,7 @@ class HTTPClient:
             content (Any | BaseModel | None, optional): The content to include in the request body (supports pydantic models). Defaults to None.
             options (HTTPOptions | None, optional): Additional options for the request. Defaults to None.
             as_observable (bool, optional): When True (default), returns an Observable; when False, returns an async context manager for manual streaming.
+            format (StreamFormat, optional): Framing of streamed messages: "ndjson" (default), "sse" or "length". Ignored for manual streaming.
 
         Returns:
             Observable[T] | _AsyncGeneratorContextManager[Response]: Stream subscription helper or the raw streaming context manager.
@@ -218,15 +231,127 @@ class HTTPClient:
         Raises:
             httpx.HTTPError: If an error occurs during the HTTP request.
         """
+        if not as_observable:
+            payload_options = {} if not options else options
+            request_payload = self.__prepare_request_body(content)
+
+            return self.client.stream(method, url, **request_payload, **cast(HTTPOptions, payload_options)) # type: ignore
+
+        return self.__observe_stream(
+            lambda: self.iter_stream(_resp, method=method, url=url, content=content, options=options, format=format)
+        )
+
+    async def iter_stream(
+        self,
+        _resp: type[T] | T = dict,
+        *,
+        method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"],
+        url: str,
+        content: Any | BaseModel | FormData | None = None,
+        options: HTTPOptions | None = None,
+        format: StreamFormat = "ndjson",
+    ) -> AsyncIterator[Any]:
+        """Send a streaming request and iterate over decoded messages of the response.
+
+        Body is split into messages as bytes arrive, regardless of how it is chunked, and every message
+        is decoded into `_resp`. Next chunk isn't read until the consumer asks for the next message,
+        closing the iterator closes the response.
+
+        Args:
+            _resp (type[T] | T, optional): The expected type of messages. Defaults to dict.
+            method (Literal["GET", "POST", "PUT", "DELETE", "PATCH"]): The HTTP method to use for the request.
+            url (str): The URL to send the request to.
+            content (Any | BaseModel | None, optional): The content to include in the request body (supports pydantic models). Defaults to None.
+            options (HTTPOptions | None, optional): Additional options for the request. Defaults to None.
+            format (StreamFormat, optional): Framing of streamed messages. Defaults to "ndjson".
+                - "ndjson": newline delimited JSON, yields `T`.
+                - "sse": Server-Sent Events, yields `ServerSentEvent[T]`.
+                - "length": messages prefixed with 4 bytes big-endian length, yields `T`.
+
+        Yields:
+            T | ServerSentEvent[T]: Decoded messages.
+
+        Raises:
+            ValueError: If `format` is unknown or a message exceeds the size limit of the decoder.
+            httpx.HTTPStatusError: If the response status is an error.
+        """
+        stream_decoder = get_stream_decoder(format)
+        decoder = get_decoder(_resp)
         payload_options = {} if not options else options
         request_payload = self.__prepare_request_body(content)
 
-        response_ctx = self.client.stream(method, url, **request_payload, **cast(HTTPOptions, payload_options)) # type: ignore
-        
-        if not as_observable:
-            return response_ctx
+        async with self.client.stream(method, url, **request_payload, **cast(HTTPOptions, payload_options)) as response: # type: ignore
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+
+            async for chunk in response.aiter_bytes():
+                for message in stream_decoder.feed(chunk):
+                    yield self.__parse_stream_message(_resp, decoder, message)
+
+            for message in stream_decoder.flush():
+                yield self.__parse_stream_message(_resp, decoder, message)
+
+    @overload
+    def batch(
+        self,
+        requests: Sequence[BatchRequest],
+        *,
+        concurrency: int = 10,
+        per_host: int | None = None,
+        return_exceptions: bool = False,
+        as_completed: Literal[False] = False,
+    ) -> Coroutine[Any, Any, list[Any]]:
+        ...
+
+    @overload
+    def batch(
+        self,
+        requests: Sequence[BatchRequest],
+        *,
+        concurrency: int = 10,
+        per_host: int | None = None,
+        return_exceptions: bool = False,
+        as_completed: Literal[True],
+    ) -> AsyncIterator[tuple[int, Any]]:
+        ...
 
-        return create(cast(abc.Subscription[T], self.__handle_streaming(_resp, response=response_ctx)))
+    def batch(
+        self,
+        requests: Sequence[BatchRequest],
+        *,
+        concurrency: int = 10,
+        per_host: int | None = None,
+        return_exceptions: bool = False,
+        as_completed: bool = False,
+    ) -> Coroutine[Any, Any, list[Any]] | AsyncIterator[tuple[int, Any]]:
+        """Send many requests concurrently with bounded concurrency.
+
+        Requests go through the same interceptors and response decoding as single requests.
+
+        Args:
+            requests (Sequence[BatchRequest]): Requests to send.
+            concurrency (int, optional): Maximum amount of requests in flight. Defaults to 10.
+            per_host (int | None, optional): Maximum amount of requests in flight to a single host. Defaults to None (no limit).
+            return_exceptions (bool, optional): When False (default), the first failed request cancels the remaining ones
+                and its exception is raised; when True, exceptions are returned in place of results.
+            as_completed (bool, optional): When False (default), returns results in order of `requests`;
+                when True, returns an async iterator of `(index, result)` pairs in order of completion.
+
+        Returns:
+            Coroutine[Any, Any, list[Any]] | AsyncIterator[tuple[int, Any]]: Results in order or as they complete.
+
+        Raises:
+            ValueError: If `concurrency` or `per_host` is not a positive number.
+            httpx.HTTPError: If a request fails and `return_exceptions` is False.
+        """
+        if concurrency < 1 or (per_host is not None and per_host < 1):
+            raise ValueError("`concurrency` and `per_host` must be positive numbers")
+
+        if as_completed:
+            return self.__batch_as_completed(requests, concurrency, per_host, return_exceptions)
+
+        return self.__batch_ordered(requests, concurrency, per_host, return_exceptions)
 
     def __prepare_request_body(
         self,
@@ -243,38 +368,112 @@ class HTTPClient:
         
         return {"json": content}
 
-    def __handle_streaming(
+    def __start_batch(
         self,
-        _resp: type[T] | T = dict,
-        *,
-        response: _AsyncGeneratorContextManager[Response]
-    ):
-        def observable_response(observer: Observer[T], _):
-            async def handle_request():
-                try:
-                    async with response as item:
-                        async for line in item.aiter_text():
-                            parsed = self.__parse_stream_chunk(_resp, line)
-                            observer.on_next(parsed)
+        requests: Sequence[BatchRequest],
+        concurrency: int,
+        per_host: int | None,
+        return_exceptions: bool,
+    ) -> list[asyncio.Task[tuple[int, Any]]]:
+        limit = asyncio.Semaphore(concurrency)
+        host_limits: defaultdict[str, asyncio.Semaphore | None] = defaultdict(
+            lambda: asyncio.Semaphore(per_host) if per_host is not None else None
+        )
+
+        async def send(index: int, request: BatchRequest) -> tuple[int, Any]:
+            host_limit = host_limits[self.client.base_url.join(request["url"]).host]
+            try:
+                if host_limit is None:
+                    async with limit:
+                        return index, await self.__send_batch_request(request)
 
-                    observer.on_completed()
+                # Host slot is taken first, so requests waiting for a busy host don't hold global slots
+                async with host_limit, limit:
+                    return index, await self.__send_batch_request(request)
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                return index, exc
+
+        return [asyncio.create_task(send(index, request)) for index, request in enumerate(requests)]
+
+    async def __batch_ordered(
+        self,
+        requests: Sequence[BatchRequest],
+        concurrency: int,
+        per_host: int | None,
+        return_exceptions: bool,
+    ) -> list[Any]:
+        tasks = self.__start_batch(requests, concurrency, per_host, return_exceptions)
+        try:
+            return [result for _, result in await asyncio.gather(*tasks)]
+        finally:
+            await self.__cancel_batch(tasks)
+
+    async def __batch_as_completed(
+        self,
+        requests: Sequence[BatchRequest],
+        concurrency: int,
+        per_host: int | None,
+        return_exceptions: bool,
+    ) -> AsyncIterator[tuple[int, Any]]:
+        tasks = self.__start_batch(requests, concurrency, per_host, return_exceptions)
+        try:
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            await self.__cancel_batch(tasks)
+
+    async def __cancel_batch(self, tasks: list[asyncio.Task[tuple[int, Any]]]):
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def __send_batch_request(self, request: BatchRequest) -> Any:
+        _resp = request.get("response", dict)
+        request_payload = self.__prepare_request_body(request.get("content"))
+        payload_options = request.get("options") or {}
+
+        response = await self.client.request(request["method"], request["url"], **request_payload, **cast(HTTPOptions, payload_options))  # type: ignore
+
+        return self.__handle_response(_resp, response=response)
+
+    def __observe_stream(self, iterate: Callable[[], AsyncIterator[Any]]) -> Observable[Any]:
+        def subscribe(observer: Observer[Any], _=None) -> Disposable:
+            async def pump():
+                try:
+                    async for message in iterate():
+                        observer.on_next(message)
                 except Exception as exc:
                     observer.on_error(exc)
+                    return
+
+                observer.on_completed()
 
-            asyncio.create_task(handle_request())
-        return observable_response
+            # Tasks are referenced until done, disposing the subscription cancels the request
+            task = asyncio.create_task(pump())
+            self._stream_tasks.add(task)
+            task.add_done_callback(self._stream_tasks.discard)
+            return Disposable(task.cancel)
 
-    def __parse_stream_chunk(self, _resp: type[T] | T, chunk: str) -> T:
-        if isinstance(_resp, BaseModel):
-            return cast(T, type(_resp).model_validate_json(chunk))
+        return create(subscribe)
 
-        if isinstance(_resp, type) and issubclass(_resp, BaseModel):
-            return cast(T, cast(type[BaseModel], _resp).model_validate_json(chunk))
+    def __parse_stream_message(self, _resp: type[T] | T, decoder: Callable[[bytes | str], Any] | None, message: bytes | ServerSentEvent[str]) -> Any:
+        if isinstance(message, ServerSentEvent):
+            return replace(message, data=self.__parse_stream_chunk(_resp, decoder, message.data))
+
+        return self.__parse_stream_chunk(_resp, decoder, message)
+
+    def __parse_stream_chunk(self, _resp: type[T] | T, decoder: Callable[[bytes | str], Any] | None, chunk: bytes | str) -> T:
+        if decoder is not None:
+            return cast(T, decoder(chunk))
 
         try:
-            data = json.loads(chunk)
-        except Exception:
-            return cast(T, chunk)
+            data = loads_json(chunk)
+        except ValueError:
+            return cast(T, chunk.decode("utf-8", "replace") if isinstance(chunk, bytes) else chunk)
 
         if isinstance(_resp, type):
             try:
@@ -292,19 +491,19 @@ class HTTPClient:
     ):
         response.raise_for_status()
 
-        if isinstance(_resp, (dict, str, int, float, list, bool)):
-            if response.headers.get("Content-Type", "") == "application/json":
-                return cast(T, response.json())
+        # Typed responses are validated straight from the body, without building intermediate objects
+        decoder = get_decoder(_resp)
+        if decoder is not None:
+            return cast(T, decoder(response.content))
+
+        if isinstance(_resp, PLAIN_TYPES):
+            if is_json_content_type(response.headers.get("Content-Type")):
+                return cast(T, loads_json(response.content))
             else:
                 return cast(T, response.text)
 
-        if issubclass(cast(type[T], _resp), BaseModel):
-            _outload = cast(BaseModel, _resp).model_validate(
-                response.json())
-            return _outload
-
         try:
-            return response.json()
+            return loads_json(response.content)
 
-        except Exception as e:
+        except ValueError:
             return cast(T, response.text)
@@ -4,6 +4,8 @@ from ascender.core.di.interface.provider import Provider
 
 from ._transport import AscHTTPTransport
 from .client import HTTPClient
+from .types.cache import HTTPCacheOptions
+from .types.resilience import CircuitBreakerOptions, HedgingOptions, RetryOptions
 from .types.interceptors import Interceptor, InterceptorFn
 from httpx._types import CertTypes
 
@@ -15,6 +17,10 @@ def provideHTTPClient(
         cert: CertTypes | None = None,
         trust_env: bool = True,
         client_instance: type[HTTPClient] = HTTPClient,
+        cache: HTTPCacheOptions | bool | None = None,
+        retry: RetryOptions | bool | None = None,
+        circuit_breaker: CircuitBreakerOptions | bool | None = None,
+        hedging: HedgingOptions | bool | None = None,
         **additional_configs
 ) -> Provider:
     """Provide a configured HTTPClient instance.
@@ -27,6 +33,14 @@ def provideHTTPClient(
         cert (CertTypes | None, optional): The SSL certificate to use. Defaults to None.
         trust_env (bool, optional): Whether to trust the system's CA certificates. Defaults to True.
         client_instance (type[HTTPClient], optional): The HTTP client class to use. Defaults to `HTTPClient`.
+        cache (HTTPCacheOptions | bool | None, optional): Enables response caching of `GET` and `HEAD` requests,
+            `True` uses default cache options. Defaults to None (disabled).
+        retry (RetryOptions | bool | None, optional): Retries idempotent requests failed with transport errors or
+            retryable status codes, `True` uses default options. Defaults to None (disabled).
+        circuit_breaker (CircuitBreakerOptions | bool | None, optional): Stops sending requests to hosts failing
+            consecutively, `True` uses default options. Defaults to None (disabled).
+        hedging (HedgingOptions | bool | None, optional): Sends a second copy of slow idempotent requests,
+            `True` uses default options. Defaults to None (disabled).
         **additional_configs: Additional keyword arguments forwarded to the HTTP client constructor.
 
     Returns:
@@ -37,7 +51,11 @@ def provideHTTPClient(
         interceptors=interceptors,
         verify=verify,
         cert=cert,
-        trust_env=trust_env
+        trust_env=trust_env,
+        cache=cache,
+        retry=retry,
+        circuit_breaker=circuit_breaker,
+        hedging=hedging
     ), **additional_configs)
     return {
         "use_factory": lambda: client,
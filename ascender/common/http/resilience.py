@@ -0,0 +1,301 @@
+import asyncio
+import random
+import time
+from bisect import bisect_left, insort
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Callable, Literal
+
+from httpx import AsyncBaseTransport, Request, RequestNotRead, Response, TransportError
+
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+
+def is_idempotent(request: Request) -> bool:
+    return request.method in IDEMPOTENT_METHODS or "Idempotency-Key" in request.headers
+
+
+def is_replayable(request: Request) -> bool:
+    """Whether request body can be sent again, streamed bodies can't."""
+    try:
+        request.content
+    except RequestNotRead:
+        return False
+
+    return True
+
+
+class CircuitOpenError(TransportError):
+    """Raised without sending a request while the circuit of its host is open."""
+
+
+class RetryTransport(AsyncBaseTransport):
+    """
+    Retries idempotent requests failed with transport errors or retryable status codes.
+
+    Delays grow exponentially with jitter, `Retry-After` of the response is honored up to `max_backoff`.
+    Requests rejected by an open circuit aren't retried.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncBaseTransport,
+        attempts: int = 3,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 5.0,
+        statuses: list[int] | None = None,
+    ):
+        if attempts < 1:
+            raise ValueError("Retry `attempts` must be a positive number")
+
+        self.transport = transport
+        self.attempts = attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses if statuses is not None else (429, 502, 503, 504))
+        self.counters: Counter[str] = Counter()
+
+    def backoff(self, attempt: int, response: Response | None = None) -> float:
+        """
+        Delay before the retry, exponential with jitter so clients don't retry all at once.
+        """
+        retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+        if retry_after.isdigit():
+            return min(self.max_backoff, float(retry_after))
+
+        delay = min(self.max_backoff, self.initial_backoff * 2 ** attempt)
+        return random.uniform(delay / 2, delay)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        if self.attempts == 1 or not is_idempotent(request) or not is_replayable(request):
+            return await self.transport.handle_async_request(request)
+
+        for attempt in range(self.attempts):
+            last_attempt = attempt == self.attempts - 1
+            try:
+                response = await self.transport.handle_async_request(request)
+            except CircuitOpenError:
+                raise
+            except TransportError:
+                if last_attempt:
+                    self.counters["retry.exhausted"] += 1
+                    raise
+
+                delay = self.backoff(attempt)
+            else:
+                if response.status_code not in self.statuses:
+                    return response
+
+                if last_attempt:
+                    self.counters["retry.exhausted"] += 1
+                    return response
+
+                delay = self.backoff(attempt, response)
+                await response.aclose()
+
+            self.counters["retry.retries"] += 1
+            await asyncio.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+@dataclass
+class Circuit:
+    state: Literal["closed", "open", "half_open"] = "closed"
+    failures: int = 0
+    opened_at: float = 0.0
+    probes: int = 0
+
+
+class CircuitBreakerTransport(AsyncBaseTransport):
+    """
+    Stops sending requests to a host after consecutive failures.
+
+    Once `reset_timeout` passes, the circuit becomes half-open and lets `half_open_requests` probes through,
+    a successful probe closes the circuit, a failed one opens it again.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncBaseTransport,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_requests: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1 or half_open_requests < 1:
+            raise ValueError("`failure_threshold` and `half_open_requests` must be positive numbers")
+
+        self.transport = transport
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_requests = half_open_requests
+        self.clock = clock
+        self.circuits: dict[str, Circuit] = {}
+        self.counters: Counter[str] = Counter()
+
+    async def handle_async_request(self, request: Request) -> Response:
+        host = request.url.host
+        circuit = self.circuits.get(host)
+        if circuit is None:
+            circuit = self.circuits[host] = Circuit()
+
+        probe = self.__admit(host, circuit)
+        try:
+            response = await self.transport.handle_async_request(request)
+        except TransportError:
+            self.__record(circuit, probe, success=False)
+            raise
+        except BaseException:
+            # Cancelled requests tell nothing about the host
+            if probe:
+                circuit.probes -= 1
+            raise
+
+        self.__record(circuit, probe, success=response.status_code < 500)
+        return response
+
+    """:internal:"""
+    def __admit(self, host: str, circuit: Circuit) -> bool:
+        """
+        Lets the request through or raises `CircuitOpenError`, returns whether the request is a probe.
+        """
+        if circuit.state == "closed":
+            return False
+
+        if circuit.state == "open" and self.clock() - circuit.opened_at >= self.reset_timeout:
+            circuit.state = "half_open"
+
+        if circuit.state == "half_open" and circuit.probes < self.half_open_requests:
+            circuit.probes += 1
+            self.counters["circuit.probes"] += 1
+            return True
+
+        self.counters["circuit.rejected"] += 1
+        raise CircuitOpenError(f"Circuit breaker for {host} is open")
+
+    """:internal:"""
+    def __record(self, circuit: Circuit, probe: bool, success: bool):
+        if probe:
+            circuit.probes -= 1
+
+        if success:
+            circuit.state = "closed"
+            circuit.failures = 0
+            return
+
+        circuit.failures += 1
+        if probe or circuit.failures >= self.failure_threshold:
+            if circuit.state != "open":
+                self.counters["circuit.opened"] += 1
+            circuit.state = "open"
+            circuit.opened_at = self.clock()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class HedgingTransport(AsyncBaseTransport):
+    """
+    Sends a second copy of an idempotent request once it takes longer than the latency percentile of its host.
+
+    The first completed request wins, the other one is cancelled (or its response is closed).
+    """
+
+    def __init__(
+        self,
+        transport: AsyncBaseTransport,
+        percentile: float = 0.95,
+        min_delay: float = 0.01,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        if not 0 < percentile <= 1:
+            raise ValueError("Hedging `percentile` must be in (0, 1] range")
+
+        self.transport = transport
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.latencies: dict[str, deque[float]] = {}
+        self.counters: Counter[str] = Counter()
+
+        # Latencies of the window kept sorted as samples come and go, so reading the percentile doesn't sort them
+        self._ordered: dict[str, list[float]] = {}
+
+    def delay(self, host: str) -> float | None:
+        """
+        Hedging delay of the host, `None` until enough latencies are known.
+        """
+        ordered = self._ordered.get(host)
+        if ordered is None or len(ordered) < self.min_samples:
+            return None
+
+        return max(self.min_delay, ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))])
+
+    async def handle_async_request(self, request: Request) -> Response:
+        host = request.url.host
+        delay = self.delay(host) if is_idempotent(request) and is_replayable(request) else None
+        if delay is None:
+            return await self.__timed(host, request)
+
+        primary = asyncio.create_task(self.__timed(host, request))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                self.counters["hedge.sent"] += 1
+                tasks.add(asyncio.create_task(self.__timed(host, request)))
+
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    if winner is not primary:
+                        self.counters["hedge.won"] += 1
+                    tasks.discard(winner)
+                    return winner.result()
+
+                tasks -= done
+                if not tasks:
+                    # Every copy failed, report the error of the original request
+                    return primary.result()
+        finally:
+            await self.__cancel(tasks)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    """:internal:"""
+    async def __timed(self, host: str, request: Request) -> Response:
+        started = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+
+        latency = time.perf_counter() - started
+        latencies = self.latencies.get(host)
+        if latencies is None:
+            latencies = self.latencies[host] = deque(maxlen=self.window)
+            self._ordered[host] = []
+
+        ordered = self._ordered[host]
+        if len(latencies) == self.window:
+            del ordered[bisect_left(ordered, latencies[0])]
+
+        latencies.append(latency)
+        insort(ordered, latency)
+        return response
+
+    """:internal:"""
+    @staticmethod
+    async def __cancel(tasks: set[asyncio.Task[Response]]):
+        for task in tasks:
+            task.cancel()
+
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Response):
+                await result.aclose()
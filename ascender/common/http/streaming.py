@@ -0,0 +1,204 @@
+import struct
+from dataclasses import dataclass
+from typing import Any, Generic, Literal, TypeVar
+
+
+T = TypeVar("T")
+
+StreamFormat = Literal["ndjson", "sse", "length"]
+
+
+@dataclass(slots=True)
+class ServerSentEvent(Generic[T]):
+    """
+    Event of `text/event-stream` response, `data` is decoded according to the expected response type.
+    """
+    data: T
+    event: str = "message"
+    id: str | None = None
+    retry: int | None = None
+
+
+class StreamDecoder:
+    """
+    Incremental decoder splitting streamed response body into messages.
+
+    Decoders work on raw bytes and don't depend on how the body is chunked: `feed()` returns messages
+    completed by the chunk, the incomplete rest is buffered until the next chunk or `flush()` at the end of stream.
+    """
+
+    def __init__(self, max_message_size: int = 16 * 1024 * 1024):
+        if max_message_size < 1:
+            raise ValueError("`max_message_size` must be a positive number")
+
+        self.max_message_size = max_message_size
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        raise NotImplementedError
+
+    def flush(self) -> list[Any]:
+        """Returns messages left in the buffer once the stream has ended."""
+        return []
+
+    def _check_size(self):
+        if len(self._buffer) > self.max_message_size:
+            raise ValueError(f"Streamed message exceeds `max_message_size` of {self.max_message_size} bytes")
+
+
+class LineDecoder(StreamDecoder):
+    """
+    Splits body into lines terminated by `\\n` or `\\r\\n`, every byte is scanned only once.
+    """
+
+    def __init__(self, max_message_size: int = 16 * 1024 * 1024):
+        super().__init__(max_message_size)
+        self._scanned = 0
+
+    def lines(self, chunk: bytes) -> list[bytes]:
+        buffer = self._buffer
+        buffer += chunk
+
+        lines: list[bytes] = []
+        start = 0
+        end = buffer.find(b"\n", self._scanned)
+        while end != -1:
+            lines.append(bytes(buffer[start:end - 1 if end > start and buffer[end - 1] == 13 else end]))
+            start = end + 1
+            end = buffer.find(b"\n", start)
+
+        del buffer[:start]
+        self._scanned = len(buffer)
+        self._check_size()
+        return lines
+
+    def rest(self) -> bytes:
+        rest, self._scanned = bytes(self._buffer).rstrip(b"\r"), 0
+        self._buffer.clear()
+        return rest
+
+
+class NDJSONDecoder(LineDecoder):
+    """
+    Newline delimited JSON (`application/x-ndjson`), every non-blank line is a message.
+    """
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        return [line for line in self.lines(chunk) if line.strip()]
+
+    def flush(self) -> list[bytes]:
+        rest = self.rest()
+        return [rest] if rest.strip() else []
+
+
+class SSEDecoder(LineDecoder):
+    """
+    Server-Sent Events (`text/event-stream`), messages are `ServerSentEvent` with raw `data`.
+    """
+
+    def __init__(self, max_message_size: int = 16 * 1024 * 1024):
+        super().__init__(max_message_size)
+        self._data: list[str] = []
+        self._event = ""
+        self._id: str | None = None
+        self._retry: int | None = None
+
+    def feed(self, chunk: bytes) -> list[ServerSentEvent[str]]:
+        events: list[ServerSentEvent[str]] = []
+        for line in self.lines(chunk):
+            event = self.__process_line(line)
+            if event is not None:
+                events.append(event)
+
+        return events
+
+    def flush(self) -> list[ServerSentEvent[str]]:
+        # Event isn't dispatched unless terminated by a blank line
+        self.rest()
+        self._data.clear()
+        return []
+
+    """:internal:"""
+    def __process_line(self, line: bytes) -> ServerSentEvent[str] | None:
+        if not line:
+            return self.__dispatch()
+
+        if line[0] == 58:  # ":" starts a comment
+            return None
+
+        field, separator, value = line.decode("utf-8").partition(":")
+        if separator and value.startswith(" "):
+            value = value[1:]
+
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event = value
+        elif field == "id" and "\0" not in value:
+            self._id = value
+        elif field == "retry" and value.isdigit():
+            self._retry = int(value)
+
+        return None
+
+    """:internal:"""
+    def __dispatch(self) -> ServerSentEvent[str] | None:
+        if not self._data:
+            self._event = ""
+            return None
+
+        event = ServerSentEvent("\n".join(self._data), self._event or "message", self._id, self._retry)
+        self._data = []
+        self._event = ""
+        return event
+
+
+class LengthPrefixedDecoder(StreamDecoder):
+    """
+    Messages prefixed with their size as a 4 bytes big-endian unsigned integer.
+    """
+
+    header = struct.Struct(">I")
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        buffer = self._buffer
+        buffer += chunk
+
+        messages: list[bytes] = []
+        offset = 0
+        header_size = self.header.size
+        while len(buffer) - offset >= header_size:
+            (size,) = self.header.unpack_from(buffer, offset)
+            if size > self.max_message_size:
+                raise ValueError(f"Streamed message of {size} bytes exceeds `max_message_size` of {self.max_message_size} bytes")
+
+            end = offset + header_size + size
+            if end > len(buffer):
+                break
+
+            messages.append(bytes(buffer[offset + header_size:end]))
+            offset = end
+
+        del buffer[:offset]
+        return messages
+
+
+STREAM_DECODERS: dict[str, type[StreamDecoder]] = {
+    "ndjson": NDJSONDecoder,
+    "sse": SSEDecoder,
+    "length": LengthPrefixedDecoder,
+}
+
+
+def get_stream_decoder(format: StreamFormat) -> StreamDecoder:
+    """
+    Creates a fresh decoder for the stream format.
+
+    Raises:
+        ValueError: If stream format is unknown.
+    """
+    decoder_cls = STREAM_DECODERS.get(format)
+    if decoder_cls is None:
+        raise ValueError(f"Unknown stream format `{format}`, expected one of {', '.join(STREAM_DECODERS)}")
+
+    return decoder_cls()
@@ -0,0 +1,34 @@
+from typing import Any, Literal, NotRequired, TypedDict
+
+from .http_options import HTTPOptions
+
+
+class BatchRequest(TypedDict):
+    """
+    Single request of `HTTPClient.batch`.
+    """
+
+    method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"]
+    """
+    HTTP method of the request
+    """
+
+    url: str
+    """
+    The URL to send the request to
+    """
+
+    response: NotRequired[type[Any] | Any]
+    """
+    The expected response type, same as `_resp` of other `HTTPClient` methods. Defaults to dict
+    """
+
+    content: NotRequired[Any]
+    """
+    The content to include in the request body (supports pydantic models and `FormData`)
+    """
+
+    options: NotRequired[HTTPOptions]
+    """
+    Additional options for the request
+    """
@@ -0,0 +1,22 @@
+from typing import NotRequired, TypedDict
+
+
+class HTTPCacheOptions(TypedDict):
+    """
+    Configures response cache of `HTTPClient`, see `provideHTTPClient(cache=...)`.
+    """
+
+    max_bytes: NotRequired[int]
+    """
+    Total size of cached responses, least recently used ones are evicted above it. Defaults to 64 MiB
+    """
+
+    max_entry_bytes: NotRequired[int]
+    """
+    Responses larger than this are never cached. Defaults to 1/8 of `max_bytes`
+    """
+
+    default_ttl: NotRequired[float]
+    """
+    Freshness lifetime in seconds of responses without `Cache-Control: max-age` or `Expires`. Defaults to 0 (revalidate)
+    """
@@ -4,6 +4,7 @@ from httpx import Request, Response
 
 InterceptorIn = Request
 InterceptorFn = Callable[[Request], Awaitable[Request]]
+ResponseInterceptorFn = Callable[[Response], Awaitable[Response]]
 
 
 class Interceptor(ABC):
@@ -0,0 +1,79 @@
+from typing import NotRequired, TypedDict
+
+
+class RetryOptions(TypedDict):
+    """
+    Configures retries of failed requests, see `provideHTTPClient(retry=...)`.
+
+    Only idempotent requests (`GET`, `HEAD`, `OPTIONS`, `PUT`, `DELETE` or any request with `Idempotency-Key` header) are retried.
+    """
+
+    attempts: NotRequired[int]
+    """
+    Maximum amount of attempts including the first one. Defaults to 3
+    """
+
+    initial_backoff: NotRequired[float]
+    """
+    Delay before the first retry in seconds, doubled with every next retry. Defaults to 0.1
+    """
+
+    max_backoff: NotRequired[float]
+    """
+    Upper bound of the delay between retries in seconds, also caps `Retry-After`. Defaults to 5.0
+    """
+
+    statuses: NotRequired[list[int]]
+    """
+    Response status codes to retry. Defaults to 429, 502, 503 and 504
+    """
+
+
+class CircuitBreakerOptions(TypedDict):
+    """
+    Configures per-host circuit breaker, see `provideHTTPClient(circuit_breaker=...)`.
+    """
+
+    failure_threshold: NotRequired[int]
+    """
+    Consecutive failures (transport errors and 5xx responses) which open the circuit. Defaults to 5
+    """
+
+    reset_timeout: NotRequired[float]
+    """
+    Seconds the circuit stays open before probe requests are let through. Defaults to 30.0
+    """
+
+    half_open_requests: NotRequired[int]
+    """
+    Amount of concurrent probe requests while the circuit is half-open. Defaults to 1
+    """
+
+
+class HedgingOptions(TypedDict):
+    """
+    Configures hedged requests, see `provideHTTPClient(hedging=...)`.
+
+    Idempotent requests slower than the recent latency percentile of their host get a second request,
+    whichever completes first is returned and the other one is cancelled.
+    """
+
+    percentile: NotRequired[float]
+    """
+    Latency percentile used as the hedging delay. Defaults to 0.95
+    """
+
+    min_delay: NotRequired[float]
+    """
+    Lower bound of the hedging delay in seconds. Defaults to 0.01
+    """
+
+    window: NotRequired[int]
+    """
+    Amount of recent latencies per host the percentile is computed from. Defaults to 200
+    """
+
+    min_samples: NotRequired[int]
+    """
+    Requests aren't hedged until that many latencies of the host are known. Defaults to 20
+    """
@@ -5,6 +5,7 @@ from reactivex import Observable
 
 from ascender.common.base.dto import BaseDTO
 from ascender.common.base.response import BaseResponse
+from ascender.common.microservices.codecs import get_codec
 from ascender.common.microservices.instances.bus import SubscriptionEventBus
 
 if TYPE_CHECKING:
@@ -32,6 +33,7 @@ class ClientProxy(ABC):
         self.event_bus = event_bus
         self.configs = configs
         self.instance = instance
+        self.codec = get_codec(self.configs.get("codec"))
     
     @abstractmethod
     async def connect(self):
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class Codec(ABC):
+    """
+    Serializes microservice messages for the wire.
+
+    Transports with an envelope (TCP, Redis) build a dict with `pattern`, `correlationId` and `payload` keys
+    and serialize it with `encode()`, payload is embedded with `encode_payload()` first.
+    Transports without envelope (Kafka) serialize the payload alone with `encode_value()`.
+    """
+
+    name: str
+    binary: bool = False
+    """Whether encoded messages may contain arbitrary bytes (e.g. newlines)."""
+
+    @abstractmethod
+    def encode(self, message: Any) -> bytes:
+        """Serializes message (envelope or plain value) into bytes."""
+        ...
+
+    @abstractmethod
+    def decode(self, data: bytes | bytearray | memoryview | str) -> Any:
+        """Deserializes bytes received from the wire."""
+        ...
+
+    def encode_payload(self, data: Any) -> Any:
+        """Prepares user's payload for being embedded into an envelope."""
+        return data
+
+    def decode_payload(self, payload: Any) -> Any:
+        """
+        Decodes payload taken from a received envelope (or raw message value) before it's handed to the producer.
+        """
+        if isinstance(payload, (bytes, bytearray, memoryview)):
+            return self.decode(payload)
+
+        return payload
+
+    def encode_value(self, data: Any) -> bytes:
+        """Serializes payload sent as a whole message value, without envelope."""
+        return self.encode(data)
+
+    def decode_value(self, value: bytes) -> Any:
+        """
+        Decodes raw message value before it's passed to message handlers.
+
+        Text codecs keep raw bytes, so handlers validate JSON straight into the expected type.
+        """
+        return value
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 from ascender.common.base.dto import BaseDTO
 from ascender.common.base.response import BaseResponse
 if TYPE_CHECKING:
+    from ascender.common.microservices.abc.codec import Codec
     from ascender.common.microservices.instances.bus import SubscriptionEventBus
     from ascender.common.microservices.abc.client_proxy import ClientProxy
     from ascender.common.microservices.abc.transporter import BaseTransporter
@@ -15,6 +16,7 @@ class EventTransport(ABC):
     def __init__(self, transport: "BaseTransporter | ClientProxy"):
         self.transport = transport
         self.event_bus = self.transport.event_bus
+        self.codec: "Codec" = self.transport.codec
     
     async def send_event(
         self, 
@@ -9,6 +9,7 @@ from ascender.common.microservices.exceptions.rpc_exception import RPCException
 from ascender.common.microservices.types.consumer_metadata import ConsumerMetadata
 
 if TYPE_CHECKING:
+    from ascender.common.microservices.abc.codec import Codec
     from ascender.common.microservices.abc.context import BaseContext
     from ascender.common.microservices.instances.bus import SubscriptionEventBus
     from ascender.common.microservices.abc.transporter import BaseTransporter
@@ -21,7 +22,15 @@ class RPCTransport(ABC):
     def __init__(self, transport: "BaseTransporter | ClientProxy"):
         self.transport = transport
         self.event_bus = self.transport.event_bus
-        self.event_bus.subscribe("_rpc:response", self.listen_for_requests)
+        self.codec: "Codec" = self.transport.codec
+        self.subscription = self.event_bus.subscribe("_rpc:response", self.listen_for_requests)
+
+    def detach(self) -> None:
+        """
+        Stops receiving RPC responses from the event bus, call it once a short-lived transport
+        (e.g. of a closed connection) is no longer used.
+        """
+        self.event_bus.unsubscribe("_rpc:response", self.subscription)
     
     @abstractmethod
     async def send_request(
@@ -52,8 +61,8 @@ class RPCTransport(ABC):
         ...
     
     @abstractmethod
-    async def send_response(self, pattern: str, correlation_id: str, response: bytes) -> None:
-        """Send a response back to the caller, using the correlation id to route it."""
+    async def send_response(self, pattern: str, correlation_id: str, response: Any) -> None:
+        """Send a response back to the caller, using the correlation id to route it. Response is serialized with the transport's codec."""
         ...
 
     @abstractmethod
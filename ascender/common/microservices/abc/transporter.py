@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
 
+from ascender.common.microservices.codecs import get_codec
 from ascender.common.microservices.instances.bus import SubscriptionEventBus
+from ascender.common.microservices.utils.dispatcher import MessageDispatcher
 
 if TYPE_CHECKING:
     from ascender.common.microservices.instances.transport import TransportInstance
@@ -10,6 +12,9 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 class BaseTransporter(ABC):
+    framework_options: frozenset[str] = frozenset({"dispatch", "codec", "pool", "framing", "max_frame_size"})
+    """Transport options consumed by the framework itself, they are never passed to the broker's client."""
+
     def __init__(
         self, 
         instance: "TransportInstance",
@@ -19,6 +24,15 @@ class BaseTransporter(ABC):
         self.instance = instance
         self.event_bus = event_bus
         self.configs = configs
+        self.codec = get_codec(self.configs.get("codec"))
+        self.dispatcher = MessageDispatcher(self.event_bus.emit, **self.configs.get("dispatch", {}))
+
+    @classmethod
+    def broker_options(cls, configs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Strips framework's own options (e.g. `dispatch` or `codec`) from transport options.
+        """
+        return {key: value for key, value in configs.items() if key not in cls.framework_options}
     
     @abstractmethod
     async def listen(self):
@@ -16,8 +16,9 @@ from ascender.common.microservices.instances.redis.context import RedisContext
 from ascender.common.microservices.instances.redis.event import RedisEventTransport
 from ascender.common.microservices.instances.redis.rpc import RedisRPCTransport
 from ascender.common.microservices.instances.transport import TransportInstance
-from ascender.common.microservices.utils.data_parser import parse_data, validate_json, validate_python
+from ascender.common.type_adapter import get_type_adapter
 from ascender.core import inject
+from ascender.core.di.scope import request_scope
 
 
 class CallbackManager:
@@ -43,6 +44,11 @@ class CallbackManager:
         self.callback_signature = inspect.signature(callback)
         self.logger: Logger = inject("ASC_LOGGER")
 
+        # Handler plan: parameter layout and payload validators are resolved once, on registration
+        self.context_info = self.get_context_info()
+        self.data_field_info = self.get_data_field()
+        self.json_validator, self.python_validator = self.compile_validators()
+
     def get_context_info(self) -> Optional[Tuple[str, Type[BaseContext]]]:
         """
         Inspects the callback's signature to extract context parameter information.
@@ -100,6 +106,28 @@ class CallbackManager:
 
         return None
 
+    def compile_validators(self) -> Tuple[Optional[Callable[[Any], Any]], Optional[Callable[[Any], Any]]]:
+        """
+        Builds JSON and Python validators for the data field of the callback.
+
+        Pydantic models are validated with their own validator, any other type gets a cached `TypeAdapter`.
+        Data parameters without annotation are treated as `Any`.
+
+        :return: A tuple (json_validator, python_validator), or (None, None) if callback has no data field.
+        """
+        if self.data_field_info is None:
+            return None, None
+
+        _, field_type = self.data_field_info
+        if field_type is inspect.Parameter.empty:
+            field_type = Any
+
+        if isinstance(field_type, type) and issubclass(field_type, BaseModel):
+            return field_type.model_validate_json, field_type.model_validate
+
+        adapter = get_type_adapter(field_type)
+        return adapter.validate_json, adapter.validate_python
+
     async def handle_rpc_call(self, instance_context: BaseContext, payload: dict[str, Any]) -> None:
         """
         Executes an RPC callback and sends the serialized response.
@@ -112,7 +140,7 @@ class CallbackManager:
             response = await self.callback(**payload)
         except RPCException as e:
             await instance_context.rpc_transport.raise_exception(
-                instance_context.pattern,
+                "_rpc:response",
                 f"response-{instance_context.correlation_id}",
                 e
             )
@@ -121,12 +149,11 @@ class CallbackManager:
             self.logger.error("Unexpected error during RPC call: %s", e)
             raise
 
-        # Serialize the response to JSON and send it using the RPC transport.
-        serialized_response = parse_data(response).encode()
+        # The RPC transport serializes the response with its codec.
         await instance_context.rpc_transport.send_response(
             pattern="_rpc:response",
             correlation_id=f"response-{instance_context.correlation_id}",
-            response=serialized_response,
+            response=response,
         )
 
     async def handle_event_call(self, payload: dict[str, Any]) -> None:
@@ -162,11 +189,10 @@ class CallbackManager:
 
         This method:
           1. Checks whether the callback should be skipped.
-          2. Extracts and validates the data payload.
-          3. Generates the context (if required) using metadata (which must include the "type" key).
-          4. If a context parameter is declared, ensures that the generated context matches the expected
+          2. If a context parameter is declared, ensures that the generated context matches the expected
              type. If not, the callback is ignored.
-          5. Delegates the callback to either the RPC or event handler.
+          3. Validates the data payload with validators compiled on registration.
+          4. Delegates the callback to either the RPC or event handler.
 
         :param instance: The transport instance used to build the context.
         :param data: The raw data received from the message broker.
@@ -181,34 +207,11 @@ class CallbackManager:
 
         try:
             payload: dict[str, Any] = {}
-
-            context_info = self.get_context_info()
-            data_field_info = self.get_data_field()
-
             raised_exception = None
 
-            # Validate and assign the data field.
-            if data_field_info is not None:
-                field_name, field_type = data_field_info
-                # Decode if necessary.
-                decoded_data = data.decode() if isinstance(data, bytes) else data
-                # Handle validation errors
-                try:
-                    try:
-                        payload[field_name] = validate_json(
-                            decoded_data, field_type)
-                    except ValidationError:
-                        payload[field_name] = validate_python(
-                            decoded_data, field_type)
-
-                except ValidationError as e:
-                    traceback.print_exc()
-                    raised_exception = RPCException.from_validation_err(e)
-
-            # Generate and assign the context if the callback expects it.
-
-            if context_info is not None:
-                context_field, expected_context_cls = context_info
+            # Assign the context if the callback expects it.
+            if self.context_info is not None:
+                context_field, expected_context_cls = self.context_info
                 # Verify that the generated context matches the expected type.
                 if not isinstance(context, expected_context_cls):
                     self.logger.debug(
@@ -220,6 +223,26 @@ class CallbackManager:
                     return
                 payload[context_field] = context
 
+            # Validate and assign the data field.
+            if self.data_field_info is not None:
+                field_name = self.data_field_info[0]
+                # Handle validation errors
+                try:
+                    if not isinstance(data, (str, bytes, bytearray)):
+                        # Already decoded by a binary codec
+                        payload[field_name] = self.python_validator(data)
+                    else:
+                        try:
+                            payload[field_name] = self.json_validator(data)
+                        except ValidationError:
+                            # Decode if necessary.
+                            decoded_data = data.decode() if isinstance(data, (bytes, bytearray)) else data
+                            payload[field_name] = self.python_validator(decoded_data)
+
+                except ValidationError as e:
+                    traceback.print_exc()
+                    raised_exception = RPCException.from_validation_err(e)
+
         except Exception as e:
             self.logger.exception(
                 "Error while preparing payload for callback execution: %s", e)
@@ -230,12 +253,13 @@ class CallbackManager:
             if raised_exception:
                 # Respond with `RPCException` to the producer
                 await context.rpc_transport.raise_exception(
-                    context.pattern,
+                    "_rpc:response",
                     f"response-{context.correlation_id}",
                     raised_exception
                 )
                 return
-            await self.handle_rpc_call(context, payload)
+            async with request_scope():
+                await self.handle_rpc_call(context, payload)
         else:
             if raised_exception:
                 # Log the exception and continue processing
@@ -243,4 +267,5 @@ class CallbackManager:
                     "Error while preparing payload for event execution: %s", raised_exception)
                 return
             
-            await self.handle_event_call(payload)
+            async with request_scope():
+                await self.handle_event_call(payload)
@@ -0,0 +1,45 @@
+from ascender.common.microservices.abc.codec import Codec
+
+from .json import JSONCodec
+from .legacy import LegacyJSONCodec
+from .msgpack import MsgPackCodec
+
+
+CODECS: dict[str, type[Codec]] = {
+    LegacyJSONCodec.name: LegacyJSONCodec,
+    JSONCodec.name: JSONCodec,
+    MsgPackCodec.name: MsgPackCodec,
+}
+
+
+def get_codec(codec: str | Codec | None = None) -> Codec:
+    """
+    Resolves codec from the `codec` transport option.
+
+    Args:
+        codec (str | Codec | None, optional): Codec name (`"legacy"`, `"json"` or `"msgpack"`) or codec instance.
+            Defaults to None, which is the `"legacy"` wire format.
+
+    Raises:
+        ValueError: If codec name is unknown.
+
+    Returns:
+        Codec: Codec instance.
+    """
+    if isinstance(codec, Codec):
+        return codec
+
+    codec_cls = CODECS.get(codec or LegacyJSONCodec.name)
+    if codec_cls is None:
+        raise ValueError(f"Unknown codec `{codec}`, expected one of {', '.join(CODECS)} or `Codec` instance")
+
+    return codec_cls()
+
+
+__all__ = [
+    "Codec",
+    "JSONCodec",
+    "LegacyJSONCodec",
+    "MsgPackCodec",
+    "get_codec",
+]
@@ -0,0 +1,48 @@
+import json
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+
+from ascender.common.microservices.abc.codec import Codec
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class JSONCodec(Codec):
+    """
+    Single-pass JSON codec.
+
+    Payload is nested into the envelope as a JSON object (not as a string), so every message is
+    serialized and parsed exactly once. Pydantic models and other non-JSON types are converted during
+    serialization. Uses `orjson` when it's installed, falls back to the standard `json` module otherwise.
+    """
+
+    name = "json"
+
+    def __init__(self, use_orjson: bool | None = None):
+        """
+        Args:
+            use_orjson (bool | None, optional): Force (`True`) or disable (`False`) orjson. Defaults to None (use if installed).
+        """
+        if use_orjson and orjson is None:
+            raise ImportError("orjson is not installed. Install it with 'poetry add orjson'.")
+
+        self.use_orjson = orjson is not None if use_orjson is None else use_orjson
+
+    def encode(self, message: Any) -> bytes:
+        if self.use_orjson:
+            return orjson.dumps(message, default=to_jsonable_python, option=orjson.OPT_NON_STR_KEYS)
+
+        return json.dumps(message, default=to_jsonable_python, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes | bytearray | memoryview | str) -> Any:
+        if self.use_orjson:
+            return orjson.loads(data)
+
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        return json.loads(data)
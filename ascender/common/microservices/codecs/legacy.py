@@ -0,0 +1,34 @@
+import json
+from typing import Any
+
+from ascender.common.microservices.abc.codec import Codec
+from ascender.common.microservices.utils.data_parser import decode_message, parse_data
+
+
+class LegacyJSONCodec(Codec):
+    """
+    Compatibility codec, keeps the original wire format of Ascender Framework's microservices.
+
+    Payload is serialized into a JSON string first and then embedded into the JSON envelope as a string,
+    so the receiver has to decode it twice. Use it while some of the services still run older releases.
+    """
+
+    name = "legacy"
+
+    def encode(self, message: Any) -> bytes:
+        return json.dumps(message).encode()
+
+    def decode(self, data: bytes | bytearray | memoryview | str) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        return json.loads(data)
+
+    def encode_payload(self, data: Any) -> Any:
+        return parse_data(data)
+
+    def decode_payload(self, payload: Any) -> Any:
+        return decode_message(payload)
+
+    def encode_value(self, data: Any) -> bytes:
+        return parse_data(data).encode()
@@ -0,0 +1,36 @@
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+
+from ascender.common.microservices.abc.codec import Codec
+
+
+class MsgPackCodec(Codec):
+    """
+    Binary MessagePack codec, payload is nested into the envelope like in `JSONCodec`.
+
+    Messages are always decoded as MessagePack, JSON is valid MessagePack often enough (`5` is the int 53)
+    to make guessing unsafe, so every peer must use this codec.
+    """
+
+    name = "msgpack"
+    binary = True
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError(
+                "MessagePack codec requires the 'msgpack' package. Install it with 'poetry add msgpack'."
+            ) from e
+
+        self.msgpack = msgpack
+
+    def encode(self, message: Any) -> bytes:
+        return self.msgpack.packb(message, default=to_jsonable_python)
+
+    def decode(self, data: bytes | bytearray | memoryview | str) -> Any:
+        return self.msgpack.unpackb(data, raw=False)
+
+    def decode_value(self, value: bytes) -> Any:
+        return self.decode(value)
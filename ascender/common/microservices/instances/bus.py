@@ -1,19 +1,25 @@
 import asyncio
-import re
 from typing import Any, Awaitable, Callable, MutableMapping
 import uuid
 from ascender.common.injectable import Injectable
 from ascender.common.microservices.abc.context import BaseContext
 from ascender.common.microservices.abc.event_bus import TransportEventBus
 from ascender.common.microservices.types.consumer_metadata import ConsumerMetadata
+from ascender.common.microservices.utils.topic_router import TopicRouter
 
 
 @Injectable()
 class SubscriptionEventBus(TransportEventBus):
+    max_cached_routes: int = 4096
+
     def __init__(self):
         # Token mapping: topic -> { token: callback, ... }
         self._subscriptions: MutableMapping[str, dict[str, Callable[[Any, Any], Awaitable[None]]]] = {}
         self.callbacks: list[Callable[[Any, Any], Awaitable[None]]] = []
+
+        # Compiled routing of topics into subscribed patterns and resolved callbacks per topic
+        self._router = TopicRouter()
+        self._routes: dict[Any, tuple[Callable[[Any, Any], Awaitable[None]], ...]] = {}
     
     async def emit(self, context, topic, data, metadata):
         """
@@ -23,25 +29,29 @@ class SubscriptionEventBus(TransportEventBus):
             topic (str): Topic of the event
             data (Any): Data of the event
         """
-        # List of tasks to execute in parallel
-        tasks = []
-        
-        # Check for wildcards
-        for sub_topic, callbacks in self._subscriptions.items():
-            if "*" in sub_topic:
-                # Convert a pattern like "USER_*" into a regex: ^USER_.*$
-                regex_pattern = "^" + re.escape(sub_topic).replace(r"\*", ".*") + "$"
-                if re.match(regex_pattern, topic):
-                    for callback in callbacks.values():
-                        tasks.append(callback(context, data, metadata))
-            else:
-                if sub_topic == topic:
-                    for callback in callbacks.values():
-                        tasks.append(callback(context, data, metadata))
-        if tasks:
+        callbacks = self._routes.get(topic)
+        if callbacks is None:
+            callbacks = self._resolve(topic)
+
+        if callbacks:
             # Execute all tasks at the same time using `asyncio.gather`
-            await asyncio.gather(*tasks, return_exceptions=True)
-            tasks = []
+            await asyncio.gather(*(callback(context, data, metadata) for callback in callbacks), return_exceptions=True)
+    
+    def _resolve(self, topic):
+        """
+        Resolves callbacks of all patterns matching the topic and caches them until subscriptions change.
+        """
+        callbacks = tuple(
+            callback
+            for pattern in self._router.match(topic)
+            for callback in self._subscriptions[pattern].values()
+        )
+
+        if len(self._routes) >= self.max_cached_routes:
+            self._routes.pop(next(iter(self._routes)))
+
+        self._routes[topic] = callbacks
+        return callbacks
     
     def subscribe(self, topic, callback):
         """
@@ -55,9 +65,11 @@ class SubscriptionEventBus(TransportEventBus):
         # Check if topic not in subscriptions, if not then just add
         if topic not in self._subscriptions:
             self._subscriptions[topic] = {}
+            self._router.add(topic)
         
         # Add token for topic
         self._subscriptions[topic][token] = callback
+        self._routes.clear()
         return token
     
     def subscribe_all(self, callback: Callable[[BaseContext, str, Any, ConsumerMetadata], Awaitable[None]]):
@@ -77,6 +89,9 @@ class SubscriptionEventBus(TransportEventBus):
                 del self._subscriptions[topic][token]
                 if not self._subscriptions[topic]:
                     del self._subscriptions[topic]
+                    self._router.remove(topic)
+        
+        elif self._subscriptions.pop(topic, None) is not None:
+            self._router.remove(topic)
         
-        else:
-            self._subscriptions.pop(topic, None)
\ No newline at end of file
+        self._routes.clear()
\ No newline at end of file
@@ -4,6 +4,7 @@ from typing import Any
 from ascender.common.base.dto import BaseDTO
 from ascender.common.base.response import BaseResponse
 from ascender.common.microservices.abc.client_proxy import ClientProxy, Undefined, T
+from ascender.common.microservices.abc.transporter import BaseTransporter
 from ascender.common.microservices.instances.kafka.event import KafkaEventTransport
 from ascender.common.microservices.instances.kafka.rpc import KafkaRPCTransport
 from reactivex import operators as ops
@@ -17,8 +18,9 @@ class KafkaClient(ClientProxy):
         
         if not instance:
             from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
-            self.consumer = AIOKafkaConsumer(**configs)
-            self.producer = AIOKafkaProducer(**configs)
+            broker_configs = BaseTransporter.broker_options(configs)
+            self.consumer = AIOKafkaConsumer(**broker_configs)
+            self.producer = AIOKafkaProducer(**broker_configs)
             return
         
         self.consumer = instance.transporter.consumer
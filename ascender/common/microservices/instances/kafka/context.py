@@ -68,7 +68,7 @@ class KafkaContext(BaseContext):
         if self.is_event:
             raise ValueError("Failed to defer response. Make sure you're trying to defer response from message handler!")
         
-        return await self.rpc_transport.defer(self.pattern, self.correlation_id)
+        return await self.rpc_transport.defer("_rpc:response", self.correlation_id)
 
     async def emit(
         self,
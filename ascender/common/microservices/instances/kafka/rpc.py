@@ -1,17 +1,13 @@
-import asyncio
-import json
 from logging import Logger
 import traceback
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 from ascender.common.microservices.abc.rpc_transport import RPCTransport
-from reactivex import Subject, operators as ops, throw, timer
-from reactivex.scheduler.eventloop import AsyncIOScheduler
+from reactivex import from_future
 
 from ascender.common.microservices.exceptions.rpc_exception import RPCException
 from ascender.common.microservices.instances.kafka.metadata import KafkaMetadata
-from ascender.common.microservices.utils.data_parser import decode_message, parse_data
-from ascender.common.microservices.utils.defer_mapping import kafka_defer
+from ascender.common.microservices.utils.pending_requests import PendingRequests
 from ascender.core import inject
 
 if TYPE_CHECKING:
@@ -26,8 +22,8 @@ class KafkaRPCTransport(RPCTransport):
 
     def __init__(self, transport: "KafkaTransporter | KafkaClient"):
         super().__init__(transport)
-        # A subject to publish all responses.
-        self.response_subject = Subject()
+        # In-flight requests, keyed by correlation id.
+        self.pending_requests = PendingRequests()
         self.logger: Logger = inject("ASC_LOGGER")
 
     async def send_request(self, pattern, data, timeout):
@@ -45,43 +41,21 @@ class KafkaRPCTransport(RPCTransport):
         Returns:
             Any | None: Response object as any type or serialized type.
         """
-        loop = asyncio.get_running_loop()  # Updated for Python 3.10+
-        asyncio_scheduler = AsyncIOScheduler(loop)
         correlation_id = str(uuid4())
-        response = asyncio.Future()  # Use Future for proper async response handling
-        response_received = asyncio.Event()
-
-        data = parse_data(data).encode()
-
-        # Subscription to the event response
-        def define_response(resp: Any | None):
-            """RxPY Callback when response is received."""
-            if not response.done():
-                response.set_result(resp)  # Properly set response in Future
-            response_received.set()  # Allow waiting coroutine to proceed
-
-        def throw_error(err: Exception):
-            """Raise an error when RxPY encounters an issue."""
-            if not response.done():
-                response.set_exception(err)
-            response_received.set()
-
-        subscription = self.response_subject.pipe(
-            ops.subscribe_on(asyncio_scheduler),
-            ops.timeout_with_mapper(timer(timeout), kafka_defer(
-                timeout, correlation_id), throw(TimeoutError("Response timed out."))),
-            ops.filter(lambda pair: pair[0] == f"response-{correlation_id}"),
-            ops.first(),
-            ops.map(lambda pair: pair[1])
-        ).subscribe(
-            on_next=define_response,
-            on_error=throw_error
-        )
+
+        data = self.codec.encode_value(data)
+
+        # Register the request before sending, so early responses are never lost
+        response = self.pending_requests.register(correlation_id, timeout)
 
         self.logger.debug(
             f"[yellow] ASCENDER MICROSERVICES [/] | Sending message to [cyan]{pattern}[/] with correlation ID [green]{correlation_id}[/]")
         
-        await self.transport.producer.send(topic=pattern, headers=[( "correlationId", correlation_id.encode() )], value=data)
+        try:
+            await self.transport.producer.send(topic=pattern, headers=[( "correlationId", correlation_id.encode() )], value=data)
+        except BaseException:
+            response.cancel()
+            raise
         # INFO LOG
         self.logger.info(
             f"[yellow] ASCENDER MICROSERVICES [/] | Successfully sent message pattern [bold cyan]{pattern}[/] to the message broker")
@@ -91,16 +65,14 @@ class KafkaRPCTransport(RPCTransport):
             f"[yellow] ASCENDER MICROSERVICES [/] | Now waiting for response from message pattern {pattern} from consumer side")
 
         # Wait for the response
-        await response_received.wait()
-        # Dispose the subscription after response is received
-        subscription.dispose()
+        result = await response
 
         # INFO LOG
         self.logger.info(
             f"[yellow] ASCENDER MICROSERVICES [/] | Received response from consumer message pattern handler {pattern}")
 
         # Return the response from request
-        return await response
+        return result
 
     async def send_nack_request(self, pattern, data, timeout):
         """
@@ -108,31 +80,20 @@ class KafkaRPCTransport(RPCTransport):
 
         Instead it returns Reactivex observable object with 
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        asyncio_scheduler = AsyncIOScheduler(loop)
         correlation_id = str(uuid4())
 
-        data = parse_data(data).encode()
+        data = self.codec.encode_value(data)
 
-        # Send request
-        await self.transport.producer.send(pattern, value=data, headers=[( "correlationId", correlation_id.encode() )])
+        response = self.pending_requests.register(correlation_id, timeout)
 
-        # Subscribe to the event response
-        observable = self.response_subject.pipe(
-            ops.subscribe_on(asyncio_scheduler),
-            ops.timeout_with_mapper(timer(timeout), kafka_defer(
-                timeout, correlation_id), throw(TimeoutError("Response timed out."))),
-            ops.filter(lambda pair: pair[0] == f"response-{correlation_id}"),
-            ops.first(),
-            ops.map(lambda pair: pair[1])
-        )
+        # Send request
+        try:
+            await self.transport.producer.send(pattern, value=data, headers=[( "correlationId", correlation_id.encode() )])
+        except BaseException:
+            response.cancel()
+            raise
 
-        return observable
+        return from_future(response)
 
     async def defer(
         self,
@@ -148,29 +109,19 @@ class KafkaRPCTransport(RPCTransport):
     async def send_response(self, pattern, correlation_id, response):
         self.logger.debug(
             f"[yellow] ASCENDER MICROSERVICES [/] | Responding to RPC channel using correlation ID {correlation_id} and pattern {pattern}")
-        await self.transport.producer.send(pattern, response, headers=[("correlationId", correlation_id.encode())])
+        await self.transport.producer.send(pattern, self.codec.encode_value(response), headers=[("correlationId", correlation_id.encode())])
 
     async def raise_exception(self, pattern, correlation_id, exception):
         if not isinstance(exception, RPCException):
             raise TypeError(f"Expected type `RPCException` but got {exception.__class__.__name__}")
         
-        await self.transport.producer.send(pattern, json.dumps(exception.to_dict()).encode(), headers=[("correlationId", correlation_id.encode())])
+        await self.transport.producer.send(pattern, self.codec.encode_value(exception.to_dict()), headers=[("correlationId", correlation_id.encode())])
 
     async def process_response(self, correlation_id, response, **kwargs):
         if not correlation_id:
             return
         
-        if not correlation_id.startswith("response-") and not correlation_id.startswith("defer-"):
-            return
-        
-        response = decode_message(response)
-        
-        if isinstance(response, dict):
-            if RPCException.is_exception(response):
-                self.response_subject.on_error(RPCException.from_dict(response))
-                return
-            
-        self.response_subject.on_next((correlation_id, decode_message(response), kwargs))
+        self.pending_requests.dispatch(correlation_id, response, self.codec.decode_payload)
 
     async def listen_for_requests(self, context: "KafkaContext", data: Any, metadata: KafkaMetadata):
         # print(context, data, metadata)
@@ -30,8 +30,9 @@ class KafkaTransporter(BaseTransporter):
             raise ImportError(
                 "Kafka transporter requires the 'aiokafka' package. Install it with 'poetry add kafka'."
             ) from e
-        self.consumer = AIOKafkaConsumer(**configs)
-        self.producer = AIOKafkaProducer(**configs)
+        broker_configs = self.broker_options(configs)
+        self.consumer = AIOKafkaConsumer(**broker_configs)
+        self.producer = AIOKafkaProducer(**broker_configs)
         
         self.rpc_transport = KafkaRPCTransport(self)
         self.event_transport = KafkaEventTransport(self)
@@ -69,7 +70,9 @@ class KafkaTransporter(BaseTransporter):
                     event_transport=self.event_transport,
                     **metadata
                 )
-                await self.event_bus.emit(context, message.topic, message.value, metadata)
+                # Messages of the same partition key stay sequential in `ordered` dispatch mode
+                key = message.key if message.key is not None else correlation_id or (message.topic, message.partition)
+                await self.dispatcher.dispatch(context, message.topic, self.codec.decode_value(message.value), metadata, key=key)
             except Exception as e:
                 traceback.print_exc()
     
@@ -77,8 +80,9 @@ class KafkaTransporter(BaseTransporter):
         """
         Being executed each times when server stops
         """
-        await self.producer.stop()
         await self.consumer.stop()
+        await self.dispatcher.join()
+        await self.producer.stop()
 
         self.is_stopped = True
     
@@ -14,7 +14,7 @@ class RedisContext(BaseContext):
     async def defer_response(self):
         if self.is_event:
             raise ValueError("Cannot defer response from an event handler!")
-        return await self.rpc_transport.defer(self.pattern, self.correlation_id)
+        return await self.rpc_transport.defer("_rpc:response", self.correlation_id)
 
     async def emit(self, pattern: str, data=None, **kwargs):
         return await self.event_transport.send_event(pattern, data, **kwargs)
@@ -1,6 +1,4 @@
-import json
 from ascender.common.microservices.abc.event_transport import EventTransport
-from ascender.common.microservices.utils.data_parser import parse_data
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,9 +11,9 @@ class RedisEventTransport(EventTransport):
         super().__init__(transport)
 
     async def send_event(self, pattern, data=None, **kwargs):
-        message = json.dumps({"payload": parse_data(data)})
+        message = self.codec.encode({"payload": self.codec.encode_payload(data)})
         return await self.transport.publisher.publish(pattern, message)
 
     async def send_event_with_defer(self, pattern, data=None, **kwargs):
-        message = json.dumps({"payload": parse_data(data)})
+        message = self.codec.encode({"payload": self.codec.encode_payload(data)})
         return await self.transport.publisher.publish(pattern, message)
\ No newline at end of file
@@ -1,4 +1,3 @@
-import json
 import traceback
 from inspect import isclass
 from typing import TypeVar
@@ -65,7 +64,7 @@ class RedisTransporter(BaseTransporter):
                     # Redis messages are dicts like:
                     #   {"type": "message", "channel": b"channel", "data": b"payload"}
                     channel = message.get("channel")
-                    data = message.get("data").decode()
+                    data = message.get("data")
 
                     if not data:
                         continue
@@ -75,7 +74,7 @@ class RedisTransporter(BaseTransporter):
                         "transporter": "redis",
                     }
                     try:
-                        envelope = json.loads(data)
+                        envelope = self.codec.decode(data)
                         correlation_id = envelope.get("correlationId")
                         raw_data = envelope.get("payload", data)
                     except Exception:
@@ -90,7 +89,10 @@ class RedisTransporter(BaseTransporter):
                         pattern=metadata["pattern"],
                         channel=metadata["pattern"],
                     )
-                    await self.event_bus.emit(context, metadata["pattern"], raw_data, metadata)
+                    await self.dispatcher.dispatch(
+                        context, metadata["pattern"], raw_data, metadata,
+                        key=correlation_id or metadata["pattern"]
+                    )
                 except Exception:
                     traceback.print_exc()
         except ConnectionError:
@@ -99,6 +101,7 @@ class RedisTransporter(BaseTransporter):
     async def close(self):
         """Closes the Redis connection."""
         self.is_stopped = True
+        await self.dispatcher.join()
         if self.publisher:
             await self.publisher.aclose(close_connection_pool=True)
         if self.subscriber:
@@ -0,0 +1,125 @@
+import asyncio
+import struct
+from typing import AsyncIterator, Literal
+
+
+FramingMode = Literal["newline", "length"]
+
+
+class FrameTooLargeError(ValueError):
+    """Raised when a frame exceeds `max_frame_size` of the TCP transport."""
+
+
+class Framing:
+    """
+    Splits TCP stream into messages.
+
+    `frames()` yields encoded messages without frame delimiters until the peer closes connection.
+    """
+
+    name: FramingMode
+    binary_safe: bool = False
+    """Whether encoded messages may contain any bytes (required by binary codecs)."""
+
+    def __init__(self, max_frame_size: int = 16 * 1024 * 1024):
+        if max_frame_size < 1:
+            raise ValueError("`max_frame_size` must be a positive number")
+
+        self.max_frame_size = max_frame_size
+
+    def encode(self, message: bytes) -> bytes:
+        raise NotImplementedError
+
+    def frames(self, reader: asyncio.StreamReader) -> AsyncIterator[bytes | memoryview]:
+        raise NotImplementedError
+
+
+class NewlineFraming(Framing):
+    """
+    Original framing of the TCP transport, every message is terminated with `\\n`.
+
+    Messages can't contain newlines, so it works only with text codecs.
+    """
+
+    name = "newline"
+
+    def encode(self, message: bytes) -> bytes:
+        return message + b"\n"
+
+    async def frames(self, reader: asyncio.StreamReader) -> AsyncIterator[bytes | memoryview]:
+        while line := await reader.readline():
+            yield line
+
+
+class LengthPrefixedFraming(Framing):
+    """
+    Every message is prefixed with its size as a 4 bytes big-endian unsigned integer.
+
+    Stream is read in chunks into a single reusable buffer, every frame fully received so far is yielded
+    as a `memoryview` of that buffer (valid until the next frame is requested), so messages are decoded
+    without scanning for delimiters or copying. Frames larger than `max_frame_size` are rejected on both sides.
+    """
+
+    name = "length"
+    binary_safe = True
+    header = struct.Struct(">I")
+    read_size = 64 * 1024
+
+    def encode(self, message: bytes) -> bytes:
+        size = len(message)
+        if size > self.max_frame_size:
+            raise FrameTooLargeError(f"Frame of {size} bytes exceeds `max_frame_size` of {self.max_frame_size} bytes")
+
+        return self.header.pack(size) + message
+
+    async def frames(self, reader: asyncio.StreamReader) -> AsyncIterator[bytes | memoryview]:
+        buffer = bytearray()
+        header_size = self.header.size
+
+        while chunk := await reader.read(self.read_size):
+            buffer += chunk
+            offset = 0
+
+            with memoryview(buffer) as view:
+                while len(buffer) - offset >= header_size:
+                    (size,) = self.header.unpack_from(buffer, offset)
+                    if size > self.max_frame_size:
+                        raise FrameTooLargeError(f"Frame of {size} bytes exceeds `max_frame_size` of {self.max_frame_size} bytes")
+
+                    end = offset + header_size + size
+                    if end > len(buffer):
+                        break
+
+                    frame = view[offset + header_size:end]
+                    try:
+                        yield frame
+                    finally:
+                        # Buffer can't be resized while frames still reference it
+                        frame.release()
+                    offset = end
+
+            # Keep only the incomplete frame at the start of the buffer
+            del buffer[:offset]
+
+
+FRAMINGS: dict[str, type[Framing]] = {
+    NewlineFraming.name: NewlineFraming,
+    LengthPrefixedFraming.name: LengthPrefixedFraming,
+}
+
+
+def get_framing(framing: FramingMode | None = None, max_frame_size: int | None = None) -> Framing:
+    """
+    Resolves framing from the `framing` and `max_frame_size` TCP transport options.
+
+    Raises:
+        ValueError: If framing name is unknown.
+    """
+    framing_cls = FRAMINGS.get(framing or NewlineFraming.name)
+    if framing_cls is None:
+        raise ValueError(f"Unknown framing `{framing}`, expected one of {', '.join(FRAMINGS)}")
+
+    if max_frame_size is None:
+        return framing_cls()
+
+    return framing_cls(max_frame_size)
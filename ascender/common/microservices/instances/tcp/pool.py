@@ -0,0 +1,226 @@
+import asyncio
+import itertools
+import random
+import traceback
+from typing import TYPE_CHECKING
+
+from ascender.common.microservices.instances.tcp.context import TCPContext
+from ascender.common.microservices.instances.tcp.event import TCPEventTransport
+from ascender.common.microservices.instances.tcp.rpc import TCPRPCTransport
+from ascender.common.microservices.types.pool import PoolStrategy
+from ascender.core import inject
+
+if TYPE_CHECKING:
+    from ascender.common.microservices.instances.tcp.client import TCPClient
+
+
+class TCPConnection:
+    """
+    Single pooled connection of `TCPClient`.
+
+    Connection is used as a writer by its own RPC and event transports, every RPC request is registered
+    in connection's pending requests, so requests fail fast once the connection is lost.
+    Frames are written whole and draining is serialized by a lock.
+    """
+
+    def __init__(self, client: "TCPClient", index: int):
+        self.client = client
+        self.index = index
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+        self.remote_addr = f"{client.host}:{client.port}"
+
+        self.rpc_transport = TCPRPCTransport(client, writer=self)  # type: ignore[arg-type]
+        self.event_transport = TCPEventTransport(client, writer=self)  # type: ignore[arg-type]
+        self._drain_lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self.writer is not None and not self.writer.is_closing()
+
+    @property
+    def pending(self) -> int:
+        """Amount of in-flight RPC requests sent over this connection."""
+        return len(self.rpc_transport.pending_requests)
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.client.host, self.client.port)
+
+    def write(self, data: bytes):
+        if not self.connected:
+            raise ConnectionError(f"TCP connection #{self.index} to {self.remote_addr} is not established")
+
+        self.writer.write(data)  # type: ignore[union-attr]
+
+    async def drain(self):
+        writer = self.writer
+        if writer is None:
+            raise ConnectionError(f"TCP connection #{self.index} to {self.remote_addr} is not established")
+
+        async with self._drain_lock:
+            await writer.drain()
+
+    async def read(self):
+        """
+        Reads messages until the server closes connection.
+        """
+        codec = self.client.codec
+        framing = self.client.framing
+        dispatcher = self.client.dispatcher
+
+        async for frame in framing.frames(self.reader):  # type: ignore[arg-type]
+            try:
+                message = codec.decode(frame)
+            except Exception:
+                continue
+
+            pattern = message.get("pattern")
+            correlation_id = message.get("correlationId")
+            metadata = {
+                "pattern": pattern,
+                "transporter": "tcp",
+                "remote_addr": self.client.host,
+            }
+            context = TCPContext.model_construct(
+                correlation_id=correlation_id,
+                is_event=not bool(correlation_id),
+                rpc_transport=self.rpc_transport,
+                event_transport=self.event_transport,
+                pattern=pattern,
+                remote_addr=self.client.host,
+            )
+            # Pass the received message to the event bus, blocks while dispatcher is saturated.
+            await dispatcher.dispatch(context, pattern, message.get("payload"), metadata, key=correlation_id or pattern)
+
+    async def close(self, reason: str = "closed"):
+        """
+        Closes connection and fails every in-flight request sent over it.
+        """
+        writer, self.reader, self.writer = self.writer, None, None
+        self.rpc_transport.pending_requests.reject_all(
+            ConnectionError(f"TCP connection #{self.index} to {self.remote_addr} {reason}")
+        )
+
+        if writer is None:
+            return
+
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+
+class TCPConnectionPool:
+    """
+    Pool of TCP connections used by `TCPClient`.
+
+    Requests and events are spread across connections by the configured strategy.
+    Dropped connections are reopened in background with exponential backoff and jitter,
+    while they are down, the remaining connections serve the traffic.
+    """
+
+    strategies: tuple[PoolStrategy, ...] = ("round_robin", "least_pending", "random")
+
+    def __init__(
+        self,
+        client: "TCPClient",
+        size: int = 1,
+        strategy: PoolStrategy = "round_robin",
+        reconnect: bool = True,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 10.0,
+    ):
+        if size < 1:
+            raise ValueError("Pool `size` must be a positive number")
+
+        if strategy not in self.strategies:
+            raise ValueError(f"Unknown pool strategy `{strategy}`, expected one of {', '.join(self.strategies)}")
+
+        self.client = client
+        self.strategy = strategy
+        self.reconnect = reconnect
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self.connections = [TCPConnection(client, index) for index in range(size)]
+        self.logger = inject("ASC_LOGGER")
+
+        self._turn = itertools.count()
+        self._tasks: set[asyncio.Task] = set()
+        self._closing = False
+
+    async def connect(self):
+        """
+        Opens every connection of the pool, fails if any of them can't be opened.
+        """
+        self._closing = False
+        await asyncio.gather(*(connection.open() for connection in self.connections))
+
+        for connection in self.connections:
+            task = asyncio.create_task(self._run(connection))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def acquire(self) -> TCPConnection:
+        """
+        Picks a connected connection according to the pool strategy.
+
+        Raises:
+            ConnectionError: If none of the connections is currently established.
+        """
+        connected = [connection for connection in self.connections if connection.connected]
+        if not connected:
+            raise ConnectionError(f"No TCP connection to {self.client.host}:{self.client.port} is available")
+
+        if self.strategy == "least_pending":
+            return min(connected, key=lambda connection: connection.pending)
+
+        if self.strategy == "random":
+            return random.choice(connected)
+
+        return connected[next(self._turn) % len(connected)]
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Reconnect delay of the attempt, exponential with jitter so clients don't reconnect all at once.
+        """
+        delay = min(self.max_backoff, self.initial_backoff * 2 ** attempt)
+        return random.uniform(delay / 2, delay)
+
+    async def close(self):
+        self._closing = True
+        for task in list(self._tasks):
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*(connection.close() for connection in self.connections))
+
+    async def _run(self, connection: TCPConnection):
+        while not self._closing:
+            try:
+                await connection.read()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                traceback.print_exc()
+
+            await connection.close("was lost")
+            if self._closing or not self.reconnect:
+                return
+
+            self.logger.warning(f"TCP connection #{connection.index} to {connection.remote_addr} was lost, reconnecting")
+            await self._reopen(connection)
+
+    async def _reopen(self, connection: TCPConnection):
+        for attempt in itertools.count():
+            await asyncio.sleep(self.backoff(attempt))
+            if self._closing:
+                return
+
+            try:
+                await connection.open()
+                self.logger.info(f"TCP connection #{connection.index} to {connection.remote_addr} is restored")
+                return
+            except OSError as e:
+                self.logger.debug(f"Reconnect attempt {attempt + 1} to {connection.remote_addr} failed: {e}")
@@ -1,13 +1,11 @@
 import asyncio
-import json
 import traceback
 from uuid import uuid4
-from reactivex import Subject, operators as ops, throw, timer
-from reactivex.scheduler.eventloop import AsyncIOScheduler
+from reactivex import from_future
 
 from ascender.common.microservices.abc.rpc_transport import RPCTransport
 from ascender.common.microservices.exceptions.rpc_exception import RPCException
-from ascender.common.microservices.utils.data_parser import decode_message, parse_data
+from ascender.common.microservices.utils.pending_requests import PendingRequests
 from ascender.core import inject
 from typing import TYPE_CHECKING, Any
 
@@ -15,105 +13,77 @@ if TYPE_CHECKING:
     from ascender.common.microservices.instances.tcp.context import TCPContext
     from ascender.common.microservices.instances.tcp.transporter import TCPTransporter
     from ascender.common.microservices.instances.tcp.client import TCPClient
+    from ascender.common.microservices.instances.tcp.pool import TCPConnection
 
 class TCPRPCTransport(RPCTransport):
     def __init__(
             self, 
             transport: "TCPTransporter | TCPClient", 
-            writer: asyncio.StreamWriter | None = None
+            writer: "asyncio.StreamWriter | TCPConnection | None" = None
         ):
         super().__init__(transport)
-        self.response_subject = Subject()
+        self.pending_requests = PendingRequests()
         self.logger = inject("ASC_LOGGER")
-        if transport.__class__.__name__ == "TCPClient":
-            self.writer = transport.writer
-        
-        else:
-            self.writer = writer
+        # Client side transports write into their pooled connection
+        self.writer = writer
+        self.framing = transport.framing
 
     async def send_request(self, pattern, data, timeout):
         """
         Sends a request over TCP and waits for the corresponding response.
         """
-        loop = asyncio.get_running_loop()
-        asyncio_scheduler = AsyncIOScheduler(loop)
         correlation_id = str(uuid4())
-        response = asyncio.Future()
-        response_received = asyncio.Event()
 
         envelope = {
             "pattern": pattern,
             "correlationId": correlation_id,
-            "payload": parse_data(data),
+            "payload": self.codec.encode_payload(data),
         }
-        message = json.dumps(envelope) + "\n"
-
-        def define_response(resp: Any):
-            if not response.done():
-                response.set_result(resp)
-            response_received.set()
-
-        def throw_error(err: Exception):
-            if not response.done():
-                response.set_exception(err)
-            response_received.set()
-
-        subscription = self.response_subject.pipe(
-            ops.subscribe_on(asyncio_scheduler),
-            ops.timeout(timeout, throw(TimeoutError("Response timed out."))),
-            ops.filter(lambda pair: pair[0] == f"response-{correlation_id}"),
-            ops.first(),
-            ops.map(lambda pair: pair[1]),
-        ).subscribe(
-            on_next=define_response,
-            on_error=throw_error,
-        )
+        message = self.framing.encode(self.codec.encode(envelope))
+
+        response = self.pending_requests.register(correlation_id, timeout)
 
         self.logger.debug(f"Sending message to {pattern} with correlation ID {correlation_id}")
         
         # Send the message
-        self.writer.write(message.encode())
-        await self.writer.drain()
-
+        try:
+            self.writer.write(message)
+            await self.writer.drain()
+        except BaseException:
+            response.cancel()
+            raise
 
         self.logger.info(f"Successfully sent message pattern {pattern}")
         self.logger.debug(f"Now waiting for response from pattern {pattern}")
 
-        await response_received.wait()
-        subscription.dispose()
+        result = await response
 
         self.logger.info(f"Received response for pattern {pattern}")
         
-        return await response
+        return result
 
     async def send_nack_request(self, pattern, data, timeout):
         """
         Sends a request without awaiting its response immediately.
         Returns an RxPY observable.
         """
-        loop = asyncio.get_running_loop()
-        asyncio_scheduler = AsyncIOScheduler(loop)
         correlation_id = str(uuid4())
         envelope = {
             "pattern": pattern,
             "correlationId": correlation_id,
-            "payload": parse_data(data),
+            "payload": self.codec.encode_payload(data),
         }
-        message = json.dumps(envelope) + "\n"
-        self.writer.write(message.encode())
-        await self.writer.drain()
+        message = self.framing.encode(self.codec.encode(envelope))
 
-        observable = self.response_subject.pipe(
-            ops.subscribe_on(asyncio_scheduler),
-            ops.timeout_with_mapper(
-                timer(timeout),
-                lambda _: throw(TimeoutError("Response timed out."))
-            ),
-            ops.filter(lambda pair: pair[0] == f"response-{correlation_id}"),
-            ops.first(),
-            ops.map(lambda pair: pair[1]),
-        )
-        return observable
+        response = self.pending_requests.register(correlation_id, timeout)
+        try:
+            self.writer.write(message)
+            await self.writer.drain()
+        except BaseException:
+            response.cancel()
+            raise
+
+        return from_future(response)
 
     async def send_response(self, pattern, correlation_id, response):
         """
@@ -124,10 +94,10 @@ class TCPRPCTransport(RPCTransport):
         envelope = {
             "correlationId": correlation_id,
             "pattern": pattern,
-            "payload": response.decode(),
+            "payload": self.codec.encode_payload(response),
         }
-        message = json.dumps(envelope) + "\n"
-        self.writer.write(message.encode())
+        message = self.framing.encode(self.codec.encode(envelope))
+        self.writer.write(message)
         await self.writer.drain()
 
     async def raise_exception(self, pattern, correlation_id, exception):
@@ -139,9 +109,9 @@ class TCPRPCTransport(RPCTransport):
             "pattern": pattern,
             "payload": exception.to_dict(),
         }
-        message = json.dumps(envelope) + "\n"
+        message = self.framing.encode(self.codec.encode(envelope))
         try:
-            self.writer.write(message.encode())
+            self.writer.write(message)
             await self.writer.drain()
         except:
             traceback.print_exc()
@@ -149,19 +119,7 @@ class TCPRPCTransport(RPCTransport):
     async def process_response(self, correlation_id, response, **kwargs):
         if not correlation_id:
             return
-        if not (correlation_id.startswith("response-") or correlation_id.startswith("defer-")):
-            return
-        try:
-            decoded = decode_message(response)
-        except Exception:
-            decoded = response
-        
-        if isinstance(decoded, dict):
-            if RPCException.is_exception(decoded):
-                self.response_subject.on_error(RPCException.from_dict(decoded))
-                return
-
-        self.response_subject.on_next((correlation_id, decoded, kwargs))
+        self.pending_requests.dispatch(correlation_id, response, self.codec.decode_payload)
 
     async def listen_for_requests(self, context: "TCPContext", data: Any, metadata: dict) -> None:
         """
@@ -1,5 +1,5 @@
 import asyncio
-import json
+import logging
 import traceback
 from inspect import isclass
 from typing import TypeVar
@@ -7,7 +7,9 @@ from typing import TypeVar
 from ascender.common.microservices.abc.transporter import BaseTransporter
 from ascender.common.microservices.instances.tcp.context import TCPContext
 from ascender.common.microservices.instances.tcp.event import TCPEventTransport
+from ascender.common.microservices.instances.tcp.framing import get_framing
 from ascender.common.microservices.instances.tcp.rpc import TCPRPCTransport
+from ascender.core import inject
 
 
 T = TypeVar("T")
@@ -32,46 +34,51 @@ class TCPTransporter(BaseTransporter):
         self.host = self.configs.get("host", "0.0.0.0")
         self.port = self.configs.get("port", 8888)
         self.server = None
+        self.logger = inject("ASC_LOGGER")
 
-        # Although server responses will usually be sent via the TCPContext's writer,
-        # we create RPC and Event transport objects for uniformity.
-        # self.rpc_transport = TCPRPCTransport(self)
-        # self.event_transport = TCPEventTransport(self)
+        self.framing = get_framing(self.configs.get("framing"), self.configs.get("max_frame_size"))
+        if self.codec.binary and not self.framing.binary_safe:
+            raise ValueError(f"Binary `{self.codec.name}` codec requires length-prefixed framing, set `\"framing\": \"length\"` option")
 
     async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         remote_addr = writer.get_extra_info("peername")
+        peer = str(remote_addr)
+
+        # Transports are bound to the connection's writer, so they're shared by all of its messages
+        rpc_transport = TCPRPCTransport(self, writer=writer)
+        event_transport = TCPEventTransport(self, writer=writer)
         try:
-            while True:
-                line = await reader.readline()
-                if not line:
-                    break
+            async for frame in self.framing.frames(reader):
                 try:
-                    message = json.loads(line.decode())
+                    message = self.codec.decode(frame)
                 except Exception:
                     continue
                 pattern = message.get("pattern")
                 correlation_id = message.get("correlationId")
-                payload = message.get("payload")
                 metadata = {
                     "pattern": pattern,
                     "transporter": "tcp",
                     "remote_addr": remote_addr,
                 }
-                # Create a TCPContext that includes the writer.
-                context = TCPContext(
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Received message from {peer} on pattern {pattern} with correlation ID {correlation_id}")
+
+                # Fields are built by the transporter itself, so the context skips validation
+                context = TCPContext.model_construct(
                     correlation_id=correlation_id,
                     is_event=not bool(correlation_id),
-                    rpc_transport=TCPRPCTransport(self, writer=writer),
-                    event_transport=TCPEventTransport(self, writer=writer),
+                    rpc_transport=rpc_transport,
+                    event_transport=event_transport,
                     pattern=pattern,
-                    remote_addr=str(remote_addr),
+                    remote_addr=peer,
                 )
-                print(message)
-                # Pass the received message to the event bus.
-                await self.event_bus.emit(context, pattern, payload, metadata)
+                # Pass the received message to the event bus, blocks while dispatcher is saturated.
+                await self.dispatcher.dispatch(context, pattern, message.get("payload"), metadata, key=correlation_id or pattern)
         except Exception:
             traceback.print_exc()
         finally:
+            rpc_transport.detach()
+            rpc_transport.pending_requests.reject_all(ConnectionError(f"TCP connection of {peer} was closed"))
             writer.close()
             await writer.wait_closed()
 
@@ -79,9 +86,9 @@ class TCPTransporter(BaseTransporter):
         """
         Starts the TCP server and listens for incoming connections.
         """
-        print("Running server...")
         self.is_stopped = False
         self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.logger.info(f"TCP transporter is listening on {self.host}:{self.port}")
         
         async with self.server:
             await self.server.serve_forever()
@@ -94,6 +101,8 @@ class TCPTransporter(BaseTransporter):
         if self.server:
             self.server.close()
             await self.server.wait_closed()
+        
+        await self.dispatcher.join()
 
     def unwrap(self, rtype: type[T]) -> T:
         """
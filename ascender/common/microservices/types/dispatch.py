@@ -0,0 +1,18 @@
+from typing import Literal, TypedDict
+
+
+DispatchMode = Literal["inline", "concurrent", "ordered"]
+
+
+class DispatchOptions(TypedDict, total=False):
+    """
+    Options of the transporter's message dispatching, passed as `"dispatch"` key of transport options.
+
+    Modes:
+        - `inline`: Handlers are awaited inside of the listen loop, one message at a time (default).
+        - `concurrent`: Handlers run as separate tasks, at most `max_in_flight` at the same time.
+        - `ordered`: Same as `concurrent`, but messages sharing the same key (partition key or correlation id)
+            are handled sequentially in the order they were received.
+    """
+    mode: DispatchMode
+    max_in_flight: int
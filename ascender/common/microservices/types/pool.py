@@ -0,0 +1,25 @@
+from typing import Literal, TypedDict
+
+
+PoolStrategy = Literal["round_robin", "least_pending", "random"]
+
+
+class PoolOptions(TypedDict, total=False):
+    """
+    Options of the TCP client's connection pool, passed as `"pool"` key of transport options.
+
+    Attributes:
+        size (int): Amount of connections opened to the server. Defaults to `1`.
+        strategy (PoolStrategy): How a connection is picked for every request / event:
+            - `round_robin`: Connections are used in turns (default).
+            - `least_pending`: Connection with the least in-flight RPC requests is used.
+            - `random`: Random connection is used.
+        reconnect (bool): Reconnect dropped connections automatically. Defaults to `True`.
+        initial_backoff (float): First reconnect delay in seconds, doubled after every failed attempt. Defaults to `0.1`.
+        max_backoff (float): Upper bound of the reconnect delay in seconds. Defaults to `10.0`.
+    """
+    size: int
+    strategy: PoolStrategy
+    reconnect: bool
+    initial_backoff: float
+    max_backoff: float
@@ -1,11 +1,13 @@
 import json
 from typing import Any, Type, TypeVar
 
-from pydantic import BaseModel, ValidationError, TypeAdapter
+from pydantic import BaseModel
+
+from ascender.common.type_adapter import get_type_adapter
 
 T = TypeVar("T")
 
-def validate_json(json_data: str, expected_type: Type[T]) -> T:
+def validate_json(json_data: str | bytes, expected_type: Type[T]) -> T:
     """
     Validate and parse a JSON string into the specified type.
 
@@ -15,7 +17,7 @@ def validate_json(json_data: str, expected_type: Type[T]) -> T:
     using Pydantic's `parse_obj_as` function.
 
     Parameters:
-        json_data (str): The JSON string to validate.
+        json_data (str | bytes): The JSON string to validate.
         expected_type (Type[T]): The type into which to parse the data. This
             can be a Pydantic model class or any valid Python type (including
             complex types like List[int], Dict[str, Any], etc.).
@@ -26,13 +28,13 @@ def validate_json(json_data: str, expected_type: Type[T]) -> T:
     Raises:
         ValueError: If the JSON is malformed or if the data fails validation.
     """
-    if issubclass(expected_type, BaseModel):
+    if isinstance(expected_type, type) and issubclass(expected_type, BaseModel):
         result = expected_type.model_validate_json(json_data)
         
         return result
     
     # Validate and convert the data to the expected type
-    result = TypeAdapter(expected_type).validate_json(json_data)
+    result = get_type_adapter(expected_type).validate_json(json_data)
 
     return result
 
@@ -58,13 +60,13 @@ def validate_python(obj: Any, expected_type: Type[T]) -> T:
     Raises:
         ValueError: If the JSON is malformed or if the data fails validation.
     """
-    if issubclass(expected_type, BaseModel):
+    if isinstance(expected_type, type) and issubclass(expected_type, BaseModel):
         result = expected_type.model_validate(obj)
         
         return result
     
     # Validate and convert the data to the expected type
-    result = TypeAdapter(expected_type).validate_python(obj)
+    result = get_type_adapter(expected_type).validate_python(obj)
 
     return result
 
@@ -0,0 +1,132 @@
+import asyncio
+from collections import deque
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Hashable
+
+from ascender.common.microservices.abc.context import BaseContext
+from ascender.common.microservices.types.dispatch import DispatchMode
+
+
+class MessageDispatcher:
+    """
+    Dispatches messages received by transporter's listen loop to the event bus.
+
+    In `inline` mode the handler is awaited directly, so one slow handler stalls every later message.
+    In `concurrent` and `ordered` modes handlers run as tasks bounded by `max_in_flight`,
+    once the limit is reached `dispatch()` blocks, which pauses reading from the broker (backpressure).
+
+    Counters:
+        in_flight (int): Messages whose handlers are currently running.
+        queue_depth (int): Messages accepted in `ordered` mode, waiting for previous message with the same key.
+    """
+
+    modes: tuple[DispatchMode, ...] = ("inline", "concurrent", "ordered")
+
+    def __init__(
+        self,
+        handler: Callable[[BaseContext, str, Any, Any], Awaitable[None]],
+        mode: DispatchMode = "inline",
+        max_in_flight: int = 64,
+    ):
+        if mode not in self.modes:
+            raise ValueError(f"Unknown dispatch mode `{mode}`, expected one of {', '.join(self.modes)}")
+
+        if max_in_flight < 1:
+            raise ValueError("`max_in_flight` must be a positive number")
+
+        self.handler = handler
+        self.mode = mode
+        self.max_in_flight = max_in_flight
+
+        self.in_flight = 0
+        self.queue_depth = 0
+
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._tasks: set[asyncio.Task] = set()
+        self._queues: dict[Hashable, deque[tuple]] = {}
+        self.logger = getLogger("Ascender Framework")
+
+    async def dispatch(
+        self,
+        context: BaseContext,
+        pattern: str,
+        data: Any,
+        metadata: Any,
+        key: Hashable | None = None
+    ) -> None:
+        """
+        Dispatches single message.
+
+        Args:
+            context (BaseContext): Context of the message.
+            pattern (str): Pattern (topic, channel) of the message.
+            data (Any): Raw payload.
+            metadata (Any): Transporter's metadata.
+            key (Hashable | None, optional): Ordering key, used only in `ordered` mode. Defaults to None.
+        """
+        message = (context, pattern, data, metadata)
+
+        if self.mode == "inline":
+            await self._handle(message)
+            return
+
+        # Blocks the listen loop once `max_in_flight` messages are being processed
+        await self._slots.acquire()
+
+        if self.mode == "concurrent" or key is None:
+            self._spawn(self._run(message))
+            return
+
+        queue = self._queues.get(key)
+        if queue is not None:
+            queue.append(message)
+            self.queue_depth += 1
+            return
+
+        self._queues[key] = deque()
+        self._spawn(self._run_ordered(key, message))
+
+    async def join(self) -> None:
+        """
+        Waits until all dispatched messages are handled, used on transporter shutdown.
+        """
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _handle(self, message: tuple):
+        self.in_flight += 1
+        try:
+            await self.handler(*message)
+        finally:
+            self.in_flight -= 1
+
+    async def _run(self, message: tuple):
+        try:
+            await self._handle(message)
+        except Exception as e:
+            self.logger.exception("Unexpected error while handling message: %s", e)
+        finally:
+            self._slots.release()
+
+    async def _run_ordered(self, key: Hashable, message: tuple):
+        queue = self._queues[key]
+        try:
+            while True:
+                await self._run(message)
+                if not queue:
+                    break
+
+                message = queue.popleft()
+                self.queue_depth -= 1
+        finally:
+            # Release slots of messages left behind if the worker was cancelled
+            self.queue_depth -= len(queue)
+            for _ in queue:
+                self._slots.release()
+
+            del self._queues[key]
+
+    def _spawn(self, coro: Awaitable[None]):
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
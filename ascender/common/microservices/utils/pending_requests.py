@@ -0,0 +1,170 @@
+import asyncio
+from typing import Any, Callable
+
+from ascender.common.microservices.exceptions.rpc_exception import RPCException
+from ascender.common.microservices.utils.data_parser import decode_message
+
+
+class PendingRequest:
+    """
+    Single in-flight RPC request, owns the future awaited by the producer and its timeout handle.
+    """
+    __slots__ = ("future", "timeout", "handle")
+
+    def __init__(self, future: asyncio.Future, timeout: float):
+        self.future = future
+        self.timeout = timeout
+        self.handle: asyncio.TimerHandle | None = None
+
+
+class PendingRequests:
+    """
+    Registry of in-flight RPC requests keyed by correlation id.
+
+    Every RPC transport owns one registry. Outgoing requests are registered before they are sent,
+    incoming `response-<id>` and `defer-<id>` messages are routed with a single dict lookup,
+    so a response completes exactly one future regardless of how many requests are pending.
+
+    Entries remove themselves once their future is done (resolved, rejected, timed out or cancelled).
+    """
+
+    RESPONSE_PREFIX = "response"
+    DEFER_PREFIX = "defer"
+
+    def __init__(self):
+        self._pending: dict[str, PendingRequest] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, correlation_id: str) -> bool:
+        return correlation_id in self._pending
+
+    def register(self, correlation_id: str, timeout: float) -> asyncio.Future:
+        """
+        Registers a new pending request and arms its timeout.
+
+        Args:
+            correlation_id (str): Correlation id of the outgoing request (without prefix).
+            timeout (float): Timeout in seconds, the future fails with `TimeoutError` once it elapses.
+
+        Returns:
+            asyncio.Future: Future which will be completed with the decoded response.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        entry = PendingRequest(future, timeout)
+        entry.handle = loop.call_later(timeout, self._expire, correlation_id)
+
+        self._pending[correlation_id] = entry
+        future.add_done_callback(lambda _: self._discard(correlation_id, entry))
+
+        return future
+
+    def resolve(self, correlation_id: str, result: Any) -> bool:
+        """
+        Completes pending request with result.
+
+        Returns:
+            bool: False if there's no pending request with this correlation id.
+        """
+        entry = self._pending.get(correlation_id)
+        if entry is None or entry.future.done():
+            return False
+
+        entry.future.set_result(result)
+        return True
+
+    def reject(self, correlation_id: str, exception: BaseException) -> bool:
+        """
+        Fails pending request with an exception.
+
+        Returns:
+            bool: False if there's no pending request with this correlation id.
+        """
+        entry = self._pending.get(correlation_id)
+        if entry is None or entry.future.done():
+            return False
+
+        entry.future.set_exception(exception)
+        return True
+
+    def defer(self, correlation_id: str) -> bool:
+        """
+        Prolongs the timeout of pending request, requested by consumer side with `defer_response()`.
+
+        The timeout is re-armed for twice the original timeout, counting from the moment of defer.
+
+        Returns:
+            bool: False if there's no pending request with this correlation id.
+        """
+        entry = self._pending.get(correlation_id)
+        if entry is None or entry.future.done():
+            return False
+
+        if entry.handle is not None:
+            entry.handle.cancel()
+
+        loop = entry.future.get_loop()
+        entry.handle = loop.call_later(entry.timeout + entry.timeout, self._expire, correlation_id)
+        return True
+
+    def dispatch(
+        self, 
+        correlation_id: str, 
+        response: Any, 
+        decoder: Callable[[Any], Any] = decode_message
+    ) -> bool:
+        """
+        Routes incoming RPC message with prefixed correlation id (`response-<id>` or `defer-<id>`)
+        to its pending request.
+
+        Responses are decoded, if response is serialized `RPCException` the pending request fails with it.
+
+        Args:
+            correlation_id (str): Prefixed correlation id received from the broker.
+            response (Any): Raw response payload.
+            decoder (Callable[[Any], Any], optional): Decodes the payload, usually `Codec.decode_payload`.
+                Called only for responses of pending requests. Defaults to `decode_message`.
+
+        Returns:
+            bool: True if message was routed to a pending request.
+        """
+        kind, _, request_id = correlation_id.partition("-")
+        if request_id not in self._pending:
+            return False
+
+        if kind == self.DEFER_PREFIX:
+            return self.defer(request_id)
+
+        if kind != self.RESPONSE_PREFIX:
+            return False
+
+        decoded = decoder(response)
+        if isinstance(decoded, dict) and RPCException.is_exception(decoded):
+            return self.reject(request_id, RPCException.from_dict(decoded))
+
+        return self.resolve(request_id, decoded)
+
+    def reject_all(self, exception: BaseException) -> int:
+        """
+        Fails every pending request, used when underlying connection is lost.
+
+        Returns:
+            int: Amount of rejected requests.
+        """
+        rejected = 0
+        for correlation_id in list(self._pending):
+            rejected += self.reject(correlation_id, exception)
+
+        return rejected
+
+    def _expire(self, correlation_id: str):
+        self.reject(correlation_id, TimeoutError("Response timed out."))
+
+    def _discard(self, correlation_id: str, entry: PendingRequest):
+        if entry.handle is not None:
+            entry.handle.cancel()
+
+        if self._pending.get(correlation_id) is entry:
+            del self._pending[correlation_id]
@@ -0,0 +1,136 @@
+from typing import Hashable
+
+
+class _TrieNode:
+    __slots__ = ("children", "star", "is_star", "patterns")
+
+    def __init__(self, is_star: bool = False):
+        self.children: dict[str, _TrieNode] = {}
+        self.star: _TrieNode | None = None
+        self.is_star = is_star
+        self.patterns: set[str] = set()
+
+    def is_empty(self) -> bool:
+        return not (self.children or self.star or self.patterns)
+
+
+class TopicRouter:
+    """
+    Matches topics against subscribed patterns.
+
+    Patterns without `*` are matched with a dict lookup. Wildcard patterns (where `*` matches any sequence
+    of characters, e.g. `USER_*`) are stored in a character trie, matching walks the trie once per topic,
+    so lookup cost depends on the topic length rather than the amount of subscribed patterns.
+
+    Patterns are added and removed incrementally.
+    """
+
+    def __init__(self):
+        self._exact: set[Hashable] = set()
+        self._root = _TrieNode()
+        self._wildcards = 0
+
+    def add(self, pattern: Hashable) -> None:
+        if not self.is_wildcard(pattern):
+            self._exact.add(pattern)
+            return
+
+        node = self._root
+        for char in pattern:  # type: ignore[union-attr]
+            if char == "*":
+                # Consecutive wildcards are equivalent to a single one
+                if not node.is_star:
+                    if node.star is None:
+                        node.star = _TrieNode(is_star=True)
+                    node = node.star
+                continue
+
+            node = node.children.setdefault(char, _TrieNode())
+
+        if pattern not in node.patterns:
+            node.patterns.add(pattern)  # type: ignore[arg-type]
+            self._wildcards += 1
+
+    def remove(self, pattern: Hashable) -> None:
+        if not self.is_wildcard(pattern):
+            self._exact.discard(pattern)
+            return
+
+        path: list[tuple[_TrieNode, str]] = []
+        node = self._root
+        for char in pattern:  # type: ignore[union-attr]
+            if char == "*":
+                if node.is_star:
+                    continue
+                next_node = node.star
+            else:
+                next_node = node.children.get(char)
+
+            if next_node is None:
+                return
+
+            path.append((node, char))
+            node = next_node
+
+        if pattern not in node.patterns:
+            return
+
+        node.patterns.discard(pattern)  # type: ignore[arg-type]
+        self._wildcards -= 1
+
+        # Prune branches which are left without patterns
+        for parent, char in reversed(path):
+            if not node.is_empty():
+                break
+
+            if char == "*":
+                parent.star = None
+            else:
+                del parent.children[char]
+            node = parent
+
+    def match(self, topic: Hashable) -> list[Hashable]:
+        """
+        Returns every pattern matching the topic, exact pattern goes first.
+        """
+        matched: list[Hashable] = [topic] if topic in self._exact else []
+
+        if not self._wildcards or not isinstance(topic, str):
+            return matched
+
+        active = self._closure([self._root])
+        for char in topic:
+            step: list[_TrieNode] = []
+            for node in active:
+                if node.is_star:
+                    step.append(node)
+                child = node.children.get(char)
+                if child is not None:
+                    step.append(child)
+
+            if not step:
+                return matched
+
+            active = self._closure(step)
+
+        for node in active:
+            matched.extend(node.patterns)
+
+        return matched
+
+    @staticmethod
+    def is_wildcard(pattern: Hashable) -> bool:
+        return isinstance(pattern, str) and "*" in pattern
+
+    @staticmethod
+    def _closure(nodes: list[_TrieNode]) -> list[_TrieNode]:
+        # `*` matches empty sequence as well, so wildcard children are active right away
+        closure: list[_TrieNode] = []
+        seen: set[int] = set()
+        for node in nodes:
+            while node is not None and id(node) not in seen:
+                seen.add(id(node))
+                closure.append(node)
+                node = node.star  # type: ignore[assignment]
+
+        return closure
@@ -1,4 +1,4 @@
-from typing import Callable, Generic, TypeVar
+from typing import AsyncIterable, AsyncIterator, Callable, Generic, TypeVar
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -72,3 +72,19 @@ class QuerySetSerializer(Generic[E, T]):
         for item in entities:
             ser = serializer(item, **func(item))
             yield ser()
+
+
+    @staticmethod
+    async def base_serialize_stream(pd_model: type[T], entities: AsyncIterable[E],
+                                    func: Callable[[E], dict] = serialize_values_default) -> AsyncIterator[T]:
+        # Entities are serialized one by one as they arrive, e.g. from `Constructor.stream()`
+        async for item in entities:
+            ser = Serializer(pd_model, item, **func(item))
+            yield ser()
+
+    @staticmethod
+    async def serialize_stream(serializer: Serializer[T, E], entities: AsyncIterable[E],
+                               func: Callable[[E], dict] = serialize_values_default) -> AsyncIterator[T]:
+        async for item in entities:
+            ser = serializer(item, **func(item))
+            yield ser()
@@ -0,0 +1,30 @@
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter
+
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=512)
+def _cached_type_adapter(expected_type: Any) -> TypeAdapter:
+    return TypeAdapter(expected_type)
+
+
+def get_type_adapter(expected_type: type[T] | Any) -> TypeAdapter[T]:
+    """
+    Returns pydantic `TypeAdapter` for the type, building the validator schema only once per type.
+
+    Adapters are kept in a bounded LRU cache, unhashable types (which can't be cached) get a fresh adapter.
+
+    Args:
+        expected_type (type[T] | Any): Any type supported by pydantic, e.g. `list[Model]`, `dict[str, int]` or unions.
+
+    Returns:
+        TypeAdapter[T]: Adapter for the type.
+    """
+    try:
+        return _cached_type_adapter(expected_type)
+    except TypeError:
+        return TypeAdapter(expected_type)
@@ -1,4 +1,15 @@
-from ..core.repositories import Repository, IdentityRepository
-from ..core.services import Service
+from typing import TYPE_CHECKING
 
-__all__ = ["Repository", "IdentityRepository", "Service"]
\ No newline at end of file
+from ascender._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ..core.repositories import Repository, IdentityRepository
+    from ..core.services import Service
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    "Repository": "..core.repositories",
+    "IdentityRepository": "..core.repositories",
+    "Service": "..core.services",
+})
+
+__all__ = ["Repository", "IdentityRepository", "Service"]
@@ -8,8 +8,7 @@ from ascender.core.di.interface.provider import Provider
 def useMiddlewares(*middlewares: AscenderMiddleware) -> Sequence[Provider]:
     def middleware_factory(middleware: AscenderMiddleware):
         def middleware_wrapper(app: ASGIApp):
-            middleware.app = app
-            return middleware
+            return middleware.bind(app)
         
         return middleware_wrapper
     
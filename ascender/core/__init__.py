@@ -3,27 +3,73 @@ Core module initializer.
 
 Exposes key components of the framework's core functionalities, 
 including database entities, engines, dependency injection, and CLI utilities.
+
+Names are imported on first access (PEP 562), so importing `inject` or `Controller`
+doesn't load SQLAlchemy or the CLI engine.
 """
+from typing import TYPE_CHECKING
+
+from ascender._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .struct.controller import Controller
+    from .struct.controller_hook import ControllerDecoratorHook
+    from .struct.routes import Get, Post, Put, Patch, Delete
+    from .di.interface.provider import Provider
+
+    from .di.inject import Inject
+    from .di.injectfn import inject
+    from .di.abc.base_injector import Injector
+    from .di.test_injector import TestInjector
+    from .struct.module import AscModule
+    from .services import Service, LifecycleService
+    from .repositories import Repository, IdentityRepository
 
-from .struct.controller import Controller
-from .struct.controller_hook import ControllerDecoratorHook
-from .struct.routes import Get, Post, Put, Patch, Delete
-from .di.interface.provider import Provider
+    from .database import AppDBContext
 
-from .di.inject import Inject
-from .di.injectfn import inject
-from .di.abc.base_injector import Injector
-from .di.test_injector import TestInjector
-from .struct.module import AscModule
-from .services import Service, LifecycleService
-from .repositories import Repository, IdentityRepository
+    from .applications.application import Application
+    from .applications.lifecycle import provideLifecycle
 
-from .database import AppDBContext
+    from . import cli_engine
+    from .cli_engine import (CLIEngine, BasicCLI, GenericCLI, Command, Handler, useCLI,
+                             Parameter, BooleanParameter, ConstantParameter)
 
-from .applications.application import Application
-from .applications.lifecycle import provideLifecycle
+_cli_engine_exports = [
+    "CLIEngine",
+    "BasicCLI",
+    "GenericCLI",
+    "Command",
+    "Handler",
+    "useCLI",
+    "Parameter",
+    "BooleanParameter",
+    "ConstantParameter",
+]
 
-from . import cli_engine
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    "Controller": ".struct.controller",
+    "ControllerDecoratorHook": ".struct.controller_hook",
+    "Get": ".struct.routes",
+    "Post": ".struct.routes",
+    "Put": ".struct.routes",
+    "Patch": ".struct.routes",
+    "Delete": ".struct.routes",
+    "Provider": ".di.interface.provider",
+    "Inject": ".di.inject",
+    "inject": ".di.injectfn",
+    "Injector": ".di.abc.base_injector",
+    "TestInjector": ".di.test_injector",
+    "AscModule": ".struct.module",
+    "Service": ".services",
+    "LifecycleService": ".services",
+    "Repository": ".repositories",
+    "IdentityRepository": ".repositories",
+    "AppDBContext": ".database",
+    "Application": ".applications.application",
+    "provideLifecycle": ".applications.lifecycle",
+    "cli_engine": ".cli_engine",
+    **{name: ".cli_engine" for name in _cli_engine_exports},
+})
 
 __all__ = [
     "Injector",
@@ -46,5 +92,5 @@ __all__ = [
     "ControllerDecoratorHook",
     "LifecycleService",
     "provideLifecycle",
-    *cli_engine.__all__
-] # type: ignore
\ No newline at end of file
+    *_cli_engine_exports
+] # type: ignore
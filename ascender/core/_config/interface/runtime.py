@@ -1,6 +1,6 @@
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class OverrideConfig(BaseModel):
@@ -21,7 +21,19 @@ class LoggingRotationConfig(BaseModel):
     backup_count: int = Field(5, ge=1, description="Number of backup files to keep.")
 
 
+class LoggingQueueConfig(BaseModel):
+    max_size: int = Field(
+        10000, ge=1, description="Maximum amount of log records waiting to be written."
+    )
+    drop_policy: Literal["drop_new", "drop_oldest", "block"] = Field(
+        "drop_new",
+        description="What to do with a record when the queue is full: drop it, drop the oldest queued one or wait for space.",
+    )
+
+
 class LoggingConfig(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
     level: Literal["debug", "info", "warn", "error", "critical"] = Field(
         "info", description="Logging level."
     )
@@ -34,6 +46,14 @@ class LoggingConfig(BaseModel):
     rotation: Optional[LoggingRotationConfig] = Field(
         None, description="Log rotation settings."
     )
+    async_: bool = Field(
+        False,
+        alias="async",
+        description="Whether log records are written by a background thread instead of the logging thread.",
+    )
+    queue: LoggingQueueConfig = Field(
+        LoggingQueueConfig(), description="Queue settings of asynchronous logging."
+    )
 
 
 class BuildConfig(BaseModel):
@@ -78,6 +98,10 @@ class DependencyInjectionConfig(BaseModel):
     circularDependencyHandling: Literal["warn", "error"] = Field(
         "warn", description="Action to take when circular dependencies are detected."
     )
+    eagerInstantiation: bool = Field(
+        False,
+        description="Whether to validate the provider graph and instantiate all providers on application creation.",
+    )
     overrides: OverrideConfig = Field(
         OverrideConfig(
             enabled=False, injector="ascender.core.di.injector.AscenderInjector"
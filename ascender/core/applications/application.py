@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import os
 from collections import defaultdict
 from typing import Any, Callable, Iterable, Sequence
@@ -5,6 +7,7 @@ from typing import Any, Callable, Iterable, Sequence
 from fastapi import FastAPI
 
 from ascender.abc.middleware import AscenderMiddleware
+from ascender.core.di.middleware import RequestScopeMiddleware
 from ascender.common.api_docs import DefineAPIDocs
 from ascender.core._config.asc_config import _AscenderConfig
 from ascender.core._config.static_files import configure_staticfile_serving
@@ -14,6 +17,7 @@ from ascender.core.cli_engine import BasicCLI, CLIEngine, GenericCLI
 from ascender.core.database.engine import DatabaseEngine
 from ascender.core.errors.lifecycle_error import LifecycleError
 from ascender.core.logger._logger import configure_logger
+from ascender.core.logger.async_handler import AsyncQueueHandler
 from ascender.core.router.graph import RouterGraph
 from ascender.core.services import LifecycleService
 
@@ -82,6 +86,9 @@ class Application:
         for middleware in self.middleware_settings:
             self.app.add_middleware(middleware)  # type: ignore
 
+        # Outermost, so middlewares can inject `request` scoped providers too
+        self.app.add_middleware(RequestScopeMiddleware)
+
     def is_ok(self) -> bool:
         """
         Checks if the application has been properly initialized with a root injector.
@@ -167,6 +174,7 @@ class Application:
         self.start_lifecycle()
         logger = configure_logger(_AscenderConfig().config.logging)
         logger.setLevel(environment.logging.upper())
+        self.__flush_logs_on_shutdown(logger)
 
         # 2. Mount the route graph onto FastAPI
         self.router_graph.create_router_graph(self)
@@ -174,6 +182,14 @@ class Application:
         self._booted = True
         return self.app
 
+    def __flush_logs_on_shutdown(self, logger: logging.Logger):
+        for handler in logger.handlers:
+            if isinstance(handler, AsyncQueueHandler):
+                async def flush(handler: AsyncQueueHandler = handler):
+                    await asyncio.to_thread(handler.stop)
+
+                self.add_event_handler("shutdown", flush)
+
     def __call__(self) -> FastAPI:
         # Uvicorn `factory=True` entrypoint — delegates to the explicit, idempotent
         # boot pipeline rather than carrying the startup logic itself.
@@ -7,6 +7,8 @@ from ascender.core.cli.provider import provideCLI
 from ascender.core.cli_engine.provider import useCLI
 from ascender.core.database.engine import DatabaseEngine
 from ascender.core.di.abc.base_injector import Injector
+from ascender.core.di.eager import DependencyGraph
+from ascender.core.di.injector import AscenderInjector
 from ascender.core.di.interface.provider import Provider
 from ascender.core.router.graph import RouterGraph
 from ascender.core.struct.module_ref import AscModuleRef
@@ -64,6 +66,7 @@ def createApplication(
     if app_module is None and config is not None:
         # Configuration-based application creation
         root_injector.create(config["providers"] + internal_providers)
+        _eager_instantiation(root_injector.existing_injector)
 
         return root_injector.get(Application)  # type: ignore
 
@@ -78,9 +81,34 @@ def createApplication(
         app_injector = app_module.__asc_module__.create_module(
             root_injector.existing_injector
         )
+        _eager_instantiation(root_injector.existing_injector)
+
         return app_injector._injector.get(Application)  # type: ignore
 
     # Invalid argument combination
     raise ValueError(
         "Invalid arguments: Either `app_module` or `config` must be provided, but not both."
     )
+
+
+def _eager_instantiation(injector: AscenderInjector):
+    """
+    Validates the whole provider graph and instantiates providers up front if `eagerInstantiation` is enabled.
+
+    Providers with async factories are awaited on application startup, before lifecycle services start.
+    """
+    di_configs = injector._di_configs
+    if not di_configs or not di_configs.eagerInstantiation:
+        return
+
+    logger = getLogger("Ascender Framework")
+    graph = DependencyGraph(injector)
+    logger.debug(graph.instantiate().format())
+
+    if graph.has_async:
+        application: Application = injector.get(Application)
+
+        async def instantiate_async():
+            logger.debug((await graph.instantiate_async()).format())
+
+        application.add_event_handler("startup", instantiate_async)
@@ -2,6 +2,8 @@ from .entity import DBEntity
 from .engine import DatabaseEngine
 from .dbcontext import AppDBContext
 from .provider import provideDatabase
+from .unit_of_work import UnitOfWork
+from .middleware import UnitOfWorkMiddleware
 from .types.orm_enum import ORMEnum
 from .types.sqlalchemy_configuration import SQLAlchemyConfig
 from .types.tortoise_configuration import TortoiseConfig
@@ -12,6 +14,8 @@ __all__ = [
     "DatabaseEngine",
     "AppDBContext",
     "provideDatabase",
+    "UnitOfWork",
+    "UnitOfWorkMiddleware",
     "ORMEnum",
     "SQLAlchemyConfig",
     "TortoiseConfig"
@@ -1,7 +1,8 @@
-from typing import Any, AsyncGenerator, Awaitable, Generator, Generic
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Generator, Generic
 from typing_extensions import TypeVar
 from sqlalchemy import Result, Select
 from ascender.core.database.orms.sqlalchemy import SQLAlchemyORM
+from ascender.core.database.unit_of_work import UnitOfWork
 
 
 T = TypeVar("T")
@@ -17,6 +18,48 @@ class Constructor(Select, Generic[T]):
 
     def __await__(self):
         async def execute_self() -> Result[tuple[T]]:
+            unit = UnitOfWork.current(self.engine)
+            if unit is not None:
+                return await unit.execute(self)
+
             async with self.engine.get_session() as session:
                 return await session.execute(self)
-        return execute_self().__await__()
\ No newline at end of file
+        return execute_self().__await__()
+
+    def stream(self, batch_size: int = 1000) -> AsyncIterator[T]:
+        """
+        Streams entities of the query instead of buffering the whole result.
+
+        Rows are fetched `batch_size` at a time through a server-side cursor, so memory stays flat regardless
+        of the table size. The iterator holds its own session (outside of the unit of work) until it's exhausted or closed,
+        wrap it in `contextlib.aclosing` to release the connection right after leaving the loop early:
+        ```python
+        async with aclosing(self.context.construct(UserEntity).stream(batch_size=500)) as users:
+            async for user in QuerySetSerializer.base_serialize_stream(UserDTO, users):
+                ...
+        ```
+
+        Args:
+            batch_size (int, optional): Amount of rows fetched at a time. Defaults to 1000.
+
+        Returns:
+            AsyncIterator[T]: Entities (first column) of the query.
+
+        Raises:
+            ValueError: If `batch_size` is not a positive number.
+        """
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be a positive number")
+
+        return self.__stream(batch_size)
+
+    """:internal:"""
+    async def __stream(self, batch_size: int) -> AsyncGenerator[T, None]:
+        async with self.engine.get_session() as session:
+            result = await session.stream_scalars(self.execution_options(yield_per=batch_size))
+            try:
+                async for partition in result.partitions():
+                    for entity in partition:
+                        yield entity
+            finally:
+                await result.close()
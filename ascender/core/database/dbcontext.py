@@ -1,6 +1,8 @@
-from typing import Sequence, TypeVar
+from contextlib import _AsyncGeneratorContextManager
+from typing import Sequence, TypeVar, cast
 from ascender.core.database.constructor import Constructor
 from ascender.core.database.orms.sqlalchemy import SQLAlchemyORM
+from ascender.core.database.unit_of_work import SharedSession, UnitOfWork, unit_of_work
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -52,11 +54,39 @@ class AppDBContext:
         """
         return Constructor[T](self.engine, *entities)
 
+    def unit_of_work(self) -> _AsyncGeneratorContextManager[UnitOfWork]:
+        """
+        Opens a unit of work: every `Constructor` await and `AppDBContext()` call within it shares one session,
+        created on first use. The session is committed when the scope exits and rolled back if it raises.
+        Nested scopes join the outer one.
+
+        HTTP requests get a unit of work from `UnitOfWorkMiddleware` (enable with `"unit_of_work": True` in `SQLAlchemyConfig`),
+        elsewhere, e.g. in `@MessagePattern` handlers, open it explicitly or use it as a decorator:
+        ```python
+        @MessagePattern("orders.create")
+        async def create_order(self, payload: OrderDTO):
+            async with self.context.unit_of_work():
+                user = (await self.context.construct(UserEntity).filter(UserEntity.id == payload.user_id)).scalar_one()
+                async with self.context() as db:
+                    db.add(OrderEntity(user=user))
+        ```
+
+        Returns:
+            _AsyncGeneratorContextManager[UnitOfWork]: The unit of work scope.
+        """
+        return unit_of_work(self.engine)
+
     def __call__(self) -> AsyncSession:
         """
-        Provides a new database session.
+        Provides a new database session, or the shared session within a unit of work (see `unit_of_work`).
+
+        Shared session isn't closed when `async with` exits, the unit of work commits and closes it.
 
         Returns:
-            AsyncSession: The new database [session](https://docs.sqlalchemy.org/en/20/orm/session_api.html#sqlalchemy.orm.Session).
+            AsyncSession: The database [session](https://docs.sqlalchemy.org/en/20/orm/session_api.html#sqlalchemy.orm.Session).
         """
+        unit = UnitOfWork.current(self.engine)
+        if unit is not None:
+            return cast(AsyncSession, SharedSession(unit))
+
         return self.engine.get_session()
\ No newline at end of file
@@ -4,6 +4,7 @@ from fastapi import FastAPI
 
 from ascender.core.database.dbcontext import AppDBContext
 from ascender.core.database.errors.wrong_orm import WrongORMException
+from ascender.core.database.middleware import UnitOfWorkMiddleware
 from ascender.core.database.orms.sqlalchemy import SQLAlchemyORM
 from ascender.core.database.orms.tortoise import TortoiseORM
 from ascender.core.database.types.orm_enum import ORMEnum
@@ -41,6 +42,8 @@ class DatabaseEngine:
         if isinstance(self.engine, SQLAlchemyORM):
             app.add_event_handler("startup", self.engine.run_database)
             app.add_event_handler("shutdown", self.engine.shutdown_database)
+            if self.configuration.get("unit_of_work", False):
+                app.app.add_middleware(UnitOfWorkMiddleware, context=self.generate_context())
         else:
             self.engine.run_database(app)
 
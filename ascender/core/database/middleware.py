@@ -0,0 +1,35 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ascender.abc.middleware import AscenderMiddleware
+from ascender.core.database.dbcontext import AppDBContext
+
+
+class UnitOfWorkMiddleware(AscenderMiddleware):
+    """
+    Runs every HTTP request in a unit of work of `context` (see `AppDBContext.unit_of_work`).
+
+    The unit of work is committed right before the response starts, so clients never see a response
+    for changes which failed to commit. Responses with error status (4xx and 5xx) roll it back,
+    work done after the response starts (e.g. background tasks) is committed when the request ends.
+    """
+
+    def __init__(self, app: ASGIApp, context: AppDBContext):
+        self.app = app
+        self.context = context
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with self.context.unit_of_work() as unit:
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start":
+                    if message["status"] < 400:
+                        await unit.commit()
+                    else:
+                        await unit.rollback()
+
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
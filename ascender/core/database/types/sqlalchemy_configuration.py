@@ -1,8 +1,13 @@
-from typing import Literal
-from typing_extensions import TypedDict
+from typing import Any, Literal
+from typing_extensions import NotRequired, TypedDict
 
 
 class SQLAlchemyConfig(TypedDict):
     type: Literal["dbstring"]
     content: str
-    entities: list[str]
\ No newline at end of file
+    entities: list[str]
+    pool_options: NotRequired[dict[str, Any]]
+    unit_of_work: NotRequired[bool]
+    """
+    Wraps every HTTP request in a unit of work (see `AppDBContext.unit_of_work`). Defaults to False
+    """
@@ -0,0 +1,124 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ascender.core.database.orms.sqlalchemy import SQLAlchemyORM
+
+
+# `AsyncSession` methods of `SharedSession` which take turns on the unit of work lock
+_LOCKED_METHODS = frozenset({"execute", "scalar", "scalars", "get", "flush", "commit", "rollback"})
+
+
+class UnitOfWork:
+    """
+    Session shared by every query of a scope (an HTTP request, a message handler, a background job).
+
+    The session is created on first use, so scopes which never touch the database don't check out a connection.
+    Use `AppDBContext.unit_of_work()` to open a scope, `Constructor` awaits and `AppDBContext()` calls within it
+    use the shared session.
+    """
+    _current: ContextVar["UnitOfWork | None"] = ContextVar("unit_of_work", default=None)
+
+    def __init__(self, engine: SQLAlchemyORM) -> None:
+        self.engine = engine
+        self.lock = asyncio.Lock()
+        self._session: AsyncSession | None = None
+
+    @staticmethod
+    def current(engine: SQLAlchemyORM) -> "UnitOfWork | None":
+        """
+        Returns unit of work of the current scope if it belongs to the `engine`.
+        """
+        unit = UnitOfWork._current.get()
+        if unit is None or unit.engine is not engine:
+            return None
+
+        return unit
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self.engine.get_session()
+
+        return self._session
+
+    @property
+    def started(self) -> bool:
+        """Whether the session was used within the scope."""
+        return self._session is not None
+
+    async def execute(self, statement: Any):
+        return await self.locked(self.session.execute, statement)
+
+    async def locked(self, method: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        # Session can't run concurrent statements, queries gathered within one scope take turns
+        async with self.lock:
+            return await method(*args, **kwargs)
+
+    async def commit(self):
+        if self._session is not None:
+            await self._session.commit()
+
+    async def rollback(self):
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class SharedSession:
+    """
+    Session of the current unit of work returned by `AppDBContext()`.
+
+    Behaves like `AsyncSession`, but leaving `async with` doesn't close it, the unit of work does.
+    Queries, `flush`, `commit` and `rollback` take turns with other queries of the scope, so they can be gathered.
+    """
+
+    def __init__(self, unit: UnitOfWork) -> None:
+        self._unit = unit
+
+    async def __aenter__(self) -> AsyncSession:
+        return cast(AsyncSession, self)
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._unit.session, name)
+        if name in _LOCKED_METHODS:
+            return partial(self._unit.locked, attribute)
+
+        return attribute
+
+
+@asynccontextmanager
+async def unit_of_work(engine: SQLAlchemyORM) -> AsyncIterator[UnitOfWork]:
+    """
+    Opens a unit of work scope, commits it when the scope exits normally and rolls it back on error.
+
+    Nested scopes join the outer one, which commits.
+    """
+    current = UnitOfWork.current(engine)
+    if current is not None:
+        yield current
+        return
+
+    unit = UnitOfWork(engine)
+    token = UnitOfWork._current.set(unit)
+    try:
+        yield unit
+    except BaseException:
+        await unit.rollback()
+        raise
+    else:
+        await unit.commit()
+    finally:
+        UnitOfWork._current.reset(token)
+        await unit.close()
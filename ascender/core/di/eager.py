@@ -0,0 +1,225 @@
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import Any, ForwardRef, Iterator
+
+from ascender.core.di.injector import AscenderInjector
+from ascender.core.di.interface.consts import CIRCULAR, NOT_YET, UnresolvedDependency
+from ascender.core.di.interface.provider import Provider
+from ascender.core.di.interface.record import ProviderRecord
+from ascender.core.di.utils.forward_ref import is_forward_ref, resolve_dep_forward_ref
+from ascender.core.di.utils.graph import provider_dependencies, token_name, topological_levels
+from ascender.core.di.utils.providers import is_factory_provider
+
+
+class ProviderNode:
+    """
+    Provider record of the dependency graph together with the injector that owns it.
+
+    Dependencies are resolved through the owning injector, the same way its factory resolves them.
+    """
+    __slots__ = ("token", "provider", "record", "injector", "dependencies", "is_async")
+
+    def __init__(self, token: Any, provider: Provider, record: ProviderRecord[Any], injector: AscenderInjector):
+        self.token = token
+        self.provider = provider
+        self.record = record
+        self.injector = injector
+        self.dependencies: list[ProviderNode] = []
+        self.is_async = is_factory_provider(provider) and inspect.iscoroutinefunction(provider["use_factory"])
+
+    def __repr__(self) -> str:
+        return f"ProviderNode({token_name(self)})"
+
+
+@dataclass
+class ProviderTiming:
+    token: Any
+    seconds: float
+    is_async: bool = False
+
+
+@dataclass
+class InstantiationReport:
+    """
+    Construction time of every provider instantiated by `DependencyGraph`.
+    """
+    timings: list[ProviderTiming] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def slowest(self, count: int = 10) -> list[ProviderTiming]:
+        return sorted(self.timings, key=lambda timing: timing.seconds, reverse=True)[:count]
+
+    def format(self, count: int = 10) -> str:
+        lines = [f"Instantiated {len(self.timings)} providers in {self.elapsed * 1000:.2f} ms"]
+        for timing in self.slowest(count):
+            suffix = " (async)" if timing.is_async else ""
+            lines.append(f"  {timing.seconds * 1000:9.3f} ms  {token_name(timing.token)}{suffix}")
+
+        return "\n".join(lines)
+
+
+class DependencyGraph:
+    """
+    Ahead-of-time view of every provider registered in the injector and its descendants.
+
+    `validate()` reports all missing providers at once and fails on the first cycle found,
+    `instantiate()` constructs providers level by level in dependency order instead of on first use.
+    Providers with async `use_factory` (and everything depending on them) are deferred to
+    `instantiate_async()`, which awaits independent providers of the same level concurrently.
+    """
+
+    def __init__(self, injector: AscenderInjector):
+        self.injector = injector
+        self.nodes = list(self.__collect(injector))
+        self.levels: list[list[ProviderNode]] = []
+
+    @property
+    def has_async(self) -> bool:
+        return any(node.is_async for node in self.nodes)
+
+    def validate(self) -> list[list[ProviderNode]]:
+        """
+        Links providers with their dependencies and groups them into topological levels.
+
+        Raises:
+            UnresolvedDependency: If any of providers depends on a token which isn't provided, lists all of them.
+            CyclicDependency: If providers depend on each other, message contains the cycle path.
+        """
+        nodes_by_record = {id(node.record): node for node in self.nodes}
+        errors: list[str] = []
+
+        for node in self.nodes:
+            node.dependencies = []
+            try:
+                tokens = provider_dependencies(node.provider)
+            except TypeError as e:
+                errors.append(f"{token_name(node)}: {e}")
+                continue
+
+            for token in tokens:
+                records = self.__lookup(node.injector, token)
+                if records is None:
+                    errors.append(f"{token_name(node)} depends on {token_name(token)}, which is not provided")
+                    continue
+
+                for record in records:
+                    dependency = nodes_by_record.get(id(record))
+                    if dependency is not None:
+                        node.dependencies.append(dependency)
+
+        if errors:
+            raise UnresolvedDependency("Dependency graph is invalid:\n  " + "\n  ".join(errors))
+
+        graph: dict[ProviderNode, list[ProviderNode]] = {node: [] for node in self.nodes}
+        for node in self.nodes:
+            for dependency in node.dependencies:
+                graph[dependency].append(node)
+
+        self.levels = topological_levels(graph)
+        for level in self.levels:
+            for node in level:
+                node.is_async = node.is_async or any(dependency.is_async for dependency in node.dependencies)
+
+        return self.levels
+
+    def instantiate(self) -> InstantiationReport:
+        """
+        Validates the graph and constructs every synchronous provider in dependency order.
+        """
+        report = InstantiationReport()
+        started = time.perf_counter()
+
+        for level in self.validate():
+            for node in level:
+                if not node.is_async:
+                    self.__construct(node, report)
+
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    async def instantiate_async(self) -> InstantiationReport:
+        """
+        Constructs providers deferred by `instantiate()`, independent ones are awaited concurrently.
+        """
+        report = InstantiationReport()
+        started = time.perf_counter()
+
+        for level in self.levels or self.validate():
+            await asyncio.gather(*(self.__construct_async(node, report) for node in level if node.is_async))
+
+        # Values might have been resolved as pending coroutines before, drop them from resolution caches
+        self.injector.invalidate()
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    """:internal:"""
+    def __construct(self, node: ProviderNode, report: InstantiationReport):
+        record = node.record
+        # Request and transient scoped values are created when injected
+        if record.value is not NOT_YET or record.factory is None or record.scope != "singleton":
+            return
+
+        started = time.perf_counter()
+        record.value = CIRCULAR
+        try:
+            record.value = record.factory()
+        except BaseException:
+            record.value = NOT_YET
+            raise
+
+        report.timings.append(ProviderTiming(node.token, time.perf_counter() - started))
+
+    """:internal:"""
+    async def __construct_async(self, node: ProviderNode, report: InstantiationReport):
+        record = node.record
+        # Request and transient scoped values are created when injected
+        if record.value is not NOT_YET or record.factory is None or record.scope != "singleton":
+            return
+
+        started = time.perf_counter()
+        record.value = CIRCULAR
+        try:
+            value = record.factory()
+            if inspect.isawaitable(value):
+                value = await value
+        except BaseException:
+            record.value = NOT_YET
+            raise
+
+        record.value = value
+        report.timings.append(ProviderTiming(node.token, time.perf_counter() - started, is_async=True))
+
+    """:internal:"""
+    @staticmethod
+    def __collect(injector: AscenderInjector) -> Iterator[ProviderNode]:
+        injectors = [injector]
+        while injectors:
+            current = injectors.pop()
+            for token, provider, record in current._provider_records:
+                # Records replaced after registration (e.g. by test overrides) are no longer resolved
+                if not any(existing is record for existing in current.dependencies.get(token, ())):
+                    continue
+
+                if isinstance(provider, ForwardRef):
+                    provider = resolve_dep_forward_ref(provider, current._type_index)
+
+                yield ProviderNode(token, provider, record, current)
+
+            injectors.extend(current._children)
+
+    """:internal:"""
+    @staticmethod
+    def __lookup(injector: AscenderInjector, token: Any) -> list[ProviderRecord[Any]] | None:
+        if is_forward_ref(token):
+            try:
+                token = resolve_dep_forward_ref(token, injector._type_index)
+            except TypeError:
+                pass
+
+        records = injector.get_factory_def(token)
+        if records is None:
+            return None
+
+        return records if isinstance(records, list) else [records]
@@ -4,6 +4,7 @@ from collections import defaultdict
 from inspect import isclass, isfunction, ismethod
 from typing import Any, Callable, ForwardRef, Mapping, MutableMapping, MutableSequence, Sequence, Set, TypeVar, cast, overload
 import warnings
+from weakref import WeakSet
 
 from ascender.core.di.abc.base_injector import Injector
 from ascender.core.di.forward_ref import DependencyForwardRef
@@ -11,6 +12,7 @@ from ascender.core.di.interface.consts import CIRCULAR, RAISE_NOT_FOUND, CyclicD
 from ascender.core.di.interface.injector import InjectorOptions
 from ascender.core.di.interface.record import ProviderRecord
 from ascender.core.di.none_injector import NoneInjector
+from ascender.core.di.scope import RequestScope
 from ascender.core.di.utils.forward_ref import is_forward_ref, resolve_dep_forward_ref
 from ascender.core.di.utils.injection_def import injection_def
 from ascender.core.di.utils.providers import for_each_provider, is_factory_provider, is_static_class_provider, is_type_provider, is_value_provider
@@ -18,10 +20,25 @@ from ascender.core.di.utils.providers import for_each_provider, is_factory_provi
 from .interface.provider import FactoryProvider, Provider, StaticClassProvider
 
 from ascender.core._config.asc_config import _AscenderConfig
+from ascender.core.errors.scope_error import AscenderScopeError
 
 
 T = TypeVar("T")
 
+_UNRESOLVED = object()
+
+
+class _MultiValues(tuple):
+    """Resolved values of multi provider, kept in resolution cache."""
+
+
+class _ScopedRecord:
+    """Record of `request` or `transient` scoped provider, kept in resolution cache instead of its value."""
+    __slots__ = ("record",)
+
+    def __init__(self, record: ProviderRecord[Any]) -> None:
+        self.record = record
+
 
 class AscenderInjector(Injector):
     """
@@ -47,6 +64,18 @@ class AscenderInjector(Injector):
         self.providers = providers
         self.__parent = parent
 
+        # Resolution cache of already constructed singletons (including ones found in ancestors),
+        # so repeated `get()` calls skip record lookups and the parent chain walk.
+        # Cleared by `invalidate()` together with caches of all descendant injectors.
+        self._resolved: dict[Any, Any] = {}
+        self._generation = 0
+        self._children: WeakSet[AscenderInjector] = WeakSet()
+        if parent is not None:
+            parent._children.add(self)
+
+        # Providers this injector created records for, used by ahead-of-time graph validation
+        self._provider_records: list[tuple[Any, Provider, ProviderRecord[Any]]] = []
+
         # Make sure to add this injector into injectable records
         self.dependencies[Injector] = set([ProviderRecord(self)])
         self._index_token(Injector)
@@ -66,6 +95,25 @@ class AscenderInjector(Injector):
         if isinstance(token, type):
             self._type_index[token.__name__] = token
 
+    def invalidate(self):
+        """
+        Drops resolution cache of this injector and all of its descendants.
+
+        Must be called whenever records in `dependencies` are changed after the injector was created
+        (e.g. module imports or test overrides).
+        """
+        self._resolved.clear()
+        self._generation += 1
+        for child in list(self._children):
+            child.invalidate()
+
+    @property
+    def generation(self) -> int:
+        """
+        Incremented by every `invalidate()`, lets dependents cache what they derive from the injector's records.
+        """
+        return self._generation
+
     def get(
         self,
         token: type[T] | str | Any,
@@ -91,6 +139,7 @@ class AscenderInjector(Injector):
 
         # Generate provider record
         provider_record = self.__provide_to_record(provider)
+        self._provider_records.append((provider_token, provider, provider_record))
 
         if not is_type_provider(provider) and provider.get("multi", False):
             self.dependencies[provider_token].add(provider_record)
@@ -109,11 +158,14 @@ class AscenderInjector(Injector):
         if not factory:
             raise TypeError("Provider is not found")
         
-        multi = False
-        if not is_type_provider(provider):
-            multi = provider.get("multi", False)
+        if is_type_provider(provider):
+            return ProviderRecord[Any](NOT_YET, factory)
 
-        return ProviderRecord[Any](NOT_YET, factory, multi)
+        scope = provider.get("scope", "singleton")
+        if scope not in ("singleton", "request", "transient"):
+            raise ValueError(f"Unknown provider scope {scope!r}, expected 'singleton', 'request' or 'transient'")
+
+        return ProviderRecord[Any](NOT_YET, factory, provider.get("multi", False), scope, provider.get("dispose"))
     
     """:internal:"""
     def __provide_to_factory(self, provider: Provider):
@@ -158,14 +210,8 @@ class AscenderInjector(Injector):
         if skip_self and self.__parent:
             return self.__parent.get_factory_def(token)
         
-        _injectable_value = None
-
-        _injectable_value = self.dependencies[token] # Returns set even if token was not found, it will return empty set if not found
-
-        # print(self.dependencies.keys())
-
-        # Convert the set to list for better getter manipulation
-        _injectable_value = list(_injectable_value)
+        # `.get()` doesn't insert empty records for unknown tokens into defaultdict
+        _injectable_value = self.dependencies.get(token)
 
         # If set is empty
         if not _injectable_value:
@@ -177,9 +223,9 @@ class AscenderInjector(Injector):
             return None
         
         if len(_injectable_value) > 1:
-            return _injectable_value
+            return list(_injectable_value)
             
-        return _injectable_value[0]
+        return next(iter(_injectable_value))
 
     def inject_factory_def(self, reference: type[Any]):
         """
@@ -214,22 +260,42 @@ class AscenderInjector(Injector):
         """
         Supplies Injector output with required providers by `token`
         """
+        only_self = options.get("only_self", False)
+        skip_self = options.get("skip_self", False)
+        cacheable = not (only_self or skip_self)
+
+        if cacheable:
+            resolved = self._resolved.get(token, _UNRESOLVED)
+            if resolved is not _UNRESOLVED:
+                kind = type(resolved)
+                if kind is _MultiValues:
+                    return list(resolved)
+                if kind is _ScopedRecord:
+                    return self.__resolve_scoped(token, resolved.record)
+                return resolved
+
         di_configs = self._di_configs
-        _deps = self.get_factory_def(token, options.get("only_self", False), options.get("skip_self", False))
+        _deps = self.get_factory_def(token, only_self, skip_self)
 
         if _deps is None:
             return self.NONE_INJECTOR.get(token, not_found_value, options)
         
         # handle multi providers
         if isinstance(_deps, list):
-            updated_deps: list[ProviderRecord[Any]] = []
+            values: list[Any] = []
+            scoped = False
             for dep in _deps:
+                if dep.scope != "singleton":
+                    values.append(self.__resolve_scoped(token, dep))
+                    scoped = True
+                    continue
+
                 if dep.value is CIRCULAR:
                     if di_configs:
                         if di_configs.circularDependencyHandling == "warn":
                             warnings.warn(f"Circular dependency detected for token: {token}", RuntimeWarning)
                             dep.value = DependencyForwardRef(self, token)
-                            updated_deps.append(dep)
+                            values.append(dep.value)
                             continue
                         if di_configs.circularDependencyHandling == "error":
                             raise CyclicDependency(f"Circular dependency detected for token: {token}")
@@ -240,20 +306,26 @@ class AscenderInjector(Injector):
 
                     if dep.factory is not None:
                         dep.value = dep.factory()
-                        updated_deps.append(dep)
+                        values.append(dep.value)
                         continue
                 
-                updated_deps.append(dep)
+                values.append(dep.value)
             
-            self.dependencies[token] = set(updated_deps)
-            return [dep.value for dep in updated_deps]
+            if cacheable and not scoped and all(self.__is_constructed(value) for value in values):
+                self._resolved[token] = _MultiValues(values)
+
+            return values
         
+        if _deps.scope != "singleton":
+            if cacheable:
+                self._resolved[token] = _ScopedRecord(_deps)
+            return self.__resolve_scoped(token, _deps)
+
         if _deps.value is CIRCULAR:
             if di_configs:
                 if di_configs.circularDependencyHandling == "warn":
                     warnings.warn(f"Circular dependency detected for token: {token}", RuntimeWarning)
                     _deps.value = DependencyForwardRef(self, token)
-                    self.dependencies[token] = set([_deps])
                     return _deps.value
                 
                 if di_configs.circularDependencyHandling == "error":
@@ -265,10 +337,42 @@ class AscenderInjector(Injector):
             
             if _deps.factory:
                 _deps.value = _deps.factory()
-                self.dependencies[token] = set([_deps])
-                return _deps.value
         
+        if cacheable and self.__is_constructed(_deps.value):
+            self._resolved[token] = _deps.value
+
         return _deps.value
+
+    """:internal:"""
+    @staticmethod
+    def __resolve_scoped(token: type[Any] | str, record: ProviderRecord[Any]) -> Any:
+        """
+        Resolves `request` and `transient` scoped records, their values are never cached by the injector
+        """
+        assert record.factory is not None
+        scope = RequestScope.current()
+
+        if record.scope == "transient":
+            if record.dispose is None:
+                return record.factory()
+
+            # Values are disposed with the request scope, outside of it the hook would never run
+            if scope is None:
+                raise AscenderScopeError(f"Provider of {token} is transient with `dispose` hook and can only be injected within a request scope")
+
+            value = record.factory()
+            scope.on_dispose(lambda: record.dispose(value)) # type: ignore[misc]
+            return value
+
+        if scope is None:
+            raise AscenderScopeError(f"Provider of {token} is request scoped and can only be injected within a request scope")
+
+        return scope.resolve(record)
+
+    """:internal:"""
+    @staticmethod
+    def __is_constructed(value: Any) -> bool:
+        return value is not CIRCULAR and value is not NOT_YET and not isinstance(value, DependencyForwardRef)
     
     def __inject_args(self, tokens: Sequence[type[Any] | str]) -> Sequence[Any]:
         """
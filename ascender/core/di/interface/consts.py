@@ -4,4 +4,7 @@ CIRCULAR = object()
 NOT_YET = object()
 
 class CyclicDependency(Exception):
-    ...
\ No newline at end of file
+    ...
+
+class UnresolvedDependency(Exception):
+    ...
@@ -1,7 +1,16 @@
-from typing import Any, Callable, ForwardRef, NotRequired, TypeAlias, TypeVar
+from typing import Any, Callable, ForwardRef, Literal, NotRequired, TypeAlias, TypeVar
 from typing_extensions import TypedDict
 
 
+ProviderScope = Literal["singleton", "request", "transient"]
+"""
+Lifetime of provided values.
+
+`singleton` values are created once per injector, `request` ones once per request or microservice message
+(see `ascender.core.di.scope.RequestScope`), and `transient` ones on every injection.
+"""
+
+
 class ValueProvider(TypedDict):
     """
     Configures `AscenderInjector` to handle initiated value of specified `type` and uses it's `type` as Injectable Token.
@@ -49,6 +58,18 @@ class StaticClassProvider(TypedDict):
     A list of token to be resolved by the injector
     """
 
+    scope: NotRequired[ProviderScope]
+    """
+    Lifetime of provided values, defaults to `singleton`.
+    Singletons shouldn't depend on `request` scoped providers, they would keep values of the first request
+    """
+
+    dispose: NotRequired[Callable[[Any], Any]]
+    """
+    Cleanup hook for values of `request` and `transient` scoped providers, called (and awaited if async) with the value
+    when the request scope ends. Providers with it can only be injected within a request scope
+    """
+
 
 class FactoryProvider(TypedDict):
     """
@@ -75,6 +96,18 @@ class FactoryProvider(TypedDict):
     A list of tokens to be resolved by the injector
     """
 
+    scope: NotRequired[ProviderScope]
+    """
+    Lifetime of provided values, defaults to `singleton`.
+    Singletons shouldn't depend on `request` scoped providers, they would keep values of the first request
+    """
+
+    dispose: NotRequired[Callable[[Any], Any]]
+    """
+    Cleanup hook for values of `request` and `transient` scoped providers, called (and awaited if async) with the value
+    when the request scope ends. Providers with it can only be injected within a request scope
+    """
+
 
 TypeProvider = TypeVar("TypeProvider", bound=type[Any])
 """
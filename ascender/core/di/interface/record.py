@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Any, Callable, Generic, TypeVar
 
+from ascender.core.di.interface.provider import ProviderScope
+
 
 T = TypeVar("T")
 
@@ -10,6 +12,8 @@ class ProviderRecord(Generic[T]):
     value: T | dict | Any
     factory: Callable[[], T] | None = None
     multi: bool = False
+    scope: ProviderScope = "singleton"
+    dispose: Callable[[Any], Any] | None = None
 
     def __hash__(self) -> int:
         return hash((id(self.factory), self.multi))
\ No newline at end of file
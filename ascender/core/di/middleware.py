@@ -0,0 +1,23 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ascender.abc.middleware import AscenderMiddleware
+from ascender.core.di.scope import request_scope
+
+
+class RequestScopeMiddleware(AscenderMiddleware):
+    """
+    Runs every HTTP request and websocket connection in its own request scope (see `ascender.core.di.scope.request_scope`).
+
+    Values of `request` scoped providers are disposed once the response is sent and background tasks are done.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, receive, send)
+            return
+
+        async with request_scope():
+            await self.app(scope, receive, send)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+from inspect import isawaitable
+from typing import Any, Callable
+
+from ascender.core.di.interface.consts import CIRCULAR, NOT_YET, CyclicDependency
+from ascender.core.di.interface.record import ProviderRecord
+
+
+_current: ContextVar[RequestScope | None] = ContextVar("ascender_request_scope", default=None)
+
+
+class RequestScope:
+    """
+    Values of `request` scoped providers for a single request or microservice message.
+
+    Injectors resolve `request` scoped providers through the scope bound to the current context
+    (see `request_scope`), so every request gets its own values which are disposed when it ends.
+    Singleton providers are still resolved and cached by the injectors.
+    """
+    __slots__ = ("instances", "_cleanups")
+
+    def __init__(self) -> None:
+        self.instances: dict[int, Any] = {}
+        self._cleanups: list[Callable[[], Any]] = []
+
+    @staticmethod
+    def current() -> RequestScope | None:
+        """
+        Returns request scope bound to the current context, `None` outside of requests.
+        """
+        return _current.get()
+
+    def resolve(self, record: ProviderRecord[Any]) -> Any:
+        """
+        Returns value of `record` for this scope, it's created on first resolution.
+
+        Raises:
+            CyclicDependency: If the record depends on itself.
+        """
+        key = id(record)
+        value = self.instances.get(key, NOT_YET)
+        if value is CIRCULAR:
+            raise CyclicDependency(f"Circular dependency detected for request scoped provider {record.factory}")
+        if value is not NOT_YET:
+            return value
+
+        assert record.factory is not None
+        self.instances[key] = CIRCULAR
+        try:
+            value = record.factory()
+        except BaseException:
+            del self.instances[key]
+            raise
+
+        self.instances[key] = value
+        if record.dispose is not None:
+            self.on_dispose(lambda: record.dispose(value)) # type: ignore[misc]
+
+        return value
+
+    def on_dispose(self, callback: Callable[[], Any]):
+        """
+        Registers a cleanup hook, called (and awaited if async) when the scope ends.
+        Hooks run in reverse order of registration.
+        """
+        self._cleanups.append(callback)
+
+    async def dispose(self):
+        """
+        Runs cleanup hooks and drops values of the scope.
+        Every hook runs even if previous ones failed, the first error is raised afterwards.
+        """
+        error: BaseException | None = None
+        while self._cleanups:
+            try:
+                result = self._cleanups.pop()()
+                if isawaitable(result):
+                    await result
+            except Exception as e:
+                error = error or e
+
+        self.instances.clear()
+        if error is not None:
+            raise error
+
+
+class request_scope:
+    """
+    Runs the block within a request scope, values of `request` scoped providers are shared inside of it
+    and disposed when it ends. Nested scopes join the outer one.
+
+    Example:
+    ```
+        async with request_scope():
+            tenant = injector.get(TenantContext)
+    ```
+    """
+    # NOTE: A plain class instead of `asynccontextmanager`, it's entered for every request
+    __slots__ = ("_scope", "_token")
+
+    def __init__(self) -> None:
+        self._scope: RequestScope | None = None
+        self._token: Any = None
+
+    async def __aenter__(self) -> RequestScope:
+        scope = _current.get()
+        if scope is not None:
+            return scope
+
+        self._scope = RequestScope()
+        self._token = _current.set(self._scope)
+        return self._scope
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._scope is None:
+            return
+
+        _current.reset(self._token)
+        await self._scope.dispose()
@@ -37,6 +37,7 @@ class TestInjector(AscenderInjector):
         super().__init__(providers, parent)
         self._test_mode = True  # Indicates that this injector is in test mode
         self._overrode = []
+        self._applied_overrides: tuple[Any, int] | None = None
         
         self.dependencies[TestInjector].add(ProviderRecord(self))
         self._index_token(TestInjector)
@@ -59,8 +60,19 @@ class TestInjector(AscenderInjector):
     def _get_overrode_deps(self):
         providers = StaticOverrider.overrides.get()
         
-        if providers is not None:
-            for_each_provider([providers], self.__reprocess_provider)
+        if providers is None:
+            self._applied_overrides = None
+            return
+
+        # Overrides are applied once per change (`override()` extends the same list), not on every lookup.
+        # The list itself is kept (not its `id`), ids of collected lists are reused by the next `mock()`
+        size = len(providers) if isinstance(providers, list) else 1
+        if self._applied_overrides is not None and self._applied_overrides[0] is providers and self._applied_overrides[1] == size:
+            return
+
+        for_each_provider([providers], self.__reprocess_provider)
+        self._applied_overrides = (providers, size)
+        self.invalidate()
     
         """:internal:"""
     def __reprocess_provider(self, provider: Provider):
@@ -72,7 +84,7 @@ class TestInjector(AscenderInjector):
         self._index_token(provider_token)
 
         # Generate provider record
-        provider_record = self.__provide_to_record(provider)
+        provider_record = self._AscenderInjector__provide_to_record(provider) # type: ignore[attr-defined]
 
         if not is_type_provider(provider) and provider.get("multi", False):
             if provider_token not in self._overrode:
@@ -1,107 +1,157 @@
-from inspect import Parameter, signature
-from typing import List, Dict, Set, Any, cast
 from collections import defaultdict
+from inspect import isclass
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Set, TypeVar, cast
 
-from ascender.core.di.utils.providers import is_factory_provider, is_static_class_provider, is_value_provider
+from ascender.core.di.interface.consts import CyclicDependency
+from ascender.core.di.utils.injection_def import injection_def
+from ascender.core.di.utils.providers import for_each_provider, is_factory_provider, is_static_class_provider, is_value_provider
 
 from ..interface.provider import FactoryProvider, Provider, StaticClassProvider
 
 
+N = TypeVar("N", bound=Hashable)
+
+
 def extract_dependencies_from_class(cls: type) -> List[Any]:
-    """Extracts dependencies from the constructor of a class."""
-    deps = []
-    constructor = getattr(cls, "__init__", None)
-    if constructor:
-        sig = signature(constructor)
-        for name, param in sig.parameters.items():
-            if name == "self":
-                continue
-            if param.annotation != Parameter.empty:
-                deps.append(param.annotation)
-            else:
-                raise ValueError(f"Parameter '{name}' in {cls} lacks a type annotation.")
-    return deps
+    """Extracts dependencies (injection tokens) from the constructor of a class."""
+    return list(injection_def(cls.__init__).values())
+
+
+def provider_token(provider: Provider) -> Any:
+    """Returns injection token of the provider."""
+    return provider if isinstance(provider, type) else provider.get("provide")
+
+
+def provider_dependencies(provider: Provider) -> List[Any]:
+    """
+    Returns injection tokens the provider depends on, the same ones `AscenderInjector` resolves while constructing it.
+    """
+    if is_factory_provider(provider):
+        return list(cast(FactoryProvider, provider).get("deps", []))
+
+    if is_static_class_provider(provider):
+        static_class_provider = cast(StaticClassProvider, provider)
+        if static_class_provider.get("deps"):
+            return list(static_class_provider["deps"])
+
+        use_class = static_class_provider.get("use_class", static_class_provider["provide"])
+        return extract_dependencies_from_class(use_class) if isclass(use_class) else []
+
+    if isinstance(provider, type):
+        return extract_dependencies_from_class(provider)
+
+    if is_value_provider(provider) or (isinstance(provider, dict) and "value" in provider):
+        return []
+
+    raise ValueError(f"Unknown provider type: {provider}")
 
 
 def build_dependency_graph(providers: List[Provider]) -> Dict[Any, Set[Any]]:
     """
     Builds a dependency graph from the list of providers.
+
+    Edges point from dependency to its dependents, so the graph can be passed to `topological_sort` directly.
     """
-    graph = defaultdict(set)
-
-    def add_dependencies(token: Any, dependencies: List[Any]):
-        for dep in dependencies:
-            graph[dep].add(token)  # Reverse the edge direction
-        if token not in graph:
-            graph[token] = set()  # Ensure token is present in the graph
-
-    for provider in providers:
-        if is_factory_provider(provider):
-            token = cast(FactoryProvider, provider)["provide"]
-            dependencies = provider.get("deps", [])
-            add_dependencies(token, dependencies)
-
-        elif is_static_class_provider(provider):
-            token = cast(StaticClassProvider, provider)["provide"]
-            dependencies = provider.get("deps", [])
-            add_dependencies(token, dependencies)
-
-        elif isinstance(provider, type):  # TypeProvider
-            token = provider
-            dependencies = extract_dependencies_from_class(provider)
-            # Extract dependencies from constructor for TypeProvider
-            add_dependencies(token, dependencies)
-
-        # ValueProvider doesn't participate in the graph
-        elif is_value_provider(provider):
-            token = provider["provide"]
-            add_dependencies(token, [])
-
-        else:
-            raise ValueError(f"Unknown provider type: {provider}")
+    graph: Dict[Any, Set[Any]] = defaultdict(set)
+
+    def add_provider(provider: Provider):
+        token = provider_token(provider)
+        for dependency in provider_dependencies(provider):
+            graph[dependency].add(token)
 
         # Ensure token is in the graph even if it has no dependencies
-        if token not in graph:
-            graph[token] = set()
+        graph.setdefault(token, set())
 
+    for_each_provider(providers, add_provider)
     return graph
 
 
-def topological_sort(graph: Dict[Any, Set[Any]]) -> List[Any]:
+def topological_levels(graph: Mapping[N, Iterable[N]]) -> List[List[N]]:
     """
-    Performs topological sorting on the dependency graph.
+    Groups nodes of the graph (edges point from dependency to dependents) into levels,
+    nodes of every level depend only on nodes of previous levels, so nodes within the same level are independent.
+
+    Runs in linear time (Kahn's algorithm).
+
+    Raises:
+        CyclicDependency: If the graph has a cycle, message contains the cycle path.
     """
-    in_degree = {node: 0 for node in graph}
-    for dependencies in graph.values():
-        for dep in dependencies:
-            in_degree[dep] += 1
+    in_degree: Dict[N, int] = {node: 0 for node in graph}
+    for dependents in graph.values():
+        for dependent in dependents:
+            in_degree[dependent] = in_degree.get(dependent, 0) + 1
+
+    levels: List[List[N]] = []
+    current = [node for node, degree in in_degree.items() if degree == 0]
+    visited = 0
+
+    while current:
+        levels.append(current)
+        visited += len(current)
+
+        following: List[N] = []
+        for node in current:
+            for dependent in graph.get(node, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    following.append(dependent)
+        current = following
 
-    # Print initial in-degree map
-    print("Initial in-degree:", in_degree)
+    if visited != len(in_degree):
+        remaining = {node for node, degree in in_degree.items() if degree > 0}
+        cycle = find_cycle(graph, remaining)
+        raise CyclicDependency("Circular dependency detected: " + " -> ".join(map(token_name, cycle)))
 
-    # Queue for nodes with no incoming edges
-    queue = [node for node, degree in in_degree.items() if degree == 0]
-    print("Initial queue:", queue)
+    return levels
 
-    sorted_order = []
 
-    while queue:
-        current = queue.pop(0)
-        sorted_order.append(current)
+def topological_sort(graph: Mapping[N, Iterable[N]]) -> List[N]:
+    """
+    Performs topological sorting on the dependency graph in linear time.
+
+    Raises:
+        CyclicDependency: If the graph has a cycle.
+    """
+    return [node for level in topological_levels(graph) for node in level]
 
-        print(f"Processing node: {current}")
-        print(f"Queue before adding neighbors: {queue}")
 
-        for neighbor in graph[current]:
-            in_degree[neighbor] -= 1
-            if in_degree[neighbor] == 0:
-                queue.append(neighbor)
+def find_cycle(graph: Mapping[N, Iterable[N]], nodes: Set[N]) -> List[N]:
+    """
+    Finds a cycle among `nodes` with iterative depth-first search, every node is visited once.
+
+    Returns:
+        List[N]: Cycle path, first node is repeated at the end. Empty list if there's no cycle.
+    """
+    state: Dict[N, int] = {}  # 1 - on the current path, 2 - done
+    for start in nodes:
+        if start in state:
+            continue
+
+        path: List[N] = [start]
+        stack = [iter(graph.get(start, ()))]
+        state[start] = 1
+
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in nodes:
+                    continue
+
+                if state.get(neighbor) == 1:
+                    return path[path.index(neighbor):] + [neighbor]
+
+                if neighbor not in state:
+                    state[neighbor] = 1
+                    path.append(neighbor)
+                    stack.append(iter(graph.get(neighbor, ())))
+                    break
+            else:
+                state[path.pop()] = 2
+                stack.pop()
 
-        print(f"Queue after adding neighbors: {queue}")
-        print(f"Sorted order so far: {sorted_order}")
+    return []
 
-    # Detect cycles
-    if len(sorted_order) != len(graph):
-        raise ValueError("Graph has a cycle. Topological sort is not possible.")
 
-    return sorted_order
+def token_name(node: Any) -> str:
+    """Readable name of the injection token (or graph node holding one) for error messages."""
+    token = getattr(node, "token", node)
+    return getattr(token, "__name__", None) or str(token)
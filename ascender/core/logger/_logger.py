@@ -6,6 +6,7 @@ from rich.logging import RichHandler
 
 from ascender.core._config.asc_config import _AscenderConfig
 from ascender.core._config.interface.runtime import LoggingConfig
+from ascender.core.logger.async_handler import AsyncQueueHandler
 from ascender.core.logger.formatter import (AscenderFormatter,
                                             JsonAscenderFormatter)
 
@@ -21,16 +22,18 @@ def configure_logger(config: LoggingConfig):
     logger.setLevel(config.level.upper())
     logger.propagate = False
 
+    handlers: list[logging.Handler] = []
+
     # Console handler
     if config.console:
         if config.console_format == "json":
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(JsonAscenderFormatter())
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
         else:
             rich_handler = RichHandler(rich_tracebacks=True, markup=True)
             rich_handler.setFormatter(AscenderFormatter())
-            logger.addHandler(rich_handler)
+            handlers.append(rich_handler)
 
     # File handler
     if config.file:
@@ -43,7 +46,16 @@ def configure_logger(config: LoggingConfig):
             file_handler.setFormatter(JsonAscenderFormatter())
         else:
             file_handler.setFormatter(AscenderFormatter())
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Handlers write from a background thread, see `AsyncQueueHandler`
+    if config.async_:
+        queue_handler = AsyncQueueHandler(handlers, config.queue.max_size, config.queue.drop_policy)
+        queue_handler.start()
+        handlers = [queue_handler]
+
+    for handler in handlers:
+        logger.addHandler(handler)
 
     return logger
 
@@ -0,0 +1,109 @@
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Literal, Sequence
+
+
+DropPolicy = Literal["drop_new", "drop_oldest", "block"]
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self):
+        # Queue may be full when stopping, wait for space instead of failing
+        self.queue.put(self._sentinel)
+
+
+class AsyncQueueHandler(QueueHandler):
+    """
+    Hands log records over to a background thread which writes them with `handlers`,
+    so logging calls don't do console and file I/O on the event loop.
+
+    Queue is bounded, when it's full a record is dropped according to `drop_policy` and counted in `dropped`.
+    Records emitted while the background thread isn't running are written synchronously.
+    """
+
+    def __init__(self, handlers: Sequence[logging.Handler], max_size: int = 10000, drop_policy: DropPolicy = "drop_new"):
+        super().__init__(queue.Queue(max_size))
+        self.handlers = list(handlers)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self.listener = _Listener(self.queue, *self.handlers, respect_handler_level=True)
+        self.running = False
+
+    def start(self):
+        if self.running:
+            return
+
+        self.listener.start()
+        self.running = True
+
+    def stop(self):
+        """
+        Writes queued records and stops the background thread, reports dropped records if there were any.
+        """
+        if not self.running:
+            return
+
+        if self.dropped:
+            self.queue.put(self.__dropped_record())
+
+        self.running = False
+        self.listener.stop()
+
+    def close(self):
+        self.stop()
+        super().close()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records stay in the process, so only the message is merged (arguments may change before it's written)
+        # and `exc_info` is kept for handlers rendering tracebacks themselves
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def emit(self, record: logging.LogRecord):
+        if not self.running:
+            self.__write(record)
+            return
+
+        super().emit(record)
+
+    def enqueue(self, record: logging.LogRecord):
+        if self.drop_policy == "block":
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            if self.drop_policy == "drop_new":
+                self.dropped += 1
+                return
+
+        try:
+            self.queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        self.dropped += 1
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    """:internal:"""
+    def __write(self, record: logging.LogRecord):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    """:internal:"""
+    def __dropped_record(self) -> logging.LogRecord:
+        return logging.LogRecord(
+            "Ascender Framework", logging.WARNING, __file__, 0,
+            "%d log records were dropped because the logging queue was full", (self.dropped,), None,
+        )
@@ -1,56 +1,90 @@
 import json
 import logging
-from datetime import datetime
+import time
 
-from rich.console import Console
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Attributes every `LogRecord` has, everything else was passed with `extra=`
+RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
 
 
 class AscenderFormatter(logging.Formatter):
+    # Color-code log levels
+    level_markup = {
+        "DEBUG": "[cyan]DEBUG[/cyan]",
+        "INFO": "[green]INFO[/green]",
+        "WARNING": "[yellow]WARNING[/yellow]",
+        "ERROR": "[red]ERROR[/red]",
+        "CRITICAL": "[bold red]CRITICAL[/bold red]",
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._second: int | None = None
+        self._timestamp = ""
+
     def format(self, record: logging.LogRecord) -> str:
-        console = Console()
+        # Timestamp only changes once a second, records within it reuse the formatted one
+        second = int(record.created)
+        if second != self._second:
+            self._second = second
+            self._timestamp = time.strftime("%H:%M:%S", self.converter(record.created))
 
-        # Extract log details
-        timestamp = self.formatTime(record, "%H:%M:%S")
         level = record.levelname
-        logger_name = record.name
-        message = record.getMessage()
-
-        # Color-code log levels
-        level_markup = {
-            "DEBUG": "[cyan]DEBUG[/cyan]",
-            "INFO": "[green]INFO[/green]",
-            "WARNING": "[yellow]WARNING[/yellow]",
-            "ERROR": "[red]ERROR[/red]",
-            "CRITICAL": "[bold red]CRITICAL[/bold red]",
-        }
-
-        # Format log message
-        markup_message = (
-            f"[dim]{timestamp}[/dim] ┆ "
-            f"{level_markup.get(level, level)} ┆ "
-            f"[magenta]{logger_name}[/magenta] ┆ "
-            f"{message}"
-        )  # Message content
 
-        return markup_message
+        return (
+            f"[dim]{self._timestamp}[/dim] ┆ "
+            f"{self.level_markup.get(level, level)} ┆ "
+            f"[magenta]{record.name}[/magenta] ┆ "
+            f"{record.getMessage()}"
+        )
 
 
 class JsonAscenderFormatter(logging.Formatter):
-    def __init__(self, service: str | None = None):
+    """
+    Formats records as single-line JSON objects, attributes passed with `extra=` are included as fields.
+
+    Uses `orjson` when it's installed, falls back to the standard `json` module otherwise.
+    Values which aren't JSON serializable are written as their `str()`.
+    """
+
+    def __init__(self, service: str | None = None, use_orjson: bool | None = None):
+        """
+        Args:
+            service (str | None, optional): Value of the `service` field. Defaults to None (logger name).
+            use_orjson (bool | None, optional): Force (`True`) or disable (`False`) orjson. Defaults to None (use if installed).
+        """
         super().__init__()
+        if use_orjson and orjson is None:
+            raise ImportError("orjson is not installed. Install it with 'poetry add orjson'.")
+
         self.service = service
+        self.use_orjson = orjson is not None if use_orjson is None else use_orjson
+        self._second: int | None = None
+        self._timestamp = ""
 
     def format(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        if second != self._second:
+            self._second = second
+            self._timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+
         log_obj = {
-            "ts": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "ts": f"{self._timestamp}.{int((record.created - second) * 1_000_000):06d}Z",
             "severity": record.levelname,
             "service": self.service or record.name,
             "message": record.getMessage(),
         }
 
-        reserved = set(vars(logging.LogRecord("", 0, "", 0, "", (), None)))
         for key, value in record.__dict__.items():
-            if key not in reserved and key not in log_obj:
+            if key not in RESERVED_ATTRS and key not in log_obj:
                 log_obj[key] = value
 
-        return json.dumps(log_obj)
\ No newline at end of file
+        if self.use_orjson:
+            return orjson.dumps(log_obj, default=str).decode()
+
+        return json.dumps(log_obj, default=str, separators=(",", ":"))
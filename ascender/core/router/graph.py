@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, MutableSequence, Sequence
 from ascender.core.di.injector import AscenderInjector
 from ascender.core.router.interface.route import RouterRoute
+from ascender.core.router.manifest import RouteManifest
 from ascender.core.router.router import RouterNode
 
 if TYPE_CHECKING:
@@ -10,6 +11,7 @@ if TYPE_CHECKING:
 
 class RouterGraph:
     graph_nodes: MutableSequence[RouterNode]
+    manifest: RouteManifest | None
     
     def __init__(
         self,
@@ -17,29 +19,27 @@ class RouterGraph:
         graph: Sequence[RouterRoute],
         *,
         load_from_nodes: bool = False,
-        _graph_nodes: MutableSequence[RouterNode] = []
+        _graph_nodes: MutableSequence[RouterNode] | None = None
     ) -> None:
         self.injector = injector
         self.graph = graph
         self.load_from_nodes = load_from_nodes
-        self.graph_nodes = _graph_nodes
+        self.graph_nodes = list(_graph_nodes or [])
+        self.manifest = None
     
     def create_router_graph(self, application: Application):
         """
         Instantiates all routes and runs them.
-        Also it includes router into `FastAPI` one by one
+        Routes of every node are flattened into a `RouteManifest` once and mounted straight onto `FastAPI`
 
         Args:
             application (Application): Main Application object
         """
-        if self.load_from_nodes:
-            for node in self.graph_nodes:
-                # Include router into host
-                application.app.include_router(node.router)
-        else:
-            for route in self.graph:
-                _node = RouterNode(route, self.injector)
-                
-                # Include router into host
-                application.app.include_router(_node.router)
-                self.graph_nodes.append(_node)
\ No newline at end of file
+        if self.manifest is None:
+            if not self.load_from_nodes:
+                for route in self.graph:
+                    self.graph_nodes.append(RouterNode(route, self.injector))
+
+            self.manifest = RouteManifest(self.graph_nodes)
+
+        self.manifest.mount(application.app.router)
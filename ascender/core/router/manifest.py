@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+from fastapi import APIRouter
+
+if TYPE_CHECKING:
+    from ascender.core.router.router import RouterNode
+
+
+@dataclass(slots=True, frozen=True)
+class RouteEntry:
+    """
+    Endpoint of a router node, `metadata` are `APIRouter.add_api_route` arguments relative to the node.
+    """
+    endpoint: Callable[..., Any]
+    metadata: dict[str, Any]
+
+
+@dataclass(slots=True, frozen=True)
+class ManifestRoute:
+    """
+    Endpoint with the full path and the settings of every router node above it merged in.
+    """
+    path: str
+    endpoint: Callable[..., Any]
+    metadata: dict[str, Any]
+
+
+class RouteManifest:
+    """
+    Flattened route table of a router graph.
+
+    Nested `APIRouter`s make FastAPI rebuild every route (dependency analysis, response fields) once per nesting level
+    when routers are included into each other. The manifest merges node settings the same way `include_router` does,
+    so every route is built once, mounted straight onto the application's router.
+    """
+
+    def __init__(self, nodes: Sequence[RouterNode]) -> None:
+        self.routes: list[ManifestRoute] = []
+        for node in nodes:
+            self.__flatten(node, "", [], True, False)
+
+    def mount(self, router: APIRouter):
+        for route in self.routes:
+            router.add_api_route(route.path, route.endpoint, **route.metadata)
+
+    """:internal:"""
+    def __flatten(self, node: RouterNode, prefix: str, tags: list[Any], include_in_schema: bool, deprecated: bool):
+        route = node.route
+        prefix = prefix + node.prefix
+        tags = [*tags, *route.get("tags", [])]
+        include_in_schema = include_in_schema and route.get("include_in_schema", False)
+        deprecated = deprecated or route.get("deprecated", False)
+
+        # Children are mounted before the node's own routes, as with nested routers
+        for child in node.children:
+            self.__flatten(child, prefix, tags, include_in_schema, deprecated)
+
+        for entry in node.routes:
+            metadata = dict(entry.metadata)
+            path = metadata.pop("path")
+            metadata["tags"] = [*tags, *(metadata.get("tags") or [])]
+            metadata["include_in_schema"] = include_in_schema and metadata.get("include_in_schema", True)
+            metadata["deprecated"] = metadata.get("deprecated") or deprecated
+
+            self.routes.append(ManifestRoute(prefix + path, entry.endpoint, metadata))
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends
 from ascender.core.applications.root_injector import RootInjector
 from ascender.core.di.injector import AscenderInjector
 from ascender.core.errors.not_standalone import NotStandaloneError
+from ascender.core.router.manifest import RouteEntry
 from ascender.core.router.interface.route import RouterRoute
 from ascender.core.router.utils.controller import is_direct_controller, is_module_controller, unwrap_module_controller
 from ascender.core.struct.controller_ref import ControllerRef
@@ -17,22 +18,18 @@ from ascender.guards.paramguard import ParamGuard
 
 class RouterNode:
     controller: ControllerRef
-    router: APIRouter
     children: list["RouterNode"]
+    routes: list[RouteEntry]
 
     def __init__(self, route: RouterRoute, injector: AscenderInjector | None = None) -> None:
         self.injector = injector if injector else RootInjector().existing_injector
 
         self.logger = getLogger("Ascender Framework")
         self.route = route
+        self.prefix = route["path"].rstrip("/")
         self.children = []
-
-        self.router = APIRouter(
-            prefix=route["path"].rstrip("/"), 
-            tags=route.get("tags", []), # type: ignore
-            include_in_schema=route.get("include_in_schema", False),
-            deprecated=route.get("deprecated", False)
-        )
+        self.routes = []
+        self._router: APIRouter | None = None
 
         self.__process_children(route.get("children", []), self.injector)
         self.hydrate()
@@ -49,9 +46,6 @@ class RouterNode:
         for child_route in children:
             # Create another router node
             _node = RouterNode(child_route, injector)
-
-            # Include it's router into our router
-            self.router.include_router(_node.router)
             self.children.append(_node)
     
     def __load_children(self, module: type[AscModuleRef]):
@@ -72,18 +66,46 @@ class RouterNode:
         children = module._injector.get("ROUTER_MODULE")
         self.__process_children(children, module._injector)
     
+    @property
+    def router(self) -> APIRouter:
+        """
+        Nested `APIRouter` of the node and its children, built on first access.
+        Application mounts routes from `RouteManifest` instead, which doesn't need it.
+        """
+        if self._router is None:
+            self._router = APIRouter(
+                prefix=self.prefix,
+                tags=self.route.get("tags", []), # type: ignore
+                include_in_schema=self.route.get("include_in_schema", False),
+                deprecated=self.route.get("deprecated", False)
+            )
+
+            for child in self.children:
+                self._router.include_router(child.router)
+
+            for entry in self.routes:
+                self._router.add_api_route(endpoint=entry.endpoint, **entry.metadata)
+
+        return self._router
+
     def load_routes(self):
         """
-        Loads all routes of controller into `APIRouter` or `RouterNode`
+        Collects all routes of controller into `routes` of the `RouterNode`
         """
         routes = self.controller.__controller__.get_routes()
         for callback, metadata in routes.items():
-            if not self.router.prefix and not metadata.get("path", None):
+            # Metadata is shared by every node mounting the controller
+            metadata = dict(metadata)
+            if not self.prefix and not metadata.get("path", None):
                 metadata["path"] = "/"
             
             metadata["dependencies"] = self.load_single_guards(self.route.get("guards", []), metadata.get("dependencies", []))
 
-            self.router.add_api_route(endpoint=callback, **metadata)
+            # Guards applied with decorators are injected once here, requests only run their checks
+            for guard in getattr(callback, "__guards__", []):
+                guard.handle_di()
+
+            self.routes.append(RouteEntry(callback, metadata))
             
             self.logger.debug(f"Route {metadata['path']} of {self.controller.__class__.__name__} successfully mounted to webserver")
     
@@ -117,7 +139,7 @@ class RouterNode:
             # Handles Dependency Injection of the guard (executes `__post_init__`)
             # NOTE: If guard was assigned to module / standalone controller, it will have access to the scope of that module / standalone controller.
             guard.handle_di()
-            _guard_dependencies.append(Depends(guard.can_activate))
+            _guard_dependencies.extend(guard.route_dependencies())
         
         return [*dependencies, *_guard_dependencies]
 
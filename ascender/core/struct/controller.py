@@ -15,6 +15,8 @@ T = TypeVar("T")
 
 class Controller(AscModule):
     controller_ref: type[ControllerRef] | ControllerRef
+    route_table: list[tuple[str, dict[str, Any]]]
+    hook_table: list[tuple[str, dict[str, Any]]]
 
     def __init__(
         self,
@@ -57,11 +59,8 @@ class Controller(AscModule):
 
         routes: MutableMapping[Callable[..., Any], Any] = {}
 
-        for name, method in self.controller_ref.__class__.__dict__.items():
-            if hasattr(method, "__cmetadata__"):
-                # Monkey-patched metadata from controller's methods which were wrapped by @Get, @Post, @Put, @Patch, @Delete decorators
-                routes[getattr(self.controller_ref, name)
-                       ] = method.__cmetadata__
+        for name, cmetadata in self.route_table:
+            routes[getattr(self.controller_ref, name)] = cmetadata
 
         return routes
     
@@ -82,9 +81,8 @@ class Controller(AscModule):
         
         hooks: MutableMapping[Callable[..., Any], Any] = {}
 
-        for name, method in self.controller_ref.__class__.__dict__.items():
-            if hasattr(method, "__hook_metadata__"):
-                hooks[getattr(self.controller_ref, name)] = method.__hook_metadata__
+        for name, hook_metadata in self.hook_table:
+            hooks[getattr(self.controller_ref, name)] = hook_metadata
 
         return hooks
 
@@ -118,6 +116,16 @@ class Controller(AscModule):
         self.controller_ref = controller_ref
         self.controller_ref.__controller__ = self
 
+        # Route metadata is collected once, when the class is decorated, instead of scanning the class on every mount
+        self.route_table = []
+        self.hook_table = []
+        for name, method in controller_ref.__dict__.items():
+            if hasattr(method, "__cmetadata__"):
+                # Monkey-patched metadata from controller's methods which were wrapped by @Get, @Post, @Put, @Patch, @Delete decorators
+                self.route_table.append((name, method.__cmetadata__))
+            if hasattr(method, "__hook_metadata__"):
+                self.hook_table.append((name, method.__hook_metadata__))
+
         # Set `__asc_module__` metadata if standalone
         if self.standalone:
             super().__init__(self.imports, [self.controller_ref, *self.guards], self.providers, self.exports)
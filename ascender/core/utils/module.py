@@ -61,4 +61,7 @@ def module_import(module: type[AscModuleRef], injector: AscenderInjector):
             else:
                 injector.dependencies[export].add(record)
         else:
-            raise injector.NONE_INJECTOR.get(export)
\ No newline at end of file
+            raise injector.NONE_INJECTOR.get(export)
+
+    # Records were added after the injector was created, cached resolutions may be stale
+    injector.invalidate()
\ No newline at end of file
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from functools import wraps
-from typing import Any, Callable, final
+from typing import Any, Callable, Literal, final
 
 from fastapi.params import Depends
 
@@ -15,6 +15,13 @@ class Guard(ABC):
     __di_module__: AscModuleRef | None = None
     __declaration_type__: str = "guard"
 
+    scope: Literal["singleton", "request"] = "singleton"
+    """
+    When dependencies of the guard are injected. `singleton` injects them once per guard instance (when the route is mounted),
+    `request` injects them again on every request, for guards depending on per-request state.
+    """
+    __di_resolved: bool = False
+
     def __init__(self):
         """
         For Guard configurations and parameters
@@ -32,8 +39,13 @@ class Guard(ABC):
     
     @final
     def handle_di(self):
+        if self.__di_resolved and self.scope == "singleton":
+            return
+
         if not self.__di_module__:
-            return RootInjector().existing_injector.inject_factory_def(self.__post_init__)() # type: ignore
+            RootInjector().existing_injector.inject_factory_def(self.__post_init__)() # type: ignore
+            self.__di_resolved = True
+            return
         
         di_module = self.__di_module__
         
@@ -45,17 +57,31 @@ class Guard(ABC):
         
         # Execute `self.__post_init__` method
         self.__di_module__._injector.inject_factory_def(self.__post_init__)() # type: ignore
+        self.__di_resolved = True
+
+    def route_dependencies(self) -> list[Depends]:
+        """
+        Dependencies added to guarded routes, `can_activate` and, for `request` scoped guards, `handle_di`.
+        Singleton guards are injected by the router when the route is mounted.
+        """
+        if self.scope == "request":
+            return [Depends(self.handle_di), Depends(self.can_activate)]
+
+        return [Depends(self.can_activate)]
     
     def __call__(self, executable: Callable[..., None]) -> Any:
+        # Router injects these guards once, when the route is mounted
+        executable.__guards__ = [*getattr(executable, "__guards__", []), self]
+
         if not getattr(executable, "__cmetadata__", None):
-            executable.__cmetadata__ = {"dependencies": [Depends(self.handle_di), Depends(self.can_activate)]}
+            executable.__cmetadata__ = {"dependencies": self.route_dependencies()}
         
         else:
             if not executable.__cmetadata__.get("dependencies", None):
-                executable.__cmetadata__["dependencies"] = [Depends(self.handle_di), Depends(self.can_activate)]
+                executable.__cmetadata__["dependencies"] = self.route_dependencies()
                 return executable
             
-            executable.__cmetadata__["dependencies"] = [*executable.__cmetadata__["dependencies"], Depends(self.handle_di), Depends(self.can_activate)]
+            executable.__cmetadata__["dependencies"] = [*executable.__cmetadata__["dependencies"], *self.route_dependencies()]
         
         @wraps(executable)
         async def wrapper(*args, **kwargs):
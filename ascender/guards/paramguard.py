@@ -1,6 +1,6 @@
 from functools import wraps
 from typing import final
-from typing import Any, Callable
+from typing import Any, Callable, Literal
 
 from fastapi.params import Depends
 
@@ -12,6 +12,13 @@ from ascender.core.utils.module import load_module
 class ParamGuard:
     __di_module__: AscModuleRef | None = None
     __declaration_type__: str = "guard"
+
+    scope: Literal["singleton", "request"] = "singleton"
+    """
+    When dependencies of the guard are injected. `singleton` injects them once per guard instance (when the route is mounted),
+    `request` injects them again on every request, for guards depending on per-request state.
+    """
+    __di_resolved: bool = False
     
     def __init__(self):
         ...
@@ -21,8 +28,12 @@ class ParamGuard:
 
     @final
     def handle_di(self):
+        if self.__di_resolved and self.scope == "singleton":
+            return
+
         if not self.__di_module__:
             RootInjector().injector.inject_factory_def(self.__post_init__)() # type: ignore
+            self.__di_resolved = True
             return
         
         di_module = self.__di_module__
@@ -35,6 +46,14 @@ class ParamGuard:
         
         # Execute `self.__post_init__` method
         self.__di_module__._injector.inject_factory_def(self.__post_init__)() # type: ignore
+        self.__di_resolved = True
+
+    def route_dependencies(self) -> list[Depends]:
+        """
+        Dependencies added to guarded routes, `handle_di` for `request` scoped guards.
+        Singleton guards are injected by the router when the route is mounted.
+        """
+        return [Depends(self.handle_di)] if self.scope == "request" else []
 
     def _define_dependencies(self, executable: Callable[..., None]):
         """
@@ -63,15 +82,15 @@ class ParamGuard:
         return executable
     
     def __call__(self, executable: Callable[..., Any]):
-        # NOTE: This function allows dependency injection on the guard only when it will be called
+        # NOTE: Router injects dependencies of the guard once, when the route is mounted (see `scope`)
         _updatedfunc = self._define_dependencies(executable)
-        
+        _updatedfunc.__guards__ = [*getattr(_updatedfunc, "__guards__", []), self]
         
         if hasattr(_updatedfunc, "__cmetadata__"):
-            _updatedfunc.__cmetadata__["dependencies"] = [*executable.__cmetadata__.get("dependencies", []), Depends(self.handle_di)]
+            _updatedfunc.__cmetadata__["dependencies"] = [*executable.__cmetadata__.get("dependencies", []), *self.route_dependencies()]
         
         else:
-            _updatedfunc.__cmetadata__ = {"dependencies": [Depends(self.handle_di)]}
+            _updatedfunc.__cmetadata__ = {"dependencies": self.route_dependencies()}
 
         @wraps(executable)
         async def wrapper(*args, **kwargs):
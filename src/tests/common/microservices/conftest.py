@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from ascender.common.microservices.codecs import get_codec
+from ascender.common.microservices.instances.bus import SubscriptionEventBus
+from ascender.common.microservices.instances.tcp.framing import get_framing
+
+
+class FakeWriter:
+    """In-memory stand-in for `asyncio.StreamWriter`, keeps every written JSON line."""
+
+    def __init__(self):
+        self.messages: list[dict] = []
+        self.closed = False
+
+    def write(self, data: bytes):
+        self.messages.append(json.loads(data))
+
+    async def drain(self):
+        ...
+
+    def get_extra_info(self, name: str, default=None):
+        return ("127.0.0.1", 50000) if name == "peername" else default
+
+    def is_closing(self) -> bool:
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        ...
+
+
+class FakeTransport:
+    """Minimal transporter exposing the event bus and writer, enough to construct TCP RPC / event transports."""
+
+    def __init__(self, writer: FakeWriter, codec: str | None = None):
+        self.event_bus = SubscriptionEventBus()
+        self.writer = writer
+        self.codec = get_codec(codec)
+        self.framing = get_framing()
+
+
+@pytest.fixture
+def tcp_writer():
+    return FakeWriter()
+
+
+@pytest.fixture
+def tcp_transport(tcp_writer):
+    return FakeTransport(tcp_writer)
@@ -0,0 +1,142 @@
+"""
+Coverage for pluggable microservice codecs.
+
+`legacy` must keep the original wire format (payload embedded as a JSON string),
+`json` and `msgpack` nest the payload, so a message is serialized exactly once.
+"""
+import json
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from ascender.common.microservices.abc.codec import Codec
+from ascender.common.microservices.codecs import JSONCodec, LegacyJSONCodec, get_codec
+from ascender.common.microservices.instances.tcp.rpc import TCPRPCTransport
+from ascender.common.microservices.utils.data_parser import decode_message, parse_data
+
+from .conftest import FakeTransport, FakeWriter
+
+
+class Order(BaseModel):
+    id: int
+    items: list[str]
+
+
+# --------------------------------------------------------------------------- #
+# Codec resolution
+# --------------------------------------------------------------------------- #
+def test_get_codec():
+    assert isinstance(get_codec(), LegacyJSONCodec)
+    assert isinstance(get_codec("json"), JSONCodec)
+
+    codec = JSONCodec(use_orjson=False)
+    assert get_codec(codec) is codec
+
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+# --------------------------------------------------------------------------- #
+# Round trips
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize("codec", ["legacy", "json", JSONCodec(use_orjson=False), "msgpack"])
+def test_envelope_round_trip(codec: str | Codec):
+    if codec == "msgpack":
+        pytest.importorskip("msgpack")
+
+    codec = get_codec(codec)
+    order = Order(id=1, items=["a", "b"])
+
+    envelope = {"pattern": "orders", "correlationId": "1", "payload": codec.encode_payload(order)}
+    received = codec.decode(codec.encode(envelope))
+
+    assert received["pattern"] == "orders"
+    assert Order.model_validate(codec.decode_payload(received["payload"])) == order
+
+
+def test_legacy_wire_format():
+    codec = get_codec("legacy")
+    order = Order(id=1, items=["a"])
+
+    envelope = {"pattern": "orders", "correlationId": "1", "payload": codec.encode_payload(order)}
+    wire = codec.encode(envelope)
+
+    # Releases before codecs were introduced embed the payload as a JSON string
+    assert json.loads(wire)["payload"] == parse_data(order)
+    assert decode_message(json.loads(wire)["payload"]) == order.model_dump()
+    assert codec.encode_value(order) == parse_data(order).encode()
+
+
+def test_json_payload_is_nested():
+    codec = get_codec("json")
+
+    wire = codec.encode({"payload": codec.encode_payload(Order(id=1, items=["a"]))})
+
+    assert json.loads(wire) == {"payload": {"id": 1, "items": ["a"]}}
+
+
+def test_msgpack_does_not_guess_json():
+    pytest.importorskip("msgpack")
+    codec = get_codec("msgpack")
+
+    for value in (5, 12, 55, "5", {"payload": 5}):
+        assert codec.decode(codec.encode(value)) == value
+        assert codec.decode_value(codec.encode_value(value)) == value
+
+    # Scalar JSON payloads are read as MessagePack, never as JSON
+    assert codec.decode(b"5") == 53
+    for data in (b"12", b'{"payload": 1}', "12"):
+        with pytest.raises((ValueError, TypeError)):
+            codec.decode_value(data)
+
+
+def test_msgpack_int_123_is_not_json():
+    pytest.importorskip("msgpack")
+    codec = get_codec("msgpack")
+
+    # 123 is packed as a single `{` byte
+    assert codec.encode(123) == b"{"
+    assert codec.decode(codec.encode(123)) == 123
+    assert codec.decode(codec.encode({"payload": 123})) == {"payload": 123}
+
+
+# --------------------------------------------------------------------------- #
+# Transport integration
+# --------------------------------------------------------------------------- #
+async def test_tcp_rpc_round_trip_with_json_codec():
+    writer = FakeWriter()
+    rpc = TCPRPCTransport(FakeTransport(writer, codec="json"), writer=writer)
+
+    observable = await rpc.send_nack_request("orders.get", Order(id=1, items=[]), timeout=5)
+    request = writer.messages[0]
+    assert request["payload"] == {"id": 1, "items": []}
+
+    await rpc.send_response("_rpc:response", f"response-{request['correlationId']}", {"ok": True})
+    response = writer.messages[1]
+    await rpc.process_response(response["correlationId"], response["payload"])
+
+    assert await observable == {"ok": True}
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: envelope encode + decode cost per codec
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+def test_codec_throughput():
+    N = 5_000
+    order = Order(id=1, items=[f"item-{i}" for i in range(20)])
+
+    def measure(codec: Codec) -> float:
+        started = time.perf_counter()
+        for _ in range(N):
+            envelope = {"pattern": "orders", "correlationId": "1", "payload": codec.encode_payload(order)}
+            received = codec.decode(codec.encode(envelope))
+            codec.decode_payload(received["payload"])
+        return N / (time.perf_counter() - started)
+
+    legacy_rate = measure(get_codec("legacy"))
+    json_rate = measure(get_codec("json"))
+
+    print(f"\nCodecs: legacy {legacy_rate:,.0f} msg/s, json {json_rate:,.0f} msg/s")
+    assert json_rate > legacy_rate
@@ -0,0 +1,107 @@
+"""
+Coverage for the transporter listen-loop dispatching (`MessageDispatcher`).
+
+Locks the behavior of each dispatch mode:
+  * `inline` awaits every handler before the next message is accepted;
+  * `concurrent` overlaps handlers but never runs more than `max_in_flight`,
+    and `dispatch()` blocks (pausing the reader) while the limit is reached;
+  * `ordered` keeps messages of one key sequential while other keys proceed.
+"""
+import asyncio
+
+import pytest
+
+from ascender.common.microservices.utils.dispatcher import MessageDispatcher
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.gates: dict[str, asyncio.Event] = {}
+
+    def gate(self, name: str) -> asyncio.Event:
+        return self.gates.setdefault(name, asyncio.Event())
+
+    async def __call__(self, context, pattern, data, metadata):
+        self.started.append(data)
+        await self.gate(data).wait()
+        self.finished.append(data)
+
+
+async def test_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        MessageDispatcher(RecordingHandler(), mode="parallel")  # type: ignore[arg-type]
+
+
+async def test_inline_awaits_handler():
+    handler = RecordingHandler()
+    dispatcher = MessageDispatcher(handler)
+
+    handler.gate("a").set()
+    await dispatcher.dispatch(None, "topic", "a", {})  # type: ignore[arg-type]
+
+    assert handler.finished == ["a"]
+    assert dispatcher.in_flight == 0
+
+
+async def test_concurrent_is_bounded_and_applies_backpressure():
+    handler = RecordingHandler()
+    dispatcher = MessageDispatcher(handler, mode="concurrent", max_in_flight=2)
+
+    await dispatcher.dispatch(None, "topic", "a", {})  # type: ignore[arg-type]
+    await dispatcher.dispatch(None, "topic", "b", {})  # type: ignore[arg-type]
+    await asyncio.sleep(0)
+    assert dispatcher.in_flight == 2
+
+    blocked = asyncio.create_task(dispatcher.dispatch(None, "topic", "c", {}))  # type: ignore[arg-type]
+    await asyncio.sleep(0.01)
+    assert not blocked.done(), "reader must pause while max_in_flight handlers run"
+    assert handler.started == ["a", "b"]
+
+    handler.gate("b").set()
+    await blocked
+    await asyncio.sleep(0)
+    assert handler.started == ["a", "b", "c"]
+
+    handler.gate("a").set()
+    handler.gate("c").set()
+    await dispatcher.join()
+    assert dispatcher.in_flight == 0
+
+
+async def test_ordered_keeps_key_sequential():
+    handler = RecordingHandler()
+    dispatcher = MessageDispatcher(handler, mode="ordered", max_in_flight=10)
+
+    await dispatcher.dispatch(None, "topic", "k1-first", {}, key="k1")  # type: ignore[arg-type]
+    await dispatcher.dispatch(None, "topic", "k1-second", {}, key="k1")  # type: ignore[arg-type]
+    await dispatcher.dispatch(None, "topic", "k2-first", {}, key="k2")  # type: ignore[arg-type]
+    await asyncio.sleep(0)
+
+    assert handler.started == ["k1-first", "k2-first"]
+    assert dispatcher.queue_depth == 1
+
+    handler.gate("k2-first").set()
+    handler.gate("k1-second").set()
+    await asyncio.sleep(0)
+    assert "k1-second" not in handler.started
+
+    handler.gate("k1-first").set()
+    await dispatcher.join()
+
+    assert handler.finished.index("k1-first") < handler.finished.index("k1-second")
+    assert dispatcher.queue_depth == 0 and dispatcher.in_flight == 0
+
+
+async def test_handler_errors_do_not_leak_slots():
+    async def failing(*_):
+        raise RuntimeError("boom")
+
+    dispatcher = MessageDispatcher(failing, mode="concurrent", max_in_flight=1)
+
+    for _ in range(3):
+        await dispatcher.dispatch(None, "topic", None, {})  # type: ignore[arg-type]
+    await dispatcher.join()
+
+    assert dispatcher.in_flight == 0
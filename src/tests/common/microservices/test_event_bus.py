@@ -0,0 +1,133 @@
+"""
+Coverage for topic routing of `SubscriptionEventBus` (`TopicRouter`).
+
+Locks the matching semantics of the previous regex-per-subscription loop
+(`*` matches any sequence of characters, including an empty one) and checks
+that routes follow subscribe / unsubscribe without a full rebuild.
+"""
+import time
+
+import pytest
+
+from ascender.common.microservices.instances.bus import SubscriptionEventBus
+from ascender.common.microservices.utils.topic_router import TopicRouter
+
+
+def make_recorder(name: str, calls: list[str]):
+    async def callback(context, data, metadata):
+        calls.append(name)
+
+    return callback
+
+
+# --------------------------------------------------------------------------- #
+# Router
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize(
+    ("pattern", "topic", "expected"),
+    [
+        ("USER_*", "USER_CREATED", True),
+        ("USER_*", "USER_", True),
+        ("USER_*", "ORDER_CREATED", False),
+        ("*.created", "user.created", True),
+        ("*.created", "user.created.v2", False),
+        ("a*b*c", "a-b-c", True),
+        ("a*b*c", "abc", True),
+        ("a*b*c", "acb", False),
+        ("a**", "abc", True),
+        ("*", "", True),
+        ("user.*", "user.x", True),
+    ],
+)
+def test_wildcard_semantics(pattern: str, topic: str, expected: bool):
+    router = TopicRouter()
+    router.add(pattern)
+
+    assert (pattern in router.match(topic)) is expected
+
+
+def test_exact_and_wildcard_matches():
+    router = TopicRouter()
+    for pattern in ("orders.created", "orders.*", "*.created", "users.*", 42):
+        router.add(pattern)
+
+    matched = router.match("orders.created")
+    assert matched[0] == "orders.created", "exact pattern goes first"
+    assert set(matched) == {"orders.created", "orders.*", "*.created"}
+    assert router.match(42) == [42]
+    assert router.match("payments.refunded") == []
+
+
+def test_remove_prunes_only_removed_pattern():
+    router = TopicRouter()
+    router.add("orders.*")
+    router.add("orders.*.v2")
+
+    router.remove("orders.*")
+
+    assert router.match("orders.created") == []
+    assert router.match("orders.created.v2") == ["orders.*.v2"]
+
+    router.remove("orders.*.v2")
+    assert router._root.is_empty()
+
+
+# --------------------------------------------------------------------------- #
+# Event bus
+# --------------------------------------------------------------------------- #
+async def test_emit_routes_to_matching_subscriptions():
+    bus = SubscriptionEventBus()
+    calls: list[str] = []
+
+    bus.subscribe("orders.created", make_recorder("exact", calls))
+    bus.subscribe("orders.*", make_recorder("wildcard", calls))
+    bus.subscribe("users.*", make_recorder("other", calls))
+
+    await bus.emit(None, "orders.created", None, {})
+
+    assert sorted(calls) == ["exact", "wildcard"]
+
+
+async def test_routes_follow_subscription_changes():
+    bus = SubscriptionEventBus()
+    calls: list[str] = []
+
+    token = bus.subscribe("orders.*", make_recorder("first", calls))
+    await bus.emit(None, "orders.created", None, {})
+
+    bus.subscribe("orders.*", make_recorder("second", calls))
+    await bus.emit(None, "orders.created", None, {})
+
+    bus.unsubscribe("orders.*", token)
+    await bus.emit(None, "orders.created", None, {})
+
+    bus.unsubscribe("orders.*")
+    await bus.emit(None, "orders.created", None, {})
+
+    assert calls == ["first", "first", "second", "second"]
+
+
+# --------------------------------------------------------------------------- #
+# Perf guard: lookup cost does not grow with the amount of subscriptions
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+def test_match_cost_independent_of_subscription_count():
+    topic = "service_7.orders.created"
+
+    def measure(subscriptions: int) -> float:
+        router = TopicRouter()
+        for i in range(subscriptions):
+            router.add(f"service_{i}.orders.*")
+
+        started = time.perf_counter()
+        for _ in range(2_000):
+            matched = router.match(topic)
+        elapsed = time.perf_counter() - started
+
+        assert matched == ["service_7.orders.*"]
+        return elapsed
+
+    small, large = measure(10), measure(10_000)
+
+    # a regex-per-subscription loop would be ~1000x slower here
+    assert large < small * 5
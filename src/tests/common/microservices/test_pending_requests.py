@@ -0,0 +1,157 @@
+"""
+Coverage for the correlation-id dispatch of RPC responses (`PendingRequests`).
+
+Locks the properties the RPC transports rely on:
+  * a response completes exactly the one future registered under its id,
+    every other pending request stays untouched;
+  * `defer-<id>` prolongs only the deferred request's timeout;
+  * serialized `RPCException` payloads fail only their own request;
+  * entries never outlive their future (resolved, timed out or cancelled).
+"""
+import asyncio
+import json
+import time
+
+import pytest
+
+from ascender.common.microservices.exceptions.rpc_exception import RPCException
+from ascender.common.microservices.instances.tcp.rpc import TCPRPCTransport
+from ascender.common.microservices.utils.pending_requests import PendingRequests
+
+
+# --------------------------------------------------------------------------- #
+# Registry
+# --------------------------------------------------------------------------- #
+async def test_response_completes_only_its_own_request():
+    pending = PendingRequests()
+    futures = {cid: pending.register(cid, 5) for cid in ("a", "b", "c")}
+
+    assert pending.dispatch("response-b", '{"ok": true}')
+    await asyncio.sleep(0)
+
+    assert futures["b"].result() == {"ok": True}
+    assert not futures["a"].done() and not futures["c"].done()
+    assert "b" not in pending and len(pending) == 2
+
+
+async def test_unknown_and_unprefixed_ids_are_ignored():
+    pending = PendingRequests()
+    future = pending.register("a", 5)
+
+    assert not pending.dispatch("response-missing", "1")
+    assert not pending.dispatch("a", "1")
+    assert not future.done()
+
+
+async def test_request_times_out_and_is_discarded():
+    pending = PendingRequests()
+    future = pending.register("a", 0.01)
+
+    with pytest.raises(TimeoutError):
+        await future
+
+    assert len(pending) == 0
+
+
+async def test_defer_extends_timeout():
+    pending = PendingRequests()
+    deferred = pending.register("a", 0.05)
+    other = pending.register("b", 0.05)
+
+    await asyncio.sleep(0.03)
+    assert pending.dispatch("defer-a", "defer")
+
+    await asyncio.sleep(0.04)
+    assert other.done() and isinstance(other.exception(), TimeoutError)
+    assert not deferred.done()
+
+    pending.dispatch("response-a", "42")
+    assert await deferred == 42
+
+
+async def test_rpc_exception_rejects_only_its_request():
+    pending = PendingRequests()
+    failed = pending.register("a", 5)
+    alive = pending.register("b", 5)
+
+    error = RPCException("boom", code=418)
+    pending.dispatch("response-a", json.dumps(error.to_dict()))
+
+    with pytest.raises(RPCException) as exc_info:
+        await failed
+
+    assert exc_info.value.code == 418
+    assert not alive.done()
+
+
+async def test_cancelled_request_is_discarded():
+    pending = PendingRequests()
+    future = pending.register("a", 5)
+    future.cancel()
+    await asyncio.sleep(0)
+
+    assert len(pending) == 0
+    assert not pending.dispatch("response-a", "1")
+
+
+async def test_reject_all():
+    pending = PendingRequests()
+    futures = [pending.register(str(i), 5) for i in range(3)]
+
+    assert pending.reject_all(ConnectionError("lost")) == 3
+    assert all(isinstance(f.exception(), ConnectionError) for f in futures)
+
+
+# --------------------------------------------------------------------------- #
+# Transport integration
+# --------------------------------------------------------------------------- #
+async def test_tcp_rpc_transport_routes_responses_by_correlation_id(tcp_transport, tcp_writer):
+    rpc = TCPRPCTransport(tcp_transport, writer=tcp_writer)
+
+    first = asyncio.create_task(rpc.send_request("sum", [1, 2], 5))
+    second = asyncio.create_task(rpc.send_request("sum", [3, 4], 5))
+    await asyncio.sleep(0)
+
+    cid_first, cid_second = (m["correlationId"] for m in tcp_writer.messages)
+
+    await rpc.process_response(f"response-{cid_second}", "7")
+    assert await second == 7
+    assert not first.done()
+
+    await rpc.process_response(f"response-{cid_first}", "3")
+    assert await first == 3
+    assert len(rpc.pending_requests) == 0
+
+
+async def test_tcp_rpc_transport_observable_request(tcp_transport, tcp_writer):
+    rpc = TCPRPCTransport(tcp_transport, writer=tcp_writer)
+
+    observable = await rpc.send_nack_request("sum", [1, 2], 5)
+    received = []
+    observable.subscribe(on_next=received.append)
+
+    await rpc.process_response(f"response-{tcp_writer.messages[0]['correlationId']}", "3")
+    await asyncio.sleep(0)
+
+    assert received == [3]
+
+
+# --------------------------------------------------------------------------- #
+# Perf guard: dispatch cost does not depend on the amount of pending requests
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+async def test_dispatch_scales_with_pending_requests():
+    N = 20_000
+    pending = PendingRequests()
+    futures = [pending.register(str(i), 30) for i in range(N)]
+
+    started = time.perf_counter()
+    for i in range(N):
+        pending.dispatch(f"response-{i}", "1")
+    elapsed = time.perf_counter() - started
+
+    await asyncio.sleep(0)
+    assert all(f.done() for f in futures)
+    assert len(pending) == 0
+    # O(pending) fan-out would be ~2e8 filter evaluations here
+    assert elapsed < 2.0
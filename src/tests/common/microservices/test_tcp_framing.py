@@ -0,0 +1,119 @@
+"""
+Coverage for TCP framing (`NewlineFraming`, `LengthPrefixedFraming`).
+
+Length-prefixed frames are parsed out of one reusable buffer, may contain
+newlines and arbitrary bytes, and are bounded by `max_frame_size`.
+"""
+import asyncio
+import time
+
+import pytest
+
+from ascender.common.microservices.codecs import get_codec
+from ascender.common.microservices.instances.bus import SubscriptionEventBus
+from ascender.common.microservices.instances.tcp.client import TCPClient
+from ascender.common.microservices.instances.tcp.framing import (
+    FrameTooLargeError,
+    LengthPrefixedFraming,
+    NewlineFraming,
+    get_framing,
+)
+
+
+def make_reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def read_all(framing, reader: asyncio.StreamReader) -> list[bytes]:
+    return [bytes(frame) async for frame in framing.frames(reader)]
+
+
+async def test_length_prefixed_round_trip():
+    framing = LengthPrefixedFraming()
+    messages = [b'{"text": "line\\nbreak"}', b"\n\x00\xff", b""]
+
+    reader = make_reader(b"".join(framing.encode(message) for message in messages))
+
+    assert await read_all(framing, reader) == messages
+
+
+async def test_frames_split_across_reads():
+    framing = LengthPrefixedFraming()
+    messages = [b"a" * 100_000, b"b" * 10, b"c" * 70_000]
+    data = b"".join(framing.encode(message) for message in messages)
+
+    reader = asyncio.StreamReader()
+    for start in range(0, len(data), 1_000):
+        reader.feed_data(data[start:start + 1_000])
+    reader.feed_eof()
+
+    assert await read_all(framing, reader) == messages
+
+
+async def test_truncated_frame_is_end_of_stream():
+    framing = LengthPrefixedFraming()
+
+    reader = make_reader(framing.encode(b"complete") + framing.encode(b"truncated")[:-3])
+
+    assert await read_all(framing, reader) == [b"complete"]
+
+
+async def test_max_frame_size_guard():
+    framing = LengthPrefixedFraming(max_frame_size=8)
+
+    with pytest.raises(FrameTooLargeError):
+        framing.encode(b"x" * 9)
+
+    with pytest.raises(FrameTooLargeError):
+        await read_all(framing, make_reader(LengthPrefixedFraming().encode(b"x" * 9)))
+
+
+async def test_msgpack_over_length_framing():
+    pytest.importorskip("msgpack")
+    msgpack_codec = get_codec("msgpack")
+    framing = LengthPrefixedFraming()
+    envelope = {"pattern": "orders", "payload": {"blob": b"\n\x00", "text": "a\nb"}}
+
+    reader = make_reader(framing.encode(msgpack_codec.encode(envelope)) * 2)
+
+    assert [msgpack_codec.decode(frame) async for frame in framing.frames(reader)] == [envelope, envelope]
+
+
+def test_binary_codec_requires_length_framing():
+    pytest.importorskip("msgpack")
+    bus = SubscriptionEventBus()
+
+    with pytest.raises(ValueError):
+        TCPClient(bus, {"codec": "msgpack"})
+
+    assert TCPClient(bus, {"codec": "msgpack", "framing": "length"}).framing.binary_safe
+
+    with pytest.raises(ValueError):
+        get_framing("chunked")
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: newline-JSON vs. length-prefixed framing
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+async def test_framing_throughput():
+    N = 20_000
+    codec = get_codec("json")
+    envelope = {"pattern": "orders", "correlationId": "1", "payload": {"items": [f"item-{i}" for i in range(20)]}}
+
+    async def measure(framing) -> float:
+        reader = make_reader(framing.encode(codec.encode(envelope)) * N)
+
+        started = time.perf_counter()
+        async for frame in framing.frames(reader):
+            codec.decode(frame)
+        return N / (time.perf_counter() - started)
+
+    newline_rate = await measure(NewlineFraming())
+    length_rate = await measure(LengthPrefixedFraming())
+
+    print(f"\nTCP framing: newline {newline_rate:,.0f} msg/s, length-prefixed {length_rate:,.0f} msg/s")
+    assert length_rate > newline_rate
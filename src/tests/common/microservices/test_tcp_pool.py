@@ -0,0 +1,120 @@
+"""
+Coverage for the pooled TCP client (`TCPConnectionPool`).
+
+Runs against a local echo server speaking the TCP transport's line protocol:
+requests are spread across pooled connections, in-flight requests fail fast
+once their connection drops and the connection is reopened in background.
+"""
+import asyncio
+import json
+
+import pytest
+
+from ascender.common.microservices.instances.bus import SubscriptionEventBus
+from ascender.common.microservices.instances.tcp.client import TCPClient
+
+
+class EchoServer:
+    """Responds to every request with its payload, unless `hold` is set."""
+
+    def __init__(self):
+        self.peers: set[int] = set()
+        self.writers: list[asyncio.StreamWriter] = []
+        self.hold = False
+        self.received = asyncio.Event()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.writers.append(writer)
+        while line := await reader.readline():
+            message = json.loads(line)
+            self.peers.add(writer.get_extra_info("peername")[1])
+            self.received.set()
+            if self.hold or not message.get("correlationId"):
+                continue
+
+            writer.write(json.dumps({
+                "pattern": "_rpc:response",
+                "correlationId": f"response-{message['correlationId']}",
+                "payload": message["payload"],
+            }).encode() + b"\n")
+            await writer.drain()
+
+    def drop_connections(self):
+        for writer in self.writers:
+            writer.close()
+        self.writers.clear()
+
+
+@pytest.fixture
+async def echo_server():
+    echo = EchoServer()
+    server = await asyncio.start_server(echo.handle, "127.0.0.1", 0)
+    echo.port = server.sockets[0].getsockname()[1]
+
+    yield echo
+
+    server.close()
+    await server.wait_closed()
+
+
+class OpenWriter:
+    def is_closing(self) -> bool:
+        return False
+
+
+def make_client(port: int, **pool) -> TCPClient:
+    return TCPClient(SubscriptionEventBus(), {"host": "127.0.0.1", "port": port, "codec": "json", "pool": pool})
+
+
+async def test_requests_are_spread_across_connections(echo_server):
+    client = make_client(echo_server.port, size=3)
+    await client.connect()
+
+    responses = await asyncio.gather(*(client.send("echo", {"n": n}, timeout=5) for n in range(9)))
+
+    assert responses == [{"n": n} for n in range(9)]
+    assert len(echo_server.peers) == 3
+
+    await client.disconnect()
+
+
+def test_least_pending_strategy_picks_idle_connection():
+    client = make_client(0, size=2, strategy="least_pending")
+    busy, idle = client.pool.connections
+    for connection in (busy, idle):
+        connection.writer = OpenWriter()  # type: ignore[assignment]
+
+    busy.rpc_transport.pending_requests._pending["1"] = object()
+
+    assert client.pool.acquire() is idle
+
+
+def test_invalid_pool_options():
+    with pytest.raises(ValueError):
+        make_client(0, size=0)
+
+    with pytest.raises(ValueError):
+        make_client(0, strategy="fastest")
+
+
+async def test_in_flight_requests_fail_fast_and_reconnect(echo_server):
+    client = make_client(echo_server.port, size=1, initial_backoff=0.01, max_backoff=0.05)
+    await client.connect()
+
+    echo_server.hold = True
+    request = asyncio.create_task(client.send("echo", {"n": 1}, timeout=30))
+    await echo_server.received.wait()
+
+    echo_server.drop_connections()
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(request, timeout=2)
+
+    echo_server.hold = False
+    for _ in range(100):
+        if client.pool.connections[0].connected:
+            break
+        await asyncio.sleep(0.01)
+
+    assert await client.send("echo", {"n": 2}, timeout=5) == {"n": 2}
+
+    await client.disconnect()
@@ -0,0 +1,135 @@
+"""
+Coverage for message handling of `TCPTransporter.handle_client`.
+
+RPC and event transports are created once per connection and shared by all of
+its messages, the per-message path only builds a context. Transports of a
+closed connection stop listening on the event bus.
+"""
+import asyncio
+import json
+import time
+from typing import Annotated
+
+import pytest
+
+from ascender.common.microservices.callback_manager import CallbackManager
+from ascender.common.microservices.instances.bus import SubscriptionEventBus
+from ascender.common.microservices.instances.tcp import transporter as tcp_transporter
+from ascender.common.microservices.instances.tcp.context import TCPContext
+from ascender.common.microservices.instances.tcp.event import TCPEventTransport
+from ascender.common.microservices.instances.tcp.rpc import TCPRPCTransport
+from ascender.common.microservices.instances.tcp.transporter import TCPTransporter
+from ascender.common.microservices.types.ctx import Ctx
+
+from .conftest import FakeWriter
+
+
+def make_reader(messages: list[dict]) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"".join(json.dumps(message).encode() + b"\n" for message in messages))
+    reader.feed_eof()
+    return reader
+
+
+def requests(count: int) -> list[dict]:
+    return [{"pattern": "orders.get", "correlationId": str(n), "payload": {"id": n}} for n in range(count)]
+
+
+@pytest.fixture
+def server():
+    return TCPTransporter(None, SubscriptionEventBus(), {"codec": "json"})
+
+
+async def test_messages_share_connection_transports(server: TCPTransporter):
+    contexts: list[TCPContext] = []
+
+    async def handler(order: dict, ctx: Annotated[TCPContext, Ctx()]):
+        contexts.append(ctx)
+        return order
+
+    server.event_bus.subscribe("orders.get", CallbackManager(False, handler))
+    writer = FakeWriter()
+
+    await server.handle_client(make_reader(requests(3)), writer)  # type: ignore[arg-type]
+
+    assert [message["payload"] for message in writer.messages] == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert len({id(ctx.rpc_transport) for ctx in contexts}) == 1
+    assert len({id(ctx.event_transport) for ctx in contexts}) == 1
+    assert contexts[0].remote_addr == "('127.0.0.1', 50000)"
+
+
+async def test_closed_connection_detaches_from_event_bus(server: TCPTransporter):
+    for _ in range(3):
+        await server.handle_client(make_reader(requests(2)), FakeWriter())  # type: ignore[arg-type]
+
+    assert "_rpc:response" not in server.event_bus._subscriptions
+
+
+async def test_per_message_allocations(server: TCPTransporter, monkeypatch):
+    created: list[str] = []
+    injected: list = []
+
+    class CountingRPCTransport(TCPRPCTransport):
+        def __init__(self, *args, **kwargs):
+            created.append("rpc")
+            super().__init__(*args, **kwargs)
+
+    class CountingEventTransport(TCPEventTransport):
+        def __init__(self, *args, **kwargs):
+            created.append("event")
+            super().__init__(*args, **kwargs)
+
+    def counting_inject(token):
+        injected.append(token)
+        return server.logger
+
+    monkeypatch.setattr(tcp_transporter, "TCPRPCTransport", CountingRPCTransport)
+    monkeypatch.setattr(tcp_transporter, "TCPEventTransport", CountingEventTransport)
+    monkeypatch.setattr("ascender.common.microservices.instances.tcp.rpc.inject", counting_inject)
+
+    await server.handle_client(make_reader(requests(100)), FakeWriter())  # type: ignore[arg-type]
+
+    # One set of transports per connection, independent of the amount of messages
+    assert sorted(created) == ["event", "rpc"]
+    assert len(injected) == 1
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: per-message context construction
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+def test_context_construction_rate(server: TCPTransporter):
+    N = 5_000
+    writer = FakeWriter()
+    rpc_transport = TCPRPCTransport(server, writer=writer)  # type: ignore[arg-type]
+    event_transport = TCPEventTransport(server, writer=writer)  # type: ignore[arg-type]
+
+    started = time.perf_counter()
+    for n in range(N):
+        # Previous per-message path: fresh transports and a validated context
+        legacy_rpc = TCPRPCTransport(server, writer=writer)  # type: ignore[arg-type]
+        TCPContext(
+            correlation_id=str(n),
+            is_event=False,
+            rpc_transport=legacy_rpc,
+            event_transport=TCPEventTransport(server, writer=writer),  # type: ignore[arg-type]
+            pattern="orders.get",
+            remote_addr="peer",
+        )
+        legacy_rpc.detach()
+    legacy_rate = N / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for n in range(N):
+        TCPContext.model_construct(
+            correlation_id=str(n),
+            is_event=False,
+            rpc_transport=rpc_transport,
+            event_transport=event_transport,
+            pattern="orders.get",
+            remote_addr="peer",
+        )
+    current_rate = N / (time.perf_counter() - started)
+
+    print(f"\nTCP context: per-message transports {legacy_rate:,.0f} msg/s, per-connection {current_rate:,.0f} msg/s")
+    assert current_rate > legacy_rate
@@ -0,0 +1,117 @@
+"""
+Coverage for `HTTPClient.batch`.
+
+Requests are sent concurrently within global and per-host limits, results keep
+the order of requests (or arrive as they complete) and go through the regular
+response decoding. Failures either cancel the batch or are collected.
+"""
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from ascender.common.http import BatchRequest, HTTPClient
+from ascender.common.http._transport import AscHTTPTransport
+
+
+class Item(BaseModel):
+    id: int
+
+
+class Upstream:
+    def __init__(self):
+        self.in_flight: Counter[str] = Counter()
+        self.max_in_flight: Counter[str] = Counter()
+        self.total = 0
+        self.max_total = 0
+        self.completed: list[str] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.in_flight[host] += 1
+        self.total += 1
+        self.max_in_flight[host] = max(self.max_in_flight[host], self.in_flight[host])
+        self.max_total = max(self.max_total, self.total)
+        try:
+            await asyncio.sleep(float(request.url.params.get("delay", 0.01)))
+        finally:
+            self.in_flight[host] -= 1
+            self.total -= 1
+
+        if request.url.path == "/fail":
+            return httpx.Response(500)
+
+        self.completed.append(request.url.path)
+        return httpx.Response(200, json={"id": int(request.url.path.strip("/"))})
+
+
+@pytest.fixture
+def upstream() -> Upstream:
+    return Upstream()
+
+
+@pytest.fixture
+def client(upstream: Upstream) -> HTTPClient:
+    transport = AscHTTPTransport()
+    transport.transport = httpx.MockTransport(upstream)
+    return HTTPClient("http://a.test", transport)
+
+
+def request(url: str, delay: float = 0.01) -> BatchRequest:
+    return {"method": "GET", "url": url, "response": Item, "options": {"params": {"delay": delay}}}
+
+
+async def test_results_keep_request_order(client: HTTPClient):
+    requests = [request(f"/{n}", delay=0.05 - n * 0.01) for n in range(5)]
+
+    assert await client.batch(requests) == [Item(id=n) for n in range(5)]
+
+
+async def test_concurrency_limits(client: HTTPClient, upstream: Upstream):
+    requests = [request(f"/{n}") for n in range(20)] + [request(f"http://b.test/{n}") for n in range(20)]
+
+    results = await client.batch(requests, concurrency=6, per_host=2)
+
+    assert len(results) == 40
+    assert upstream.max_total <= 4
+    assert upstream.max_in_flight == {"a.test": 2, "b.test": 2}
+
+    upstream.max_total = 0
+    await client.batch(requests, concurrency=3)
+    assert upstream.max_total == 3
+
+
+async def test_fail_fast_cancels_remaining(client: HTTPClient, upstream: Upstream):
+    requests = [request("/fail", delay=0.01)] + [request(f"/{n}", delay=0.2) for n in range(5)]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.batch(requests, concurrency=10)
+
+    await asyncio.sleep(0.25)
+    assert upstream.completed == []
+
+
+async def test_collect_errors(client: HTTPClient):
+    results = await client.batch([request("/1"), request("/fail"), request("/3")], return_exceptions=True)
+
+    assert results[0] == Item(id=1)
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    assert results[2] == Item(id=3)
+
+
+async def test_as_completed(client: HTTPClient):
+    requests = [request("/0", delay=0.1), request("/1", delay=0.01), request("/2", delay=0.05)]
+
+    received = [(index, item) async for index, item in client.batch(requests, as_completed=True)]
+
+    assert received == [(1, Item(id=1)), (2, Item(id=2)), (0, Item(id=0))]
+
+
+async def test_invalid_limits(client: HTTPClient):
+    with pytest.raises(ValueError):
+        client.batch([], concurrency=0)
+
+    with pytest.raises(ValueError):
+        client.batch([], per_host=0)
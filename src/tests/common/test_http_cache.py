@@ -0,0 +1,258 @@
+"""
+Coverage for the response cache of `HTTPClient` (`CachingTransport`, `ResponseCache`).
+
+Fresh responses are served without going upstream, stale ones are revalidated
+with validators, responses vary by headers listed in `Vary`, storage is bounded
+by bytes and concurrent identical requests share a single upstream request.
+`private` responses and responses to requests with `Authorization` aren't shared
+between callers unless they are explicitly marked shareable.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from ascender.common.http import HTTPClient
+from ascender.common.http._transport import AscHTTPTransport
+from ascender.common.http.cache import CachingTransport, ResponseCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Upstream:
+    """Mock upstream recording received requests."""
+
+    def __init__(self, headers: dict[str, str] | None = None, body: bytes = b'{"value": 1}', delay: float = 0.0):
+        self.headers = headers or {}
+        self.body = body
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        etag = self.headers.get("ETag")
+        if etag is not None and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=self.headers)
+
+        return httpx.Response(200, headers={"Content-Type": "application/json", **self.headers}, content=self.body)
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+def make_transport(upstream: Upstream, clock: Clock, **options) -> CachingTransport:
+    return CachingTransport(httpx.MockTransport(upstream), ResponseCache(clock=clock, **options))
+
+
+async def get(transport: CachingTransport, url: str = "http://test/config", **headers: str) -> httpx.Response:
+    response = await transport.handle_async_request(httpx.Request("GET", url, headers=headers))
+    await response.aread()
+    return response
+
+
+async def test_fresh_response_is_served_from_cache(clock):
+    upstream = Upstream({"Cache-Control": "max-age=60"})
+    transport = make_transport(upstream, clock)
+
+    responses = [await get(transport) for _ in range(3)]
+
+    assert len(upstream.requests) == 1
+    assert all(response.json() == {"value": 1} for response in responses)
+
+    clock.now += 61
+    await get(transport)
+    assert len(upstream.requests) == 2
+
+
+async def test_expires_header(clock):
+    upstream = Upstream({"Expires": "Thu, 01 Jan 2099 00:00:00 GMT"})
+    transport = make_transport(upstream, clock)
+
+    await get(transport)
+    await get(transport)
+
+    assert len(upstream.requests) == 1
+
+
+async def test_uncacheable_responses(clock):
+    upstream = Upstream({"Cache-Control": "no-store"})
+    transport = make_transport(upstream, clock)
+
+    await get(transport)
+    await get(transport)
+    assert len(upstream.requests) == 2
+
+    upstream.headers = {"Cache-Control": "max-age=60"}
+    await get(transport, **{"Cache-Control": "no-store"})
+    await get(transport, **{"Cache-Control": "no-store"})
+    assert len(upstream.requests) == 4
+
+
+async def test_stale_response_is_revalidated_with_etag(clock):
+    upstream = Upstream({"Cache-Control": "max-age=10", "ETag": '"v1"'})
+    transport = make_transport(upstream, clock)
+
+    await get(transport)
+    clock.now += 11
+    response = await get(transport)
+
+    assert response.status_code == 200
+    assert response.json() == {"value": 1}
+    assert upstream.requests[1].headers["If-None-Match"] == '"v1"'
+
+    # Revalidation renewed freshness
+    await get(transport)
+    assert len(upstream.requests) == 2
+
+
+async def test_last_modified_revalidation(clock):
+    upstream = Upstream({"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"})
+    transport = make_transport(upstream, clock)
+
+    await get(transport)
+    await get(transport)
+
+    assert upstream.requests[1].headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+async def test_vary_headers_are_part_of_the_key(clock):
+    upstream = Upstream({"Cache-Control": "max-age=60", "Vary": "Accept-Language"})
+    transport = make_transport(upstream, clock)
+
+    for language in ("en", "fr", "en", "fr"):
+        await get(transport, **{"Accept-Language": language})
+
+    assert [request.headers["Accept-Language"] for request in upstream.requests] == ["en", "fr"]
+
+
+class UserUpstream(Upstream):
+    """Mock upstream answering with the caller's name taken from `Authorization`."""
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        user = request.headers.get("Authorization", "Bearer anonymous").removeprefix("Bearer ")
+        return httpx.Response(200, headers=self.headers, json={"user": user})
+
+
+async def test_private_responses_are_not_shared(clock):
+    upstream = UserUpstream({"Cache-Control": "private, max-age=60"})
+    transport = make_transport(upstream, clock)
+
+    alice = await get(transport, "http://test/me", Authorization="Bearer alice")
+    bob = await get(transport, "http://test/me", Authorization="Bearer bob")
+
+    assert (alice.json(), bob.json()) == ({"user": "alice"}, {"user": "bob"})
+    assert len(upstream.requests) == 2
+    assert len(transport.cache) == 0
+
+
+async def test_authorized_requests(clock):
+    upstream = UserUpstream({"Cache-Control": "max-age=60"})
+    transport = make_transport(upstream, clock)
+
+    # Anonymous response is cached, but neither stored nor served for requests with `Authorization`
+    assert (await get(transport, "http://test/me")).json() == {"user": "anonymous"}
+    assert (await get(transport, "http://test/me", Authorization="Bearer alice")).json() == {"user": "alice"}
+    assert (await get(transport, "http://test/me", Authorization="Bearer bob")).json() == {"user": "bob"}
+    assert (await get(transport, "http://test/me")).json() == {"user": "anonymous"}
+    assert len(upstream.requests) == 3
+
+    # Responses marked `public` (or `s-maxage`, `must-revalidate`) may be shared
+    upstream.headers = {"Cache-Control": "public, max-age=60"}
+    await get(transport, "http://test/shared", Authorization="Bearer alice")
+    assert (await get(transport, "http://test/shared", Authorization="Bearer bob")).json() == {"user": "alice"}
+    assert len(upstream.requests) == 4
+
+
+async def test_lru_eviction_by_bytes(clock):
+    upstream = Upstream({"Cache-Control": "max-age=60"}, body=b"x" * 1_000)
+    transport = make_transport(upstream, clock, max_bytes=3_500, max_entry_bytes=2_000)
+
+    for name in ("a", "b", "c"):
+        await get(transport, f"http://test/{name}")
+    await get(transport, "http://test/a")
+    await get(transport, "http://test/d")
+
+    assert transport.cache.size <= 3_500
+    assert len(transport.cache) == 3
+
+    # `b` was the least recently used one
+    await get(transport, "http://test/a")
+    await get(transport, "http://test/b")
+    assert [request.url.path for request in upstream.requests] == ["/a", "/b", "/c", "/d", "/b"]
+
+
+async def test_concurrent_requests_are_coalesced(clock):
+    upstream = Upstream({"Cache-Control": "max-age=60"}, delay=0.05)
+    transport = make_transport(upstream, clock)
+
+    responses = await asyncio.gather(*(get(transport) for _ in range(10)))
+
+    assert len(upstream.requests) == 1
+    assert all(response.json() == {"value": 1} for response in responses)
+
+
+async def test_concurrent_requests_with_vary(clock):
+    class LanguageUpstream(Upstream):
+        async def __call__(self, request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            await asyncio.sleep(self.delay)
+            return httpx.Response(200, headers=self.headers, json={"language": request.headers["Accept-Language"]})
+
+    upstream = LanguageUpstream({"Cache-Control": "max-age=60", "Vary": "Accept-Language"}, delay=0.05)
+    transport = make_transport(upstream, clock)
+
+    responses = await asyncio.gather(*(get(transport, **{"Accept-Language": language}) for language in ("en", "fr", "en")))
+
+    # Waiters with other varied headers don't get the shared response
+    assert [response.json()["language"] for response in responses] == ["en", "fr", "en"]
+    assert len(upstream.requests) == 2
+
+
+async def test_s_maxage_takes_precedence(clock):
+    upstream = Upstream({"Cache-Control": "max-age=0, s-maxage=60"})
+    transport = make_transport(upstream, clock)
+
+    await get(transport)
+    clock.now += 30
+    await get(transport)
+    assert len(upstream.requests) == 1
+
+    clock.now += 31
+    await get(transport)
+    assert len(upstream.requests) == 2
+
+
+async def test_unsafe_request_invalidates_url(clock):
+    upstream = Upstream({"Cache-Control": "max-age=60"})
+    transport = make_transport(upstream, clock)
+
+    await get(transport)
+    await transport.handle_async_request(httpx.Request("PUT", "http://test/config", json={"value": 2}))
+    await get(transport)
+
+    assert [request.method for request in upstream.requests] == ["GET", "PUT", "GET"]
+
+
+async def test_http_client_with_cache():
+    upstream = Upstream({"Cache-Control": "max-age=60"})
+    transport = AscHTTPTransport(cache={"max_bytes": 1024 * 1024})
+    assert isinstance(transport.transport, CachingTransport)
+    transport.transport.transport = httpx.MockTransport(upstream)
+
+    client = HTTPClient("http://test", transport)
+
+    assert await client.get(dict, url="/config") == {"value": 1}
+    assert await client.get(dict, url="/config") == {"value": 1}
+    assert len(upstream.requests) == 1
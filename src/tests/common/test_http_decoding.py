@@ -0,0 +1,131 @@
+"""
+Coverage for typed response decoding of `HTTPClient`.
+
+Models and generic types (`list[Model]`, `dict[str, Model]`, unions) are
+validated straight from the response body with cached validators, plain types
+keep returning parsed JSON or text.
+"""
+import asyncio
+import json
+import time
+import tracemalloc
+
+import httpx
+import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from ascender.common.http import HTTPClient
+from ascender.common.http._decoding import get_decoder, is_json_content_type
+from ascender.common.http._transport import AscHTTPTransport
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    tags: list[str] = []
+
+
+class Catalog(BaseModel):
+    items: list[Item]
+
+
+def make_client(body: bytes, content_type: str = "application/json") -> HTTPClient:
+    transport = AscHTTPTransport()
+    transport.transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, headers={"Content-Type": content_type}, content=body)
+    )
+    return HTTPClient("http://test", transport)
+
+
+ITEMS = [{"id": 1, "name": "first"}, {"id": 2, "name": "second", "tags": ["new"]}]
+
+
+async def test_model_and_generic_types():
+    client = make_client(json.dumps(ITEMS).encode())
+
+    items = await client.get(list[Item], url="/items")
+    assert items == [Item(id=1, name="first"), Item(id=2, name="second", tags=["new"])]
+
+    by_name = await make_client(json.dumps({"a": ITEMS[0]}).encode()).get(dict[str, Item], url="/items")
+    assert by_name == {"a": Item(id=1, name="first")}
+
+    catalog = await make_client(json.dumps({"items": ITEMS}).encode()).get(Catalog, url="/catalog")
+    assert catalog.items[1].tags == ["new"]
+
+    union = await make_client(b'{"id": 3, "name": "third"}').get(Item | int, url="/items/3")  # type: ignore[arg-type]
+    assert union == Item(id=3, name="third")
+
+
+async def test_invalid_typed_body_raises():
+    with pytest.raises(ValidationError):
+        await make_client(b'[{"id": "not a number"}]').get(list[Item], url="/items")
+
+
+async def test_plain_types_keep_returning_json_or_text():
+    assert await make_client(b'{"a": 1}').get(url="/") == {"a": 1}
+    assert await make_client(b"plain text", "text/plain").get(url="/") == "plain text"
+
+    # Instance hints only parse JSON bodies, including content type parameters and `+json` types
+    assert await make_client(b'{"a": 1}', "application/json; charset=utf-8").get({}, url="/") == {"a": 1}
+    assert await make_client(b'{"a": 1}', "application/problem+json").get({}, url="/") == {"a": 1}
+    assert await make_client(b'{"a": 1}', "text/plain").get({}, url="/") == '{"a": 1}'
+
+
+def test_json_content_types():
+    assert is_json_content_type("Application/JSON")
+    assert is_json_content_type("application/vnd.api+json; charset=utf-8")
+    assert not is_json_content_type("text/html")
+    assert not is_json_content_type(None)
+
+
+def test_decoders_reuse_cached_validators():
+    assert get_decoder(dict) is None
+    assert get_decoder({}) is None
+    assert get_decoder(list[Item]).__self__ is get_decoder(list[Item]).__self__  # type: ignore[union-attr]
+
+
+async def test_stream_chunks_are_validated():
+    transport = AscHTTPTransport()
+    transport.transport = httpx.MockTransport(lambda request: httpx.Response(200, content=json.dumps(ITEMS[1]).encode()))
+    client = HTTPClient("http://test", transport)
+
+    streamed: list[Item] = []
+    done = asyncio.Event()
+    client.stream(Item, method="GET", url="/items/2").subscribe(
+        on_next=streamed.append, on_completed=done.set, on_error=lambda e: done.set()
+    )
+    await asyncio.wait_for(done.wait(), 1)
+
+    assert streamed == [Item(id=2, name="second", tags=["new"])]
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: decoding a large list payload
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+async def test_large_list_decoding():
+    N = 20_000
+    body = json.dumps([{"id": n, "name": f"item-{n}", "tags": ["a", "b"]} for n in range(N)]).encode()
+    response = httpx.Response(200, headers={"Content-Type": "application/json"}, content=body)
+    adapter = TypeAdapter(list[Item])
+    decoder = get_decoder(list[Item])
+    assert decoder is not None
+
+    def measure(decode) -> tuple[float, int]:
+        tracemalloc.start()
+        started = time.perf_counter()
+        decode()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed, peak
+
+    # Previous path: parse the body into Python objects, then validate them
+    legacy_time, legacy_peak = measure(lambda: adapter.validate_python(response.json()))
+    current_time, current_peak = measure(lambda: decoder(response.content))
+
+    print(
+        f"\nHTTP decoding of {N:,} items: json()+validate {legacy_time * 1000:.1f} ms / {legacy_peak / 1e6:.1f} MB peak, "
+        f"validate_json {current_time * 1000:.1f} ms / {current_peak / 1e6:.1f} MB peak"
+    )
+    assert current_peak < legacy_peak
@@ -0,0 +1,173 @@
+"""
+Coverage for the interceptor chain of `AscHTTPTransport`.
+
+Class interceptors are resolved from `HTTP_INTERCEPTOR` providers once and
+compiled together with function interceptors into ordered request and response
+handlers. The chain is rebuilt only when the root injector or its providers change.
+"""
+import time
+
+import httpx
+import pytest
+
+from ascender.common.http import HTTPClient, Interceptor
+from ascender.common.http._transport import AscHTTPTransport
+from ascender.core.applications.root_injector import RootInjector
+from ascender.core.di.injector import AscenderInjector
+
+
+calls: list[str] = []
+
+
+class AuthInterceptor(Interceptor):
+    def __init__(self): ...
+
+    async def handle_request(self, request: httpx.Request) -> httpx.Request:
+        calls.append("auth")
+        request.headers["Authorization"] = "Bearer token"
+        return request
+
+
+class TracingInterceptor(Interceptor):
+    def __init__(self): ...
+
+    async def handle_request(self, request: httpx.Request) -> httpx.Request:
+        calls.append("tracing")
+        return request
+
+    async def handle_response(self, response: httpx.Response):
+        calls.append("tracing:response")
+        return response
+
+
+async def tag_request(request: httpx.Request) -> httpx.Request:
+    calls.append("fn")
+    return request
+
+
+def echo(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"authorization": request.headers.get("Authorization")})
+
+
+@pytest.fixture
+def install_interceptors(monkeypatch):
+    """Replaces root injector with one providing given class interceptors."""
+    calls.clear()
+    # Transports register class interceptors into root providers, don't leak them into other tests
+    monkeypatch.setattr(RootInjector, "providers", [])
+
+    def install(*interceptors: type[Interceptor]) -> AscenderInjector:
+        injector = AscenderInjector([
+            {"provide": "HTTP_INTERCEPTOR", "use_class": interceptor, "multi": True}
+            for interceptor in interceptors
+        ])
+        monkeypatch.setattr(RootInjector(), "_injector", injector)
+        return injector
+
+    return install
+
+
+def make_transport(interceptors: list) -> AscHTTPTransport:
+    transport = AscHTTPTransport(interceptors=interceptors)
+    transport.transport = httpx.MockTransport(echo)  # type: ignore[assignment]
+    return transport
+
+
+async def test_chain_runs_in_order(install_interceptors):
+    install_interceptors(AuthInterceptor, TracingInterceptor)
+    client = HTTPClient("http://test", make_transport([AuthInterceptor, TracingInterceptor, tag_request]))
+
+    response = await client.get(dict, url="/")
+
+    assert response == {"authorization": "Bearer token"}
+    assert sorted(calls[:2]) == ["auth", "tracing"]
+    assert calls[2:] == ["fn", "tracing:response"]
+
+
+async def test_chain_is_resolved_once(install_interceptors, monkeypatch):
+    injector = install_interceptors(AuthInterceptor)
+    transport = make_transport([AuthInterceptor])
+    resolved: list[str] = []
+
+    original_get = injector.get
+    monkeypatch.setattr(injector, "get", lambda token, *args, **kwargs: resolved.append(token) or original_get(token, *args, **kwargs))
+
+    for _ in range(10):
+        await transport.handle_async_request(httpx.Request("GET", "http://test/"))
+
+    assert resolved == ["HTTP_INTERCEPTOR"]
+    # Base `handle_response` is a no-op and isn't part of the chain
+    assert transport.compile_interceptors()[1] == []
+
+
+async def test_chain_is_rebuilt_when_providers_change(install_interceptors):
+    injector = install_interceptors(AuthInterceptor)
+    transport = make_transport([AuthInterceptor, TracingInterceptor])
+
+    await transport.handle_async_request(httpx.Request("GET", "http://test/"))
+    assert calls == ["auth"]
+
+    calls.clear()
+    injector.dependencies["HTTP_INTERCEPTOR"].add(
+        injector._AscenderInjector__provide_to_record(  # type: ignore[attr-defined]
+            {"provide": "HTTP_INTERCEPTOR", "use_class": TracingInterceptor, "multi": True}
+        )
+    )
+    injector.invalidate()
+
+    await transport.handle_async_request(httpx.Request("GET", "http://test/"))
+    assert sorted(calls) == ["auth", "tracing", "tracing:response"]
+
+    calls.clear()
+    install_interceptors()
+
+    await transport.handle_async_request(httpx.Request("GET", "http://test/"))
+    assert calls == []
+
+
+async def test_class_interceptor_methods(install_interceptors):
+    transport = make_transport([TracingInterceptor])
+    request = httpx.Request("GET", "http://test/")
+
+    assert await transport.request_class_interceptors(request, [AuthInterceptor(), TracingInterceptor()]) is request
+    assert (await transport.response_class_interceptors(httpx.Response(200), TracingInterceptor())).status_code == 200
+    assert calls == ["tracing", "tracing:response"]
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: per-request interceptor overhead
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+async def test_interceptor_overhead(install_interceptors):
+    N = 5_000
+
+    def interceptor_class(index: int) -> type[Interceptor]:
+        async def handle_request(self, request):
+            return request
+
+        return type(f"Interceptor{index}", (Interceptor,), {"__init__": lambda self: None, "handle_request": handle_request})
+
+    async def measure(transport: AscHTTPTransport, recompile: bool) -> float:
+        request = httpx.Request("GET", "http://test/")
+        started = time.perf_counter()
+        for _ in range(N):
+            if recompile:
+                # Previous behaviour: interceptors were resolved from the injector on every request
+                transport._chain = None
+            await transport.handle_async_request(request)
+        return (time.perf_counter() - started) / N * 1e6
+
+    results = []
+    for count in (0, 1, 5):
+        interceptors = [interceptor_class(index) for index in range(count)]
+        install_interceptors(*interceptors)
+        transport = AscHTTPTransport(interceptors=interceptors)
+        # Reused response keeps the measurement focused on the interceptor chain
+        response = httpx.Response(200)
+        transport.transport = httpx.MockTransport(lambda request: response)  # type: ignore[assignment]
+
+        per_request, compiled = await measure(transport, True), await measure(transport, False)
+        results.append(f"{count}: {per_request:.1f} -> {compiled:.1f} us")
+        assert compiled < per_request
+
+    print("\nHTTP interceptor chain per request (resolved per request -> compiled): " + ", ".join(results))
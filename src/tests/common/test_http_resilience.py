@@ -0,0 +1,213 @@
+"""
+Coverage for resilience policies of `AscHTTPTransport`
+(`RetryTransport`, `CircuitBreakerTransport`, `HedgingTransport`).
+
+Idempotent requests are retried with backoff, hosts failing consecutively are
+short-circuited until a probe succeeds, and slow requests are hedged with a
+second copy. Every policy reports its counters.
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from ascender.common.http import CircuitOpenError
+from ascender.common.http._transport import AscHTTPTransport
+from ascender.common.http.resilience import CircuitBreakerTransport, HedgingTransport, RetryTransport
+
+
+class Upstream:
+    """Replies with scripted outcomes (status code, exception or delay), then with 200."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        call = self.calls
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, float):
+            await asyncio.sleep(outcome)
+            outcome = 200
+
+        return httpx.Response(outcome, json={"call": call})
+
+
+def send(transport: httpx.AsyncBaseTransport, method: str = "GET", **headers: str):
+    return transport.handle_async_request(httpx.Request(method, "http://service.test/items", headers=headers))
+
+
+# --------------------------------------------------------------------------- #
+# Retries
+# --------------------------------------------------------------------------- #
+async def test_retries_idempotent_requests():
+    upstream = Upstream(503, httpx.ConnectError("refused"), 200)
+    transport = RetryTransport(httpx.MockTransport(upstream), initial_backoff=0.001)
+
+    response = await send(transport)
+
+    assert response.status_code == 200
+    assert upstream.calls == 3
+    assert transport.counters == {"retry.retries": 2}
+
+
+async def test_non_idempotent_requests_are_not_retried():
+    upstream = Upstream(503, 503)
+    transport = RetryTransport(httpx.MockTransport(upstream), initial_backoff=0.001)
+
+    assert (await send(transport, "POST")).status_code == 503
+    assert upstream.calls == 1
+
+    assert (await send(transport, "POST", **{"Idempotency-Key": "order-1"})).status_code == 200
+    assert upstream.calls == 3
+
+
+async def test_exhausted_retries():
+    upstream = Upstream(*[httpx.ConnectError("refused")] * 3)
+    transport = RetryTransport(httpx.MockTransport(upstream), attempts=3, initial_backoff=0.001)
+
+    with pytest.raises(httpx.ConnectError):
+        await send(transport)
+
+    assert transport.counters == {"retry.retries": 2, "retry.exhausted": 1}
+
+
+def test_backoff_honors_retry_after():
+    transport = RetryTransport(httpx.MockTransport(Upstream()), initial_backoff=0.1, max_backoff=1.0)
+
+    assert 0.1 <= transport.backoff(1) <= 0.2
+    assert transport.backoff(10) <= 1.0
+    assert transport.backoff(0, httpx.Response(503, headers={"Retry-After": "7"})) == 1.0
+
+
+# --------------------------------------------------------------------------- #
+# Circuit breaker
+# --------------------------------------------------------------------------- #
+async def test_circuit_opens_and_probes():
+    now = [0.0]
+    upstream = Upstream(500, httpx.ConnectError("refused"), 500)
+    transport = CircuitBreakerTransport(httpx.MockTransport(upstream), failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+
+    await send(transport)
+    with pytest.raises(httpx.ConnectError):
+        await send(transport)
+
+    with pytest.raises(CircuitOpenError):
+        await send(transport)
+    assert upstream.calls == 2
+
+    # Failed probe opens the circuit again
+    now[0] = 10
+    assert (await send(transport)).status_code == 500
+    with pytest.raises(CircuitOpenError):
+        await send(transport)
+
+    # Successful probe closes it
+    now[0] = 20
+    assert (await send(transport)).status_code == 200
+    assert (await send(transport)).status_code == 200
+
+    assert transport.counters == {"circuit.opened": 2, "circuit.rejected": 2, "circuit.probes": 2}
+
+
+async def test_open_circuit_is_not_retried():
+    upstream = Upstream(*[503] * 10)
+    transport = AscHTTPTransport(
+        retry={"attempts": 5, "initial_backoff": 0.001},
+        circuit_breaker={"failure_threshold": 2},
+    )
+    transport.retry.transport.transport = httpx.MockTransport(upstream)  # type: ignore[union-attr]
+
+    with pytest.raises(CircuitOpenError):
+        await transport.transport.handle_async_request(httpx.Request("GET", "http://service.test/"))
+
+    assert upstream.calls == 2
+    assert transport.counters["retry.retries"] == 2
+    assert transport.counters["circuit.rejected"] == 1
+
+
+# --------------------------------------------------------------------------- #
+# Hedging
+# --------------------------------------------------------------------------- #
+async def test_slow_request_is_hedged():
+    upstream = Upstream(*[0.001] * 5, 1.0)
+    transport = HedgingTransport(httpx.MockTransport(upstream), min_samples=5, min_delay=0.01)
+
+    for _ in range(5):
+        await send(transport)
+
+    started = time.perf_counter()
+    response = await send(transport)
+
+    assert time.perf_counter() - started < 0.5
+    assert response.json() == {"call": 7}
+    assert transport.counters == {"hedge.sent": 1, "hedge.won": 1}
+
+
+async def test_failed_hedge_falls_back_to_primary():
+    upstream = Upstream(*[0.001] * 5, 0.1, httpx.ConnectError("refused"))
+    transport = HedgingTransport(httpx.MockTransport(upstream), min_samples=5, min_delay=0.01)
+
+    for _ in range(5):
+        await send(transport)
+
+    assert (await send(transport)).json() == {"call": 6}
+    assert transport.counters == {"hedge.sent": 1}
+
+
+async def test_hedging_delay_follows_the_window():
+    upstream = Upstream(0.05, *[0.001] * 5)
+    transport = HedgingTransport(httpx.MockTransport(upstream), min_samples=5, min_delay=0.0, window=5)
+
+    for _ in range(5):
+        await send(transport, "POST")
+    assert transport.delay("service.test") >= 0.05
+
+    # The slow sample leaves the window
+    await send(transport, "POST")
+    assert transport.delay("service.test") < 0.05
+    assert transport.delay("service.test") == max(transport.latencies["service.test"])
+
+
+async def test_non_idempotent_requests_are_not_hedged():
+    upstream = Upstream(*[0.001] * 5, 0.1)
+    transport = HedgingTransport(httpx.MockTransport(upstream), min_samples=5)
+
+    for _ in range(5):
+        await send(transport)
+    await send(transport, "POST")
+
+    assert upstream.calls == 6
+    assert transport.counters == {}
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: tail latency with hedging
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+async def test_hedging_reduces_tail_latency():
+    N = 200
+
+    async def measure(hedged: bool) -> float:
+        # Every 20th request hits a slow replica
+        upstream = Upstream(*[0.2 if n % 20 == 19 else 0.002 for n in range(N * 2)])
+        inner = httpx.MockTransport(upstream)
+        transport = HedgingTransport(inner, min_samples=20) if hedged else inner
+
+        latencies = []
+        for _ in range(N):
+            started = time.perf_counter()
+            await send(transport)
+            latencies.append(time.perf_counter() - started)
+
+        return sorted(latencies)[int(N * 0.99)]
+
+    plain_p99, hedged_p99 = await measure(False), await measure(True)
+
+    print(f"\nHTTP p99 latency: plain {plain_p99 * 1000:.1f} ms, hedged {hedged_p99 * 1000:.1f} ms")
+    assert hedged_p99 < plain_p99
@@ -0,0 +1,151 @@
+"""
+Coverage for streaming decoders of `HTTPClient.stream` / `HTTPClient.iter_stream`.
+
+Messages (NDJSON lines, Server-Sent Events, length-prefixed frames) are decoded
+from raw bytes regardless of how the body is chunked, and disposing an
+observable subscription cancels the request.
+"""
+import asyncio
+import json
+import struct
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from ascender.common.http import HTTPClient, ServerSentEvent
+from ascender.common.http._transport import AscHTTPTransport
+from ascender.common.http.streaming import LengthPrefixedDecoder, NDJSONDecoder, SSEDecoder, get_stream_decoder
+
+
+class Item(BaseModel):
+    id: int
+
+
+def split(data: bytes, size: int) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def decode_all(decoder, chunks: list[bytes]) -> list:
+    messages = []
+    for chunk in chunks:
+        messages.extend(decoder.feed(chunk))
+    return messages + decoder.flush()
+
+
+def make_client(chunks: list[bytes], status: int = 200, delay: float = 0.0, closed: list | None = None) -> HTTPClient:
+    async def body():
+        try:
+            for chunk in chunks:
+                if delay:
+                    await asyncio.sleep(delay)
+                yield chunk
+        finally:
+            if closed is not None:
+                closed.append(True)
+
+    transport = AscHTTPTransport()
+    transport.transport = httpx.MockTransport(lambda request: httpx.Response(status, content=body()))
+    return HTTPClient("http://service.test", transport)
+
+
+# --------------------------------------------------------------------------- #
+# Decoders
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize("size", [1, 3, 7, 1024])
+def test_ndjson_is_independent_of_chunking(size: int):
+    body = b'{"id": 1}\r\n\n{"id": 2}\n{"id": 3}'
+
+    assert decode_all(NDJSONDecoder(), split(body, size)) == [b'{"id": 1}', b'{"id": 2}', b'{"id": 3}']
+
+
+@pytest.mark.parametrize("size", [1, 5, 1024])
+def test_sse_events(size: int):
+    body = (
+        b": keep-alive\n\n"
+        b"event: update\r\nid: 7\r\nretry: 1500\r\ndata: {\"id\": 1}\r\n\r\n"
+        b"data:first\ndata: second\n\n"
+        b"data: unterminated"
+    )
+
+    assert decode_all(SSEDecoder(), split(body, size)) == [
+        ServerSentEvent('{"id": 1}', event="update", id="7", retry=1500),
+        ServerSentEvent("first\nsecond", event="message", id="7", retry=1500),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 6, 1024])
+def test_length_prefixed(size: int):
+    messages = [b'{"id": 1}', b"", b'{"id": 22}']
+    body = b"".join(struct.pack(">I", len(message)) + message for message in messages)
+
+    assert decode_all(LengthPrefixedDecoder(), split(body, size)) == messages
+
+
+def test_message_size_limit():
+    with pytest.raises(ValueError):
+        NDJSONDecoder(max_message_size=8).feed(b"0123456789")
+
+    with pytest.raises(ValueError):
+        LengthPrefixedDecoder(max_message_size=8).feed(struct.pack(">I", 9))
+
+    with pytest.raises(ValueError):
+        get_stream_decoder("xml")  # type: ignore[arg-type]
+
+
+# --------------------------------------------------------------------------- #
+# Client
+# --------------------------------------------------------------------------- #
+async def test_iter_stream_validates_split_messages():
+    body = b"".join(json.dumps({"id": n}).encode() + b"\n" for n in range(50))
+    client = make_client(split(body, 5))
+
+    items = [item async for item in client.iter_stream(Item, method="GET", url="/items")]
+
+    assert items == [Item(id=n) for n in range(50)]
+
+
+async def test_iter_stream_sse():
+    client = make_client([b'event: created\ndata: {"id": 1}\n\ndata: {"id"', b': 2}\n\n'])
+
+    events = [event async for event in client.iter_stream(Item, method="GET", url="/events", format="sse")]
+
+    assert events == [ServerSentEvent(Item(id=1), event="created"), ServerSentEvent(Item(id=2))]
+
+
+async def test_iter_stream_raises_error_status():
+    client = make_client([b"unavailable"], status=503)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        async for _ in client.iter_stream(method="GET", url="/items"):
+            pass
+
+
+async def test_observable_stream():
+    client = make_client([b'{"id": 1}\n{"id"', b': 2}\nnot json\n'])
+    received = []
+    done = asyncio.Event()
+
+    client.stream(method="GET", url="/items").subscribe(
+        on_next=received.append, on_completed=done.set, on_error=lambda e: done.set()
+    )
+    await asyncio.wait_for(done.wait(), 1)
+
+    assert received == [{"id": 1}, {"id": 2}, "not json"]
+    assert not client._stream_tasks
+
+
+async def test_dispose_cancels_stream():
+    closed: list[bool] = []
+    client = make_client([b'{"id": %d}\n' % n for n in range(1000)], delay=0.005, closed=closed)
+    received = []
+
+    subscription = client.stream(Item, method="GET", url="/items").subscribe(on_next=received.append)
+    while len(received) < 3:
+        await asyncio.sleep(0.005)
+    subscription.dispose()
+    await asyncio.sleep(0.02)
+
+    assert 3 <= len(received) < 10
+    assert closed == [True]
+    assert not client._stream_tasks
@@ -0,0 +1,196 @@
+"""
+Coverage for middleware binding (`useMiddlewares`, `AscenderMiddleware.bind`) and
+the pure ASGI `AscenderASGIMiddleware`.
+
+Wrapped middlewares (`BaseHTTPMiddleware`, `CORSMiddleware`, FastAPI ones)
+are constructed once, when the middleware stack is built. ASGI middleware
+hooks see every request and response without buffering bodies.
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+
+from ascender.abc.middleware import AscenderMiddleware
+from ascender.common.api.asgi_middleware import AscenderASGIMiddleware, ResponseHead
+from ascender.common.api.base_http_middleware import AscenderHTTPMiddleware
+from ascender.common.api.cors_middleware import AscenderCORSMiddleware
+from ascender.common.api.relational_middleware import FromFastAPIMiddleware
+from ascender.contrib.middlewares import useMiddlewares
+
+
+def create_app(*middlewares: AscenderMiddleware) -> FastAPI:
+    app = FastAPI()
+    for provider in useMiddlewares(*middlewares):
+        app.add_middleware(provider["value"])  # type: ignore[arg-type]
+
+    @app.get("/items")
+    async def items():
+        return [{"id": 1}]
+
+    return app
+
+
+def client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url="http://test")
+
+
+class CountingMiddleware:
+    instances = 0
+
+    def __init__(self, app, header: str):
+        CountingMiddleware.instances += 1
+        self.app = app
+        self.header = header
+
+    async def __call__(self, scope, receive, send):
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message["headers"], (self.header.encode(), b"1")]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class TimingHTTPMiddleware(AscenderHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        response = await call_next(request)
+        response.headers["x-timing"] = "1"
+        return response
+
+
+class TimingASGIMiddleware(AscenderASGIMiddleware):
+    async def on_response(self, request: Request, response: ResponseHead) -> None:
+        response.headers["x-timing"] = "1"
+
+
+class ApiKeyMiddleware(AscenderASGIMiddleware):
+    async def on_request(self, request: Request) -> Response | None:
+        if request.headers.get("x-api-key") != "key":
+            return JSONResponse({"detail": "missing api key"}, 401)
+        return None
+
+    async def on_response(self, request: Request, response: ResponseHead) -> None:
+        response.headers["x-path"] = request.url.path
+        if response.status_code == 404:
+            response.status_code = 410
+
+
+# --------------------------------------------------------------------------- #
+# Binding
+# --------------------------------------------------------------------------- #
+async def test_wrapped_middlewares_are_constructed_once():
+    CountingMiddleware.instances = 0
+    app = create_app(FromFastAPIMiddleware(CountingMiddleware, header="x-counted"), TimingHTTPMiddleware())
+
+    async with client(app) as http:
+        for _ in range(3):
+            response = await http.get("/items")
+            assert (response.headers["x-counted"], response.headers["x-timing"]) == ("1", "1")
+
+    assert CountingMiddleware.instances == 1
+
+
+async def test_cors_middleware():
+    app = create_app(AscenderCORSMiddleware(allow_origins=["https://ascender.dev"], allow_methods=["GET"]))
+
+    async with client(app) as http:
+        response = await http.options("/items", headers={"origin": "https://ascender.dev", "access-control-request-method": "GET"})
+        assert response.headers["access-control-allow-origin"] == "https://ascender.dev"
+        assert (await http.get("/items", headers={"origin": "https://ascender.dev"})).json() == [{"id": 1}]
+
+
+# --------------------------------------------------------------------------- #
+# AscenderASGIMiddleware
+# --------------------------------------------------------------------------- #
+async def test_asgi_middleware_hooks():
+    app = create_app(ApiKeyMiddleware())
+
+    async with client(app) as http:
+        assert (await http.get("/items")).status_code == 401
+
+        response = await http.get("/items", headers={"x-api-key": "key"})
+        assert (response.json(), response.headers["x-path"]) == ([{"id": 1}], "/items")
+        assert (await http.get("/missing", headers={"x-api-key": "key"})).status_code == 410
+
+
+async def test_asgi_middleware_does_not_buffer_streams():
+    events = []
+
+    class RecordingMiddleware(AscenderASGIMiddleware):
+        async def on_response(self, request: Request, response: ResponseHead) -> None:
+            events.append("response")
+
+    app = create_app(RecordingMiddleware())
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for n in range(3):
+                events.append(f"chunk {n}")
+                yield f"{n}\n"
+                await asyncio.sleep(0)
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    async with client(app) as http:
+        assert (await http.get("/stream")).text == "0\n1\n2\n"
+
+    assert events == ["response", "chunk 0", "chunk 1", "chunk 2"]
+
+
+async def test_asgi_middleware_short_circuits_with_response():
+    class MaintenanceMiddleware(AscenderASGIMiddleware):
+        async def on_request(self, request: Request) -> Response | None:
+            return PlainTextResponse("maintenance", 503)
+
+    async with client(create_app(MaintenanceMiddleware())) as http:
+        response = await http.get("/items")
+
+    assert (response.status_code, response.text) == (503, "maintenance")
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: requests/sec through a stack of 5 middlewares
+# --------------------------------------------------------------------------- #
+class LegacyTimingHTTPMiddleware(AscenderMiddleware):
+    """`AscenderHTTPMiddleware` before binding, it wrapped itself on every call."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        response = await call_next(request)
+        response.headers["x-timing"] = "1"
+        return response
+
+    async def __call__(self, scope, receive, send):
+        return await BaseHTTPMiddleware(self.app, self.dispatch)(scope, receive, send)
+
+
+@pytest.mark.perf
+async def test_middleware_stack_throughput():
+    N = 500
+
+    async def measure(middleware: type[AscenderMiddleware]) -> float:
+        best = 0.0
+        for _ in range(3):
+            async with client(create_app(*(middleware() for _ in range(5)))) as http:
+                started = time.perf_counter()
+                for _ in range(N):
+                    await http.get("/items")
+                best = max(best, N / (time.perf_counter() - started))
+        return best
+
+    legacy = await measure(LegacyTimingHTTPMiddleware)
+    bound = await measure(TimingHTTPMiddleware)
+    asgi = await measure(TimingASGIMiddleware)
+
+    print(
+        f"\nRequests/sec through 5 middlewares: BaseHTTPMiddleware per call {legacy:,.0f}, "
+        f"bound once {bound:,.0f}, pure ASGI {asgi:,.0f}"
+    )
+    assert asgi > legacy * 1.5
@@ -1,8 +1,15 @@
+from logging import getLogger
+
 import pytest
 from ascender.testing import AscenderTestLifecycle
 
 
-lifecycle = AscenderTestLifecycle(providers=[])
+lifecycle = AscenderTestLifecycle(providers=[
+    {
+        "provide": "ASC_LOGGER",
+        "use_factory": lambda: getLogger("Ascender Framework"),
+    },
+])
 
 
 def pytest_sessionstart(session: pytest.Session):
@@ -0,0 +1,55 @@
+"""
+SQLite (aiosqlite) database shared by the database tests.
+"""
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ascender.core.database import AppDBContext, DBEntity
+from ascender.core.database.orms.sqlalchemy import SQLAlchemyORM
+
+
+class NoteEntity(DBEntity):
+    __tablename__ = "uow_notes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    text: Mapped[str]
+
+
+class Database:
+    """SQLite database counting sessions and connection checkouts."""
+
+    def __init__(self, path: Path):
+        self.orm = SQLAlchemyORM({"type": "dbstring", "content": f"sqlite+aiosqlite:///{path}", "entities": []})
+        self.context = AppDBContext(self.orm)
+        self.sessions = 0
+        self.checkouts = 0
+
+        get_session = self.orm.get_session
+
+        def counting_session():
+            self.sessions += 1
+            return get_session()
+
+        self.orm.get_session = counting_session  # type: ignore[method-assign]
+        event.listen(self.orm.engine.sync_engine, "checkout", self.__checkout)
+
+    def __checkout(self, *_):
+        self.checkouts += 1
+
+    async def count(self) -> int:
+        async with self.orm.SessionLocal() as session:
+            return (await session.execute(select(func.count()).select_from(NoteEntity))).scalar_one()
+
+
+@pytest.fixture
+async def db(tmp_path: Path):
+    database = Database(tmp_path / "uow.sqlite")
+    async with database.orm.engine.begin() as conn:
+        await conn.run_sync(NoteEntity.metadata.create_all, tables=[NoteEntity.__table__])
+    database.checkouts = 0
+
+    yield database
+    await database.orm.shutdown_database()
@@ -0,0 +1,103 @@
+"""
+Coverage for `Constructor.stream` and `QuerySetSerializer` stream helpers.
+
+Rows are fetched in batches through a dedicated session which is released
+once the iterator is exhausted or closed, and entities are serialized to DTOs
+one by one as they arrive.
+"""
+import time
+import tracemalloc
+from contextlib import aclosing
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import insert
+
+from ascender.common.serializer import QuerySetSerializer
+
+from .conftest import Database, NoteEntity
+
+
+class NoteDTO(BaseModel):
+    id: int
+    text: str
+
+
+async def populate(db: Database, count: int):
+    async with db.orm.engine.begin() as conn:
+        await conn.execute(insert(NoteEntity), [{"id": n, "text": f"note {n:07d} " + "x" * 64} for n in range(1, count + 1)])
+    db.checkouts = 0
+
+
+def checked_out(db: Database) -> int:
+    return db.orm.engine.sync_engine.pool.checkedout()
+
+
+async def test_streams_all_rows(db: Database):
+    await populate(db, 250)
+
+    notes = [note.id async for note in db.context.construct(NoteEntity).order_by(NoteEntity.id).stream(batch_size=40)]
+
+    assert notes == list(range(1, 251))
+    assert checked_out(db) == 0
+    assert db.checkouts == 1
+
+
+async def test_early_exit_releases_connection(db: Database):
+    await populate(db, 100)
+
+    async with aclosing(db.context.construct(NoteEntity).stream(batch_size=10)) as notes:
+        async for note in notes:
+            assert checked_out(db) == 1
+            break
+
+    assert checked_out(db) == 0
+
+
+async def test_stream_is_serialized_lazily(db: Database):
+    await populate(db, 3)
+    query = db.context.construct(NoteEntity).where(NoteEntity.id < 3).order_by(NoteEntity.id)
+
+    dtos = [dto async for dto in QuerySetSerializer.base_serialize_stream(NoteDTO, query.stream())]
+
+    assert dtos == [NoteDTO(id=1, text="note 0000001 " + "x" * 64), NoteDTO(id=2, text="note 0000002 " + "x" * 64)]
+
+
+async def test_invalid_batch_size(db: Database):
+    with pytest.raises(ValueError):
+        db.context.construct(NoteEntity).stream(batch_size=0)
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: peak memory of buffered vs streamed results
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+async def test_stream_memory_stays_flat(db: Database):
+    N = 20_000
+    await populate(db, N)
+
+    async def buffered():
+        for note in (await db.context.construct(NoteEntity)).scalars().all():
+            NoteDTO(id=note.id, text=note.text)
+
+    async def streamed():
+        async for _ in QuerySetSerializer.base_serialize_stream(NoteDTO, db.context.construct(NoteEntity).stream(batch_size=500)):
+            pass
+
+    async def measure(run) -> tuple[float, float]:
+        tracemalloc.start()
+        started = time.perf_counter()
+        await run()
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / 1024 / 1024, elapsed
+
+    buffered_peak, buffered_time = await measure(buffered)
+    streamed_peak, streamed_time = await measure(streamed)
+
+    print(
+        f"\nPeak memory over {N:,} rows: buffered {buffered_peak:.1f} MB ({buffered_time:.2f}s), "
+        f"streamed {streamed_peak:.1f} MB ({streamed_time:.2f}s)"
+    )
+    assert streamed_peak * 5 < buffered_peak
@@ -0,0 +1,150 @@
+"""
+Coverage for the unit of work (`ascender.core.database.unit_of_work`,
+`AppDBContext.unit_of_work`, `UnitOfWorkMiddleware`).
+
+Within a unit of work every `Constructor` await and `AppDBContext()` call
+shares one lazily created session, which is committed when the scope ends
+and rolled back on errors. HTTP requests get one scope each.
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from sqlalchemy import select
+
+from ascender.core.database import AppDBContext, UnitOfWork, UnitOfWorkMiddleware
+
+from .conftest import Database, NoteEntity
+
+
+async def run_queries(context: AppDBContext, count: int = 5):
+    for _ in range(count):
+        (await context.construct(NoteEntity).where(NoteEntity.id > 0)).scalars().all()
+
+
+# --------------------------------------------------------------------------- #
+# Scope
+# --------------------------------------------------------------------------- #
+async def test_queries_share_one_session(db: Database):
+    await run_queries(db.context)
+    assert (db.sessions, db.checkouts) == (5, 5)
+
+    async with db.context.unit_of_work():
+        await run_queries(db.context)
+        async with db.context() as session:
+            session.add(NoteEntity(text="shared"))
+
+    assert (db.sessions, db.checkouts) == (6, 6)
+
+
+async def test_commits_on_exit(db: Database):
+    async with db.context.unit_of_work():
+        async with db.context() as session:
+            session.add(NoteEntity(text="first"))
+
+        db.context().add(NoteEntity(text="second"))
+
+    assert await db.count() == 2
+
+
+async def test_rolls_back_on_error(db: Database):
+    with pytest.raises(RuntimeError):
+        async with db.context.unit_of_work():
+            db.context().add(NoteEntity(text="lost"))
+            await run_queries(db.context, 1)
+            raise RuntimeError("handler failed")
+
+    assert await db.count() == 0
+
+
+async def test_session_is_lazy(db: Database):
+    async with db.context.unit_of_work() as unit:
+        assert not unit.started
+
+    assert db.sessions == 0
+
+
+async def test_nested_scope_joins_outer(db: Database):
+    @db.context.unit_of_work()
+    async def handler():
+        db.context().add(NoteEntity(text="nested"))
+        return UnitOfWork.current(db.orm)
+
+    async with db.context.unit_of_work() as outer:
+        assert await handler() is outer
+        assert await db.count() == 0
+
+    assert await db.count() == 1
+    assert UnitOfWork.current(db.orm) is None
+
+
+async def test_concurrent_queries_take_turns(db: Database):
+    async with db.context.unit_of_work():
+        await asyncio.gather(*(run_queries(db.context, 2) for _ in range(5)))
+
+    assert db.checkouts == 1
+
+
+async def test_shared_session_queries_take_turns(db: Database):
+    async def add_and_count(text: str) -> int:
+        async with db.context() as session:
+            session.add(NoteEntity(text=text))
+            await session.flush()
+            return len((await session.scalars(select(NoteEntity))).all())
+
+    async with db.context.unit_of_work():
+        counts = await asyncio.gather(*(add_and_count(str(n)) for n in range(5)))
+
+    assert max(counts) == 5
+    assert await db.count() == 5
+
+
+# --------------------------------------------------------------------------- #
+# HTTP
+# --------------------------------------------------------------------------- #
+async def test_request_scope(db: Database):
+    app = FastAPI()
+    app.add_middleware(UnitOfWorkMiddleware, context=db.context)
+
+    @app.post("/notes")
+    async def create(fail: bool = False):
+        db.context().add(NoteEntity(text="note"))
+        await run_queries(db.context, 2)
+        if fail:
+            raise HTTPException(400, "rejected")
+        return {"ok": True}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url="http://test") as client:
+        assert (await client.post("/notes")).status_code == 200
+        assert (await client.post("/notes", params={"fail": True})).status_code == 400
+
+    assert db.checkouts == 2
+    assert await db.count() == 1
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: five queries per request
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+async def test_unit_of_work_throughput(db: Database):
+    N = 100
+
+    async def measure(shared: bool) -> float:
+        started = time.perf_counter()
+        for _ in range(N):
+            if shared:
+                async with db.context.unit_of_work():
+                    await run_queries(db.context)
+            else:
+                await run_queries(db.context)
+        return N / (time.perf_counter() - started)
+
+    per_query = await measure(False)
+    checkouts = db.checkouts
+    shared = await measure(True)
+
+    print(f"\nRequests/sec with 5 queries: session per query {per_query:,.0f}, unit of work {shared:,.0f}")
+    assert checkouts == N * 5
+    assert db.checkouts - checkouts == N
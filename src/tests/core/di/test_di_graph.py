@@ -0,0 +1,177 @@
+"""
+Coverage for ahead-of-time DI graph validation and eager instantiation
+(`ascender.core.di.utils.graph`, `ascender.core.di.eager.DependencyGraph`).
+
+Missing providers are reported together, cycles are reported with their path,
+providers are constructed in dependency order across the injector tree and
+async factories of the same level are awaited concurrently.
+
+NOTE: deliberately *no* ``from __future__ import annotations``, see
+`test_di_resolution.py`.
+"""
+import asyncio
+import time
+
+import pytest
+
+from ascender.core.di.eager import DependencyGraph
+from ascender.core.di.injector import AscenderInjector
+from ascender.core.di.interface.consts import CyclicDependency, UnresolvedDependency
+from ascender.core.di.utils.graph import build_dependency_graph, find_cycle, topological_levels, topological_sort
+
+
+# --------------------------------------------------------------------------- #
+# Graph algorithms
+# --------------------------------------------------------------------------- #
+def test_topological_sort_orders_dependencies_first(capsys):
+    class A:
+        def __init__(self): ...
+
+    class B:
+        def __init__(self, a: A): ...
+
+    class C:
+        def __init__(self, a: A, b: B): ...
+
+    order = topological_sort(build_dependency_graph([C, B, A]))
+
+    assert order.index(A) < order.index(B) < order.index(C)
+    assert capsys.readouterr().out == ""
+
+
+def test_topological_levels_group_independent_nodes():
+    graph = {"config": ["db", "cache"], "db": ["repo"], "cache": ["repo"], "repo": []}
+
+    assert topological_levels(graph) == [["config"], ["db", "cache"], ["repo"]]
+
+
+def test_cycle_is_reported_with_path():
+    graph = {"a": ["b"], "b": ["c"], "c": ["a"], "d": ["a"]}
+
+    with pytest.raises(CyclicDependency, match="a -> b -> c -> a|b -> c -> a -> b|c -> a -> b -> c"):
+        topological_sort(graph)
+
+    assert find_cycle(graph, {"a", "b", "c"})[0] == find_cycle(graph, {"a", "b", "c"})[-1]
+
+
+# --------------------------------------------------------------------------- #
+# DependencyGraph
+# --------------------------------------------------------------------------- #
+def test_missing_providers_are_reported_together():
+    class Missing:
+        def __init__(self): ...
+
+    class First:
+        def __init__(self, missing: Missing): ...
+
+    injector = AscenderInjector([
+        First,
+        {"provide": "second", "use_factory": lambda value: value, "deps": ["UNKNOWN"]},
+    ])
+
+    with pytest.raises(UnresolvedDependency) as error:
+        DependencyGraph(injector).validate()
+
+    assert "First depends on Missing" in str(error.value)
+    assert "second depends on UNKNOWN" in str(error.value)
+
+
+def test_cyclic_providers_fail_before_instantiation():
+    constructed: list[str] = []
+
+    injector = AscenderInjector([
+        {"provide": "a", "use_factory": lambda b: constructed.append("a"), "deps": ["b"]},
+        {"provide": "b", "use_factory": lambda a: constructed.append("b"), "deps": ["a"]},
+    ])
+
+    with pytest.raises(CyclicDependency, match="a -> b -> a|b -> a -> b"):
+        DependencyGraph(injector).instantiate()
+
+    assert constructed == []
+
+
+def test_instantiates_module_tree_in_dependency_order():
+    constructed: list[str] = []
+
+    class Config:
+        def __init__(self):
+            constructed.append("config")
+
+    class Repository:
+        def __init__(self, config: Config):
+            constructed.append("repository")
+
+    class Service:
+        def __init__(self, repository: Repository):
+            constructed.append("service")
+
+    root = AscenderInjector([Config])
+    AscenderInjector([Service, Repository], parent=root)
+
+    report = DependencyGraph(root).instantiate()
+
+    assert constructed == ["config", "repository", "service"]
+    assert [timing.token for timing in report.timings] == [Config, Repository, Service]
+    assert "Instantiated 3 providers" in report.format()
+
+
+async def test_async_factories_are_gathered_per_level():
+    async def database() -> str:
+        await asyncio.sleep(0.1)
+        return "database"
+
+    async def broker() -> str:
+        await asyncio.sleep(0.1)
+        return "broker"
+
+    injector = AscenderInjector([
+        {"provide": "database", "use_factory": database},
+        {"provide": "broker", "use_factory": broker},
+        {"provide": "service", "use_factory": lambda database, broker: (database, broker), "deps": ["database", "broker"]},
+    ])
+    graph = DependencyGraph(injector)
+
+    # Service depends on async providers, so it's deferred together with them
+    assert graph.instantiate().timings == []
+
+    started = time.perf_counter()
+    report = await graph.instantiate_async()
+
+    assert time.perf_counter() - started < 0.19
+    assert injector.get("service") == ("database", "broker")
+    assert {timing.token for timing in report.timings} == {"database", "broker", "service"}
+
+
+async def test_async_factory_provider_is_deferred():
+    async def create_pool() -> dict:
+        return {"connected": True}
+
+    injector = AscenderInjector([{"provide": "pool", "use_factory": create_pool}])
+    graph = DependencyGraph(injector)
+
+    assert graph.instantiate().timings == []
+    assert graph.has_async
+
+    await graph.instantiate_async()
+    assert injector.get("pool") == {"connected": True}
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: graph sort
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+def test_topological_sort_scales_linearly():
+    def chain(size: int) -> dict[int, list[int]]:
+        return {node: [node + 1] if node + 1 < size else [] for node in range(size)}
+
+    def measure(size: int) -> float:
+        graph = chain(size)
+        started = time.perf_counter()
+        topological_sort(graph)
+        return size / (time.perf_counter() - started)
+
+    small_rate, large_rate = measure(1_000), measure(100_000)
+
+    print(f"\nDI graph sort: 1k nodes {small_rate:,.0f} nodes/s, 100k nodes {large_rate:,.0f} nodes/s")
+    # Per-node cost must not grow with the size of the graph
+    assert large_rate > small_rate / 5
@@ -309,3 +309,130 @@ def test_deep_chain_resolves_each_node_once():
     assert root == N - 1
     # linear, not quadratic / repeated: each factory fired exactly once
     assert calls["n"] == N
+
+
+# --------------------------------------------------------------------------- #
+# Resolution cache
+# --------------------------------------------------------------------------- #
+def test_resolution_cache_skips_lookup_for_ancestor_singletons(monkeypatch):
+    class Shared:
+        def __init__(self):
+            ...
+
+    parent = AscenderInjector([Shared])
+    child = AscenderInjector([], parent=AscenderInjector([], parent=parent))
+
+    first = child.get(Shared)
+    assert first is parent.get(Shared)
+
+    def fail(*_, **__):
+        raise AssertionError("records looked up for a cached singleton")
+
+    monkeypatch.setattr(AscenderInjector, "get_factory_def", fail)
+    assert child.get(Shared) is first
+
+
+def test_resolution_cache_respects_lookup_options():
+    class Shared:
+        def __init__(self):
+            ...
+
+    parent = AscenderInjector([Shared])
+    child = AscenderInjector([], parent=parent)
+    child.get(Shared)
+
+    with pytest.raises(NoneInjectorException):
+        child.get(Shared, options={"only_self": True})
+
+
+def test_invalidate_propagates_to_descendants():
+    from ascender.core.di.interface.record import ProviderRecord
+
+    class Shared:
+        def __init__(self):
+            ...
+
+    parent = AscenderInjector([Shared])
+    child = AscenderInjector([], parent=parent)
+    assert child.get(Shared) is parent.get(Shared)
+
+    # e.g. a module import registering a record after the injector was created
+    local = Shared()
+    child.dependencies[Shared] = {ProviderRecord(local)}
+    parent.invalidate()
+
+    assert child.get(Shared) is local
+
+
+def test_multi_provider_cache_returns_fresh_list():
+    injector = AscenderInjector(
+        [
+            {"provide": "MIDDLEWARE", "use_factory": lambda: "a", "multi": True},
+            {"provide": "MIDDLEWARE", "use_factory": lambda: "b", "multi": True},
+        ]
+    )
+
+    first = injector.get("MIDDLEWARE")
+    first.append("mutated")
+
+    assert sorted(injector.get("MIDDLEWARE")) == ["a", "b"]
+
+
+def test_test_injector_override_invalidates_cache():
+    from ascender.core.di.test_injector import TestInjector
+
+    class Service:
+        def __init__(self):
+            ...
+
+    injector = TestInjector([Service])
+    real = injector.get(Service)
+    fake = Service()
+
+    with injector.mock([{"provide": Service, "value": fake}]):
+        assert injector.get(Service) is fake
+        assert injector.get(Service) is fake
+
+    assert real is not fake
+
+
+def test_test_injector_consecutive_mocks():
+    from ascender.core.di.test_injector import TestInjector
+
+    injector = TestInjector([{"provide": "A", "value": 100}])
+    values = []
+
+    for i in range(1, 6):
+        with injector.mock([{"provide": "A", "value": 100 + i}]):
+            values.append(injector.get("A"))
+
+    assert values == [101, 102, 103, 104, 105]
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: inject() throughput by module depth
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+def test_resolution_throughput_by_depth():
+    import time
+
+    class Shared:
+        def __init__(self):
+            ...
+
+    N = 20_000
+    rates: dict[int, float] = {}
+    for depth in range(1, 11):
+        injector = AscenderInjector([Shared])
+        for _ in range(depth - 1):
+            injector = AscenderInjector([], parent=injector)
+
+        injector.get(Shared)
+        started = time.perf_counter()
+        for _ in range(N):
+            injector.get(Shared)
+        rates[depth] = N / (time.perf_counter() - started)
+
+    print("\ninject() by depth: " + ", ".join(f"{depth}: {rate:,.0f}/s" for depth, rate in rates.items()))
+    # cached resolution doesn't walk the parent chain
+    assert rates[10] > rates[1] / 2
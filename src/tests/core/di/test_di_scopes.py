@@ -0,0 +1,249 @@
+"""
+Coverage for `request` and `transient` scoped providers (`ascender.core.di.scope`,
+`RequestScopeMiddleware`).
+
+Request scoped values are created once per request scope, shared within it and
+disposed when it ends. Transient ones are created on every injection. Neither
+is cached by the injector.
+
+NOTE: deliberately *no* ``from __future__ import annotations``, see
+`test_di_resolution.py`.
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from ascender.core.di.eager import DependencyGraph
+from ascender.core.di.injector import AscenderInjector
+from ascender.core.di.interface.consts import CyclicDependency
+from ascender.core.di.middleware import RequestScopeMiddleware
+from ascender.core.di.scope import RequestScope, request_scope
+from ascender.core.errors.scope_error import AscenderScopeError
+
+
+class Config:
+    def __init__(self):
+        self.tenant = "acme"
+
+
+class TenantContext:
+    def __init__(self, config: Config):
+        self.tenant = config.tenant
+
+
+class RequestLogger:
+    def __init__(self, context: TenantContext):
+        self.context = context
+        self.closed = False
+
+
+def create_injector(dispose=None) -> AscenderInjector:
+    return AscenderInjector([
+        Config,
+        {"provide": TenantContext, "use_class": TenantContext, "scope": "request"},
+        {"provide": RequestLogger, "use_factory": RequestLogger, "deps": [TenantContext], "scope": "transient", "dispose": dispose},
+    ])
+
+
+# --------------------------------------------------------------------------- #
+# Scopes
+# --------------------------------------------------------------------------- #
+async def test_request_scoped_value_is_shared_within_scope():
+    injector = create_injector()
+
+    async with request_scope():
+        first = injector.get(TenantContext)
+        assert injector.get(TenantContext) is first
+
+    async with request_scope():
+        assert injector.get(TenantContext) is not first
+
+    assert first.tenant == "acme"
+
+
+async def test_request_scoped_value_outside_scope():
+    injector = create_injector()
+
+    with pytest.raises(AscenderScopeError):
+        injector.get(TenantContext)
+
+
+async def test_transient_value_is_created_on_every_injection():
+    injector = create_injector()
+
+    async with request_scope():
+        first, second = injector.get(RequestLogger), injector.get(RequestLogger)
+
+    assert first is not second
+    assert first.context is second.context
+    assert injector.get(Config) is injector.get(Config)
+
+
+async def test_dispose_hooks():
+    disposed = []
+
+    async def close(logger: RequestLogger):
+        await asyncio.sleep(0)
+        disposed.append(logger)
+
+    injector = create_injector(dispose=close)
+
+    async with request_scope() as scope:
+        logger = injector.get(RequestLogger)
+        scope.on_dispose(lambda: disposed.append("first"))
+        assert disposed == []
+
+    assert disposed == ["first", logger]
+    assert scope.instances == {}
+
+
+async def test_transient_with_dispose_outside_scope():
+    disposed = []
+    injector = create_injector(dispose=disposed.append)
+
+    async with request_scope():
+        context = injector.get(TenantContext)
+
+    # Value created outside of a scope would never be disposed
+    with pytest.raises(AscenderScopeError):
+        injector.get(RequestLogger)
+
+    transient = AscenderInjector([{"provide": "counter", "use_factory": lambda: object(), "scope": "transient"}])
+    assert transient.get("counter") is not transient.get("counter")
+    assert context.tenant == "acme" and disposed == []
+
+
+async def test_dispose_runs_every_hook():
+    calls = []
+
+    def failing():
+        raise RuntimeError("cleanup failed")
+
+    with pytest.raises(RuntimeError, match="cleanup failed"):
+        async with request_scope() as scope:
+            scope.on_dispose(lambda: calls.append("first"))
+            scope.on_dispose(failing)
+
+    assert calls == ["first"]
+
+
+async def test_nested_scope_joins_outer():
+    injector = create_injector()
+
+    async with request_scope() as outer:
+        async with request_scope() as inner:
+            assert inner is outer
+            value = injector.get(TenantContext)
+
+        assert injector.get(TenantContext) is value
+        assert RequestScope.current() is outer
+
+    assert RequestScope.current() is None
+
+
+async def test_concurrent_scopes_are_isolated():
+    injector = create_injector()
+
+    async def handle() -> TenantContext:
+        async with request_scope():
+            value = injector.get(TenantContext)
+            await asyncio.sleep(0)
+            assert injector.get(TenantContext) is value
+            return value
+
+    values = await asyncio.gather(*(handle() for _ in range(10)))
+
+    assert len({id(value) for value in values}) == 10
+
+
+async def test_multi_provider_with_scoped_value():
+    injector = AscenderInjector([
+        {"provide": "handlers", "value": "static", "multi": True},
+        {"provide": "handlers", "use_factory": lambda: object(), "multi": True, "scope": "request"},
+    ])
+
+    async with request_scope():
+        first = injector.get("handlers")
+        assert injector.get("handlers") == first
+
+    async with request_scope():
+        assert injector.get("handlers") != first
+
+
+async def test_request_scoped_cycle():
+    injector = AscenderInjector([{"provide": "a", "use_factory": lambda a: a, "deps": ["a"], "scope": "request"}])
+
+    async with request_scope():
+        with pytest.raises(CyclicDependency):
+            injector.get("a")
+
+
+def test_unknown_scope():
+    with pytest.raises(ValueError):
+        AscenderInjector([{"provide": TenantContext, "use_class": TenantContext, "scope": "session"}])
+
+
+def test_eager_instantiation_skips_scoped_providers():
+    injector = create_injector()
+
+    report = DependencyGraph(injector).instantiate()
+
+    assert [timing.token for timing in report.timings] == [Config]
+
+
+# --------------------------------------------------------------------------- #
+# HTTP
+# --------------------------------------------------------------------------- #
+async def test_request_scope_middleware():
+    disposed = []
+    injector = create_injector(dispose=lambda logger: disposed.append(logger))
+    app = FastAPI()
+    app.add_middleware(RequestScopeMiddleware)
+
+    @app.get("/async")
+    async def async_endpoint():
+        return {"id": id(injector.get(TenantContext)), "same": injector.get(RequestLogger).context is injector.get(TenantContext)}
+
+    @app.get("/sync")
+    def sync_endpoint():
+        return {"id": id(injector.get(TenantContext)), "same": injector.get(RequestLogger).context is injector.get(TenantContext)}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url="http://test") as client:
+        responses = [(await client.get(path)).json() for path in ("/async", "/sync")]
+
+    assert all(response["same"] for response in responses)
+    assert len(disposed) == 2
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: request scope overhead
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+async def test_request_scope_resolution_cost():
+    N = 20_000
+    injector = create_injector()
+    injector.get(Config)
+
+    async def measure(resolve: bool) -> float:
+        best = float("inf")
+        for _ in range(3):
+            started = time.perf_counter()
+            for _ in range(N):
+                async with request_scope():
+                    if resolve:
+                        injector.get(TenantContext)
+                        injector.get(TenantContext)
+                        injector.get(RequestLogger)
+            best = min(best, (time.perf_counter() - started) / N * 1_000_000)
+        return best
+
+    scope_only = await measure(False)
+    # Creates the request scoped value, returns it again and creates one transient value
+    per_resolution = (await measure(True) - scope_only) / 3
+
+    print(f"\nRequest scope: enter + exit {scope_only:.2f} µs, {per_resolution:.2f} µs per resolution")
+    assert scope_only < 10
+    assert per_resolution < 10
@@ -0,0 +1,183 @@
+"""
+Coverage for asynchronous logging (`ascender.core.logger.async_handler.AsyncQueueHandler`
+and `LoggingConfig.async_`).
+
+Records are written by a background thread through a bounded queue; when it's
+full, records are dropped according to the drop policy and counted, and
+stopping the handler writes everything still queued.
+"""
+import io
+import logging
+import sys
+import threading
+import time
+
+import pytest
+from rich.console import Console
+from rich.logging import RichHandler
+
+from ascender.core._config.interface.runtime import LoggingConfig
+from ascender.core.logger._logger import configure_logger
+from ascender.core.logger.async_handler import AsyncQueueHandler
+from ascender.core.logger.formatter import AscenderFormatter
+
+
+class Recorder(logging.Handler):
+    """Collects messages and the threads they were written from, can be paused."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages: list[str] = []
+        self.threads: set[str] = set()
+        self.entered = threading.Event()
+        self.resume = threading.Event()
+        self.resume.set()
+
+    def emit(self, record: logging.LogRecord):
+        self.entered.set()
+        self.resume.wait(5)
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+
+def make_record(message: str, *args) -> logging.LogRecord:
+    return logging.LogRecord("Ascender Framework", logging.INFO, __file__, 1, message, args, None)
+
+
+@pytest.fixture
+def recorder() -> Recorder:
+    return Recorder()
+
+
+def fill(handler: AsyncQueueHandler, recorder: Recorder, count: int):
+    """Blocks the writer on the first record, then emits `count` more."""
+    recorder.resume.clear()
+    handler.handle(make_record("first"))
+    assert recorder.entered.wait(5)
+
+    for n in range(count):
+        handler.handle(make_record("record %d", n))
+
+
+# --------------------------------------------------------------------------- #
+# Handler
+# --------------------------------------------------------------------------- #
+def test_records_are_written_in_background(recorder: Recorder):
+    handler = AsyncQueueHandler([recorder])
+    handler.start()
+    for n in range(100):
+        handler.handle(make_record("record %d", n))
+    handler.stop()
+
+    assert recorder.messages == [f"record {n}" for n in range(100)]
+    assert threading.current_thread().name not in recorder.threads
+
+
+def test_written_synchronously_while_stopped(recorder: Recorder):
+    handler = AsyncQueueHandler([recorder])
+    handler.handle(make_record("before"))
+    handler.start()
+    handler.stop()
+    handler.handle(make_record("after"))
+
+    assert recorder.messages == ["before", "after"]
+    assert recorder.threads == {threading.current_thread().name}
+
+
+def test_drop_new(recorder: Recorder):
+    handler = AsyncQueueHandler([recorder], max_size=2, drop_policy="drop_new")
+    handler.start()
+    fill(handler, recorder, 5)
+    recorder.resume.set()
+    handler.stop()
+
+    assert handler.dropped == 3
+    assert recorder.messages == [
+        "first", "record 0", "record 1", "3 log records were dropped because the logging queue was full",
+    ]
+
+
+def test_drop_oldest(recorder: Recorder):
+    handler = AsyncQueueHandler([recorder], max_size=2, drop_policy="drop_oldest")
+    handler.start()
+    fill(handler, recorder, 5)
+    recorder.resume.set()
+    handler.stop()
+
+    assert handler.dropped == 3
+    assert recorder.messages[:3] == ["first", "record 3", "record 4"]
+
+
+def test_block(recorder: Recorder):
+    handler = AsyncQueueHandler([recorder], max_size=2, drop_policy="block")
+    handler.start()
+    threading.Timer(0.05, recorder.resume.set).start()
+    fill(handler, recorder, 5)
+    handler.stop()
+
+    assert handler.dropped == 0
+    assert recorder.messages == ["first"] + [f"record {n}" for n in range(5)]
+
+
+def test_exception_info_is_kept(recorder: Recorder):
+    handler = AsyncQueueHandler([recorder])
+    handler.start()
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("Ascender Framework", logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+    handler.handle(record)
+    handler.stop()
+
+    assert logging.Formatter().format(record).endswith("ValueError: boom")
+
+
+# --------------------------------------------------------------------------- #
+# Configuration
+# --------------------------------------------------------------------------- #
+def test_configure_async_logger(monkeypatch: pytest.MonkeyPatch):
+    logger = logging.getLogger("Ascender Framework")
+    monkeypatch.setattr(logger, "handlers", [])
+    monkeypatch.setattr(logger, "level", logger.level)
+
+    config = LoggingConfig.model_validate({"async": True, "console_format": "json", "queue": {"max_size": 5, "drop_policy": "drop_oldest"}})
+    configure_logger(config)
+
+    (handler,) = logger.handlers
+    assert isinstance(handler, AsyncQueueHandler)
+    assert handler.running and handler.queue.maxsize == 5 and handler.drop_policy == "drop_oldest"
+    assert isinstance(handler.handlers[0], logging.StreamHandler)
+    handler.close()
+    assert not handler.running
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: logging call cost on the calling thread
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+def test_async_logging_unblocks_caller():
+    N = 300
+
+    def rich_handler() -> logging.Handler:
+        handler = RichHandler(console=Console(file=io.StringIO(), width=120), markup=True)
+        handler.setFormatter(AscenderFormatter())
+        return handler
+
+    def measure(handler: logging.Handler) -> float:
+        logger = logging.Logger("benchmark")
+        logger.addHandler(handler)
+
+        started = time.perf_counter()
+        for n in range(N):
+            logger.info("Request %d handled", n)
+        return N / (time.perf_counter() - started)
+
+    sync_rate = measure(rich_handler())
+
+    queue_handler = AsyncQueueHandler([rich_handler()], max_size=N)
+    queue_handler.start()
+    async_rate = measure(queue_handler)
+    queue_handler.stop()
+
+    print(f"\nLogging calls/sec on caller thread: sync {sync_rate:,.0f}, async {async_rate:,.0f}")
+    assert async_rate > sync_rate
@@ -0,0 +1,132 @@
+"""
+Coverage for log formatters (`ascender.core.logger.formatter`).
+
+Formatters precompute everything that doesn't change between records: level
+markup, formatted timestamp of the current second and the set of reserved
+record attributes. The JSON formatter encodes with orjson when available.
+"""
+import json
+import logging
+import time
+from datetime import datetime, timezone
+
+import pytest
+from rich.console import Console
+
+from ascender.core.logger import formatter
+from ascender.core.logger.formatter import AscenderFormatter, JsonAscenderFormatter
+
+
+def make_record(msg: str = "Request %s handled", *args, level: int = logging.INFO, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("Ascender Framework", level, __file__, 1, msg, args or ("GET /items",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+# --------------------------------------------------------------------------- #
+# Output
+# --------------------------------------------------------------------------- #
+def test_markup_format():
+    record = make_record(level=logging.WARNING)
+    timestamp = time.strftime("%H:%M:%S", time.localtime(record.created))
+
+    assert AscenderFormatter().format(record) == (
+        f"[dim]{timestamp}[/dim] ┆ [yellow]WARNING[/yellow] ┆ [magenta]Ascender Framework[/magenta] ┆ Request GET /items handled"
+    )
+
+
+def test_markup_timestamp_follows_records():
+    fmt = AscenderFormatter()
+    first, second = make_record(), make_record()
+    second.created = first.created + 3600
+
+    assert fmt.format(first) != fmt.format(second)
+    assert fmt.format(first).startswith(f"[dim]{time.strftime('%H:%M:%S', time.localtime(first.created))}")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_format(use_orjson: bool):
+    class Opaque:
+        def __str__(self):
+            return "opaque"
+
+    record = make_record(request_id="r-1", user={"id": 7}, handler=Opaque())
+
+    log = json.loads(JsonAscenderFormatter("api", use_orjson=use_orjson).format(record))
+
+    ts = datetime.strptime(log.pop("ts"), "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+    assert ts.timestamp() == pytest.approx(record.created, abs=1e-5)
+    assert log == {
+        "severity": "INFO",
+        "service": "api",
+        "message": "Request GET /items handled",
+        "request_id": "r-1",
+        "user": {"id": 7},
+        "handler": "opaque",
+    }
+
+
+def test_orjson_required_when_forced(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(formatter, "orjson", None)
+
+    with pytest.raises(ImportError):
+        JsonAscenderFormatter(use_orjson=True)
+
+    assert not JsonAscenderFormatter().use_orjson
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: records/sec per formatter
+# --------------------------------------------------------------------------- #
+class LegacyAscenderFormatter(logging.Formatter):
+    """Formatter as it was before: console and markup built for every record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        Console()
+        level_markup = {"INFO": "[green]INFO[/green]"}
+        timestamp = self.formatTime(record, "%H:%M:%S")
+        return f"[dim]{timestamp}[/dim] ┆ {level_markup.get(record.levelname)} ┆ [magenta]{record.name}[/magenta] ┆ {record.getMessage()}"
+
+
+class LegacyJsonAscenderFormatter(logging.Formatter):
+    """JSON formatter as it was before: reserved attributes computed for every record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_obj = {
+            "ts": datetime.fromtimestamp(record.created).isoformat() + "Z",
+            "severity": record.levelname,
+            "service": record.name,
+            "message": record.getMessage(),
+        }
+        reserved = set(vars(logging.LogRecord("", 0, "", 0, "", (), None)))
+        for key, value in record.__dict__.items():
+            if key not in reserved and key not in log_obj:
+                log_obj[key] = value
+
+        return json.dumps(log_obj)
+
+
+@pytest.mark.perf
+def test_formatter_throughput():
+    records = [make_record(request_id=f"r-{n}", status=200) for n in range(2_000)]
+
+    def rate(fmt: logging.Formatter) -> float:
+        best = float("inf")
+        for _ in range(3):
+            started = time.perf_counter()
+            for record in records:
+                fmt.format(record)
+            best = min(best, time.perf_counter() - started)
+        return len(records) / best
+
+    rates = {
+        "markup (legacy)": rate(LegacyAscenderFormatter()),
+        "markup": rate(AscenderFormatter()),
+        "json (legacy)": rate(LegacyJsonAscenderFormatter()),
+        "json (stdlib)": rate(JsonAscenderFormatter(use_orjson=False)),
+        "json (orjson)": rate(JsonAscenderFormatter()),
+    }
+
+    print("\nLog records/sec: " + ", ".join(f"{name} {value:,.0f}" for name, value in rates.items()))
+    assert rates["markup"] > rates["markup (legacy)"]
+    assert rates["json (stdlib)"] > rates["json (legacy)"]
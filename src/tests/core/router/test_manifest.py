@@ -0,0 +1,168 @@
+"""
+Coverage for the flattened route table (`ascender.core.router.manifest.RouteManifest`,
+`RouterGraph.create_router_graph`).
+
+Routes of the router graph are mounted straight onto the application router
+with paths, tags and schema flags merged the same way nested `APIRouter`s do,
+so FastAPI builds every route once instead of once per nesting level.
+"""
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from ascender.core import Controller, Get, Post
+from ascender.core.applications.root_injector import RootInjector
+from ascender.core.router.graph import RouterGraph
+from ascender.core.router.manifest import RouteManifest
+from ascender.core.router.router import RouterNode
+from ascender.guards.guard import Guard
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class Host:
+    """Stands in for `Application`, `create_router_graph` only needs its `app`."""
+
+    def __init__(self) -> None:
+        self.app = FastAPI()
+
+
+class DenyGuard(Guard):
+    def can_activate(self):
+        raise HTTPException(403, "denied")
+
+
+def make_controller(index: int, routes: int = 5) -> type:
+    namespace = {}
+    for n in range(routes):
+        async def get(self, item_id: int) -> Item:
+            return Item(id=item_id, name="item")
+
+        async def post(self, item: Item) -> Item:
+            return item
+
+        namespace[f"get_{n}"] = Get(f"/r{n}/{{item_id}}")(get)
+        namespace[f"post_{n}"] = Post(f"/r{n}")(post)
+
+    namespace["__init__"] = lambda self: None
+    return Controller(standalone=True)(type(f"Items{index}Controller", (), namespace))
+
+
+def make_graph(controllers: list[type]) -> list:
+    root, *children = controllers
+    return [{
+        "path": "/api",
+        "tags": ["api"],
+        "include_in_schema": True,
+        "controller": root,
+        "children": [
+            {"path": "/hidden", "controller": children[0], "children": [
+                {"path": f"/c{n}", "controller": c, "include_in_schema": True, "deprecated": n % 2 == 0, "tags": [f"c{n}"]}
+                for n, c in enumerate(children[1:], 1)
+            ]},
+        ],
+    }]
+
+
+def route_table(app: FastAPI) -> list[tuple]:
+    return [
+        (route.path, sorted(route.methods), route.tags, route.include_in_schema, bool(route.deprecated), len(route.dependencies))
+        for route in app.routes if isinstance(route, APIRoute)
+    ]
+
+
+def nested_boot(graph: list) -> FastAPI:
+    app = FastAPI()
+    for route in graph:
+        app.include_router(RouterNode(route, RootInjector().existing_injector).router)
+    return app
+
+
+def manifest_boot(graph: list) -> FastAPI:
+    host = Host()
+    RouterGraph(RootInjector().existing_injector, graph).create_router_graph(host)  # type: ignore[arg-type]
+    return host.app
+
+
+# --------------------------------------------------------------------------- #
+# Route table
+# --------------------------------------------------------------------------- #
+def test_matches_nested_routers():
+    graph = make_graph([make_controller(n, routes=2) for n in range(4)])
+
+    table = route_table(manifest_boot(graph))
+
+    assert table == route_table(nested_boot(graph))
+    assert table[0] == ("/api/hidden/c1/r0/{item_id}", ["GET"], ["api", "c1"], False, False, 0)
+    assert ("/api/hidden/c2/r1", ["POST"], ["api", "c2"], False, True, 0) in table
+
+
+def test_empty_path_becomes_root():
+    class RootController:
+        def __init__(self): ...
+
+        @Get()
+        async def index(self):
+            return {"ok": True}
+
+    controller = Controller(standalone=True)(RootController)
+    graph = [{"path": "/", "controller": controller, "include_in_schema": True}]
+
+    assert route_table(manifest_boot(graph)) == route_table(nested_boot(graph)) == [("/", ["GET"], [], True, False, 0)]
+
+
+def test_guards_do_not_accumulate():
+    controller = make_controller(0, routes=1)
+    graph = [{"path": f"/v{n}", "controller": controller, "guards": [DenyGuard()]} for n in range(3)]
+
+    assert [dependencies for *_, dependencies in route_table(manifest_boot(graph))] == [1] * 6
+
+
+async def test_routes_serve_requests():
+    graph = [{"path": "/items", "controller": make_controller(0, routes=1)}, {"path": "/private", "controller": make_controller(1, routes=1), "guards": [DenyGuard()]}]
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(manifest_boot(graph)), base_url="http://test") as client:
+        assert (await client.get("/items/r0/7")).json() == {"id": 7, "name": "item"}
+        assert (await client.post("/items/r0", json={"id": 1, "name": "new"})).json() == {"id": 1, "name": "new"}
+        assert (await client.get("/private/r0/7")).status_code == 403
+
+
+def test_manifest_is_cached():
+    host = Host()
+    graph = RouterGraph(RootInjector().existing_injector, [{"path": "/items", "controller": make_controller(0, routes=1)}])
+
+    graph.create_router_graph(host)  # type: ignore[arg-type]
+    manifest = graph.manifest
+    graph.create_router_graph(Host())  # type: ignore[arg-type]
+
+    assert isinstance(manifest, RouteManifest)
+    assert graph.manifest is manifest
+    assert len(graph.graph_nodes) == 1
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: boot with 500 routes
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+def test_boot_time_500_routes():
+    # 50 controllers with 10 routes each, three nesting levels deep
+    graph = make_graph([make_controller(n) for n in range(50)])
+
+    started = time.perf_counter()
+    nested = nested_boot(graph)
+    nested_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    flattened = manifest_boot(graph)
+    manifest_time = time.perf_counter() - started
+
+    print(f"\nBoot with {len(route_table(flattened))} routes: nested routers {nested_time:.2f}s, manifest {manifest_time:.2f}s")
+    assert route_table(flattened) == route_table(nested)
+    assert manifest_time * 2 < nested_time
@@ -0,0 +1,104 @@
+"""
+Coverage for lazy public namespaces (`ascender`, `ascender.core`, `ascender.common`,
+`ascender.contrib`, see `ascender._lazy`).
+
+Public names are imported on first access, so code using only DI and
+controllers doesn't load SQLAlchemy or the CLI engine. Imports run in a fresh
+interpreter, the test process has everything loaded already.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import ascender
+
+# Interpreters are started next to the package, so it's importable without installation
+ROOT = Path(ascender.__file__).parent.parent
+HEAVY_MODULES = ["sqlalchemy", "rich", "rich_argparse", "tortoise"]
+
+
+def run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT).stdout
+
+
+def loaded_heavy_modules(statement: str) -> list[str]:
+    return json.loads(run(f"import sys, json\n{statement}\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"))
+
+
+def import_time(statement: str, repeat: int = 3) -> float:
+    """Seconds spent importing modules for `statement` (best of `repeat` fresh interpreters), without interpreter startup."""
+    return measure_imports(statement, repeat) - measure_imports("pass", repeat)
+
+
+def measure_imports(statement: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True, cwd=ROOT
+        ).stderr
+
+        total = 0
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+
+            _, cumulative, name = line.split("|")
+            # Only top-level imports, nested ones are included in their cumulative time
+            if not name[1:].startswith(" "):
+                total += int(cumulative)
+
+        best = min(best, total / 1_000_000)
+
+    return best
+
+
+# --------------------------------------------------------------------------- #
+# Lazy namespaces
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize("statement", [
+    "import ascender",
+    "from ascender.core import inject, Controller, Injector, AscModule",
+    "from ascender.common import Injectable, BaseDTO",
+])
+def test_heavy_dependencies_are_not_loaded(statement: str):
+    assert loaded_heavy_modules(statement) == []
+
+
+def test_names_resolve_on_access():
+    assert "sqlalchemy" in loaded_heavy_modules("from ascender.core import AppDBContext")
+
+    output = run(
+        "import ascender\n"
+        "from ascender import *\n"
+        "from ascender.core.cli_engine import CLIEngine as Engine\n"
+        "print(ascender.core.CLIEngine is Engine, ascender.Service is ascender.contrib.Service, 'Application' in dir(ascender.core))"
+    )
+    assert output.split() == ["True", "True", "True"]
+
+
+def test_unknown_name():
+    import ascender.core
+
+    with pytest.raises(AttributeError):
+        ascender.core.Missing  # type: ignore[attr-defined]
+
+
+# --------------------------------------------------------------------------- #
+# Microbenchmark: cold start budget
+# --------------------------------------------------------------------------- #
+@pytest.mark.perf
+def test_import_time_budget():
+    package = import_time("import ascender")
+    controller = import_time("from ascender.core import inject, Controller")
+    # Controllers need FastAPI, budget is relative to it so it holds on slower machines
+    fastapi = import_time("import fastapi")
+
+    print(
+        f"\nImport time: ascender {package * 1000:.1f} ms, inject + Controller {controller * 1000:.0f} ms "
+        f"(fastapi alone {fastapi * 1000:.0f} ms)"
+    )
+    assert package < 0.1
+    assert controller < fastapi + 0.4